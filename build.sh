@@ -8,11 +8,15 @@ pip install -r requirements.txt
 # Convert static asset files
 python manage.py collectstatic --no-input
 
+# Fail the deploy on template syntax errors. Nothing is written: each process
+# inlines the hot includes again when its template loader first compiles them
+python manage.py compile_templates
+
 # Apply any outstanding database migrations
 python manage.py migrate
 
-# Populate db with entries
-python manage.py loaddata task_manager_db_data.json
+# Populate db with entries, skipping the ones loaded by a previous deploy
+python manage.py fastload task_manager_db_data.json
 
 # Actualize db data
 python manage.py update_tasks
\ No newline at end of file
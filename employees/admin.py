@@ -1,9 +1,15 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 
-from employees.models import Employee, Position, Team
+from employees.models import Employee, Position, QueuedEmail, Team
 
 
 admin.site.register(Employee, UserAdmin)
 admin.site.register(Position)
 admin.site.register(Team)
+
+
+@admin.register(QueuedEmail)
+class QueuedEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "status", "attempts", "next_attempt_at", "sent_at")
+    list_filter = ("status",)
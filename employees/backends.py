@@ -1,15 +1,112 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import router, transaction
+from django.db.models.functions import Lower
+
+from employees.models import Position
+
+# What authentication, permission checks and templates read from request.user.
+# The password is only loaded for the session auth hash, which is cached instead
+SESSION_USER_FIELDS = (
+    "password",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "slug",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "position__name",
+)
+
+
+def users_by_email(email):
+    # Matches the employee_email_ci_unique index, including its condition
+    return (
+        get_user_model()
+        .objects.exclude(email="")
+        .alias(email_lower=Lower("email"))
+        .filter(email_lower=email.lower())
+    )
+
+
+def session_user_key(user_id):
+    return f"session-user:{user_id}"
+
+
+def invalidate_session_users(user_ids):
+    # Dropped again once the change has committed, as requests in the meantime
+    # could cache the old row again
+    keys = [session_user_key(user_id) for user_id in user_ids]
+    if keys:
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def session_user_data(user):
+    deferred = user.get_deferred_fields()
+    return {
+        "fields": {
+            field.attname: getattr(user, field.attname)
+            for field in user._meta.concrete_fields
+            if field.attname not in deferred and field.attname != "password"
+        },
+        "position_name": user.position.name,
+        "session_auth_hash": user.get_session_auth_hash(),
+    }
+
+
+def session_user_from_data(data):
+    UserModel = get_user_model()
+    db = router.db_for_read(UserModel)
+    fields = data["fields"]
+    # Fields are in concrete field order, the rest are deferred
+    user = UserModel.from_db(db, list(fields), list(fields.values()))
+    user.position = Position.from_db(
+        db, ["id", "name"], [fields["position_id"], data["position_name"]]
+    )
+    user.cached_session_auth_hash = data["session_auth_hash"]
+    return user
 
 
 class EmailBackend(ModelBackend):
     def authenticate(self, request, username=None, password=None, **kwargs):
         UserModel = get_user_model()
+        if not username:
+            return None
         try:
-            user = UserModel.objects.get(email=username)
+            user = users_by_email(username).get()
         except UserModel.DoesNotExist:
             return None
         else:
             if user.check_password(password):
                 return user
         return None
+
+    def get_user(self, user_id):
+        """
+        Loads the user of each authenticated request with only the columns
+        in SESSION_USER_FIELDS, from the cache when SESSION_USER_CACHE_TIMEOUT
+        is set. Cached users have no password, only its session auth hash.
+        """
+        timeout = settings.SESSION_USER_CACHE_TIMEOUT
+        key = session_user_key(user_id)
+        data = cache.get(key) if timeout else None
+        if data is not None:
+            user = session_user_from_data(data)
+        else:
+            user = (
+                get_user_model()
+                .objects.select_related("position")
+                .only(*SESSION_USER_FIELDS)
+                .filter(pk=user_id)
+                .first()
+            )
+            if user is None:
+                return None
+            if timeout:
+                cache.set(key, session_user_data(user), timeout)
+        return user if self.user_can_authenticate(user) else None
@@ -1,12 +1,23 @@
+import csv
+
 from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import (
     UserCreationForm,
     AuthenticationForm,
+    PasswordResetForm,
 )
-from django_select2.forms import Select2MultipleWidget
+from django.core.validators import validate_email
+from django.db.models.functions import Lower
+from django.template import loader
+from django.utils import timezone
+from django.utils.text import slugify
 
-from employees.models import Invitation, Team
+from employees.backends import users_by_email
+from employees.mail import queue_mail
+from employees.models import Invitation, Position, Team
+from employees.utils import unique_slugs
+from employees.widgets import EmployeeWidget
 
 
 class EmployeeInvitationForm(forms.ModelForm):
@@ -26,9 +37,113 @@ class EmployeeInvitationForm(forms.ModelForm):
         email = self.cleaned_data.get("email")
         if Invitation.objects.filter(email=email).exists():
             raise forms.ValidationError("An invitation with this email already exists.")
+        if users_by_email(email).exists():
+            raise forms.ValidationError("An employee with this email already exists.")
         return email
 
 
+class BulkInvitationForm(forms.Form):
+    emails = forms.CharField(
+        widget=forms.Textarea,
+        required=False,
+        help_text="One email per line, optionally followed by a comma and a position",
+    )
+    file = forms.FileField(required=False, help_text="CSV file in the same format")
+    position = forms.ModelChoiceField(
+        queryset=Position.objects.all(),
+        empty_label=None,
+        help_text="Used for emails without a position",
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["position"].initial = self.fields["position"].queryset.first()
+        self.invitations = []
+        self.already_invited = []
+
+    def _rows(self):
+        lines = (self.cleaned_data.get("emails") or "").splitlines()
+        upload = self.cleaned_data.get("file")
+        if upload:
+            try:
+                lines += upload.read().decode("utf-8-sig").splitlines()
+            except UnicodeDecodeError:
+                raise forms.ValidationError("The file must be a UTF-8 encoded CSV.")
+        for row in csv.reader(lines):
+            row = [value.strip() for value in row]
+            if any(row):
+                yield row
+
+    def clean(self):
+        cleaned_data = super().clean()
+        default_position = cleaned_data.get("position")
+        if default_position is None:
+            return cleaned_data
+
+        rows = list(self._rows())
+        if not rows:
+            raise forms.ValidationError("Enter at least one email address.")
+
+        position_names = {row[1] for row in rows if len(row) > 1 and row[1]}
+        positions = {
+            position.name: position
+            for position in Position.objects.filter(name__in=position_names)
+        }
+
+        errors = []
+        invitations = {}
+        for row in rows:
+            email = row[0]
+            position_name = row[1] if len(row) > 1 else ""
+            try:
+                validate_email(email)
+            except forms.ValidationError:
+                errors.append(f"{email} is not a valid email address.")
+                continue
+            if position_name and position_name not in positions:
+                errors.append(f"Position {position_name} does not exist.")
+                continue
+            invitations.setdefault(
+                email, positions.get(position_name, default_position)
+            )
+        # Case-insensitively, as the employee_email_ci_unique constraint
+        employee_emails = set(
+            get_user_model()
+            .objects.annotate(email_lower=Lower("email"))
+            .filter(email_lower__in={email.lower() for email in invitations})
+            .values_list("email_lower", flat=True)
+        )
+        for email in invitations:
+            if email.lower() in employee_emails:
+                errors.append(f"An employee with the email {email} already exists.")
+        if errors:
+            raise forms.ValidationError(errors)
+
+        self.already_invited = sorted(
+            Invitation.objects.filter(email__in=invitations).values_list(
+                "email", flat=True
+            )
+        )
+        for email in self.already_invited:
+            del invitations[email]
+        self.invitations = list(invitations.items())
+        return cleaned_data
+
+    def save(self, invited_by):
+        now = timezone.now()
+        invitations = [
+            Invitation(email=email, position=position, invited_by=invited_by)
+            for email, position in self.invitations
+        ]
+        slugs = unique_slugs(
+            Invitation,
+            [slugify(f"{invitation.position}-{now}") for invitation in invitations],
+        )
+        for invitation, slug in zip(invitations, slugs):
+            invitation.slug = slug
+        return Invitation.objects.bulk_create(invitations)
+
+
 class EmployeeCreationForm(UserCreationForm):
     class Meta(UserCreationForm.Meta):
         model = get_user_model()
@@ -63,7 +178,7 @@ class TeamForm(forms.ModelForm):
         fields = ["name", "members"]
         widgets = {
             "name": forms.TextInput(attrs={"placeholder": "Name"}),
-            "members": Select2MultipleWidget(),
+            "members": EmployeeWidget(),
         }
 
     def __init__(self, *args, **kwargs):
@@ -100,3 +215,22 @@ class TeamSearchForm(forms.Form):
         required=False,
         label="",
     )
+
+
+class EmployeePasswordResetForm(PasswordResetForm):
+    def send_mail(
+        self,
+        subject_template_name,
+        email_template_name,
+        context,
+        from_email,
+        to_email,
+        html_email_template_name=None,
+    ):
+        subject = loader.render_to_string(subject_template_name, context)
+        subject = "".join(subject.splitlines())
+        body = loader.render_to_string(email_template_name, context)
+        html_body = None
+        if html_email_template_name is not None:
+            html_body = loader.render_to_string(html_email_template_name, context)
+        queue_mail(subject, body, from_email, [to_email], html_message=html_body)
@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """Argon2 with the costs from the PASSWORD_ARGON2_* settings."""
+
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2_PARALLELISM
+
+
+class ScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    @property
+    def work_factor(self):
+        return settings.PASSWORD_SCRYPT_WORK_FACTOR
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """PBKDF2 with at most PASSWORD_PBKDF2_MAX_ITERATIONS iterations, if set."""
+
+    @property
+    def iterations(self):
+        iterations = hashers.PBKDF2PasswordHasher.iterations
+        if settings.PASSWORD_PBKDF2_MAX_ITERATIONS:
+            return min(iterations, settings.PASSWORD_PBKDF2_MAX_ITERATIONS)
+        return iterations
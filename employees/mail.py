@@ -0,0 +1,105 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from employees.models import QueuedEmail
+
+QUEUED_EMAIL_UPDATE_FIELDS = [
+    "status",
+    "attempts",
+    "next_attempt_at",
+    "last_error",
+    "sent_at",
+]
+
+
+def queue_mail(subject, message, from_email, recipient_list, html_message=None):
+    return QueuedEmail.objects.create(
+        subject=subject,
+        body=message,
+        html_body=html_message or "",
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients=list(recipient_list),
+    )
+
+
+def queue_mass_mail(datatuple):
+    return QueuedEmail.objects.bulk_create(
+        QueuedEmail(
+            subject=subject,
+            body=message,
+            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+            recipients=list(recipient_list),
+        )
+        for subject, message, from_email, recipient_list in datatuple
+    )
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=settings.MAIL_QUEUE_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def build_message(email, connection):
+    message = EmailMultiAlternatives(
+        email.subject,
+        email.body,
+        email.from_email,
+        email.recipients,
+        connection=connection,
+    )
+    if email.html_body:
+        message.attach_alternative(email.html_body, "text/html")
+    return message
+
+
+def _record_failure(email, error, now):
+    email.attempts += 1
+    email.last_error = f"{type(error).__name__}: {error}"
+    if email.attempts >= settings.MAIL_QUEUE_MAX_ATTEMPTS:
+        email.status = QueuedEmail.FAILED
+    else:
+        email.next_attempt_at = now + retry_delay(email.attempts)
+
+
+def send_queued_mail(batch_size=None, connection=None):
+    """
+    Delivers one batch of due emails over a single connection. Returns the
+    number of sent and failed messages.
+    """
+    batch_size = batch_size or settings.MAIL_QUEUE_BATCH_SIZE
+    connection = connection or get_connection()
+    sent = failed = 0
+
+    with transaction.atomic():
+        now = timezone.now()
+        batch = list(
+            QueuedEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=QueuedEmail.PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "pk")[:batch_size]
+        )
+        if not batch:
+            return sent, failed
+
+        try:
+            for email in batch:
+                try:
+                    # no-op while the connection is open, reconnects after a failure
+                    connection.open()
+                    connection.send_messages([build_message(email, connection)])
+                except Exception as error:
+                    connection.close()
+                    _record_failure(email, error, now)
+                    failed += 1
+                else:
+                    email.status = QueuedEmail.SENT
+                    email.sent_at = timezone.now()
+                    sent += 1
+        finally:
+            connection.close()
+
+        QueuedEmail.objects.bulk_update(batch, QUEUED_EMAIL_UPDATE_FIELDS)
+
+    return sent, failed
@@ -0,0 +1,145 @@
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Case, Q, When
+
+from employees.models import EmployeeSearchToken, Position
+from employees.search import employee_search_text, search_employees, search_tokens
+from employees.utils import preset_slugs
+
+FIRST_NAMES = (
+    "james mary john patricia robert jennifer michael linda william elizabeth "
+    "david barbara richard susan joseph jessica thomas sarah charles karen "
+    "olena taras dmytro iryna andrii oksana mykola natalia"
+).split()
+LAST_NAMES = (
+    "smith johnson williams brown jones garcia miller davis rodriguez martinez "
+    "hernandez lopez gonzalez wilson anderson thomas taylor moore jackson martin "
+    "shevchenko kovalenko bondarenko tkachenko kravchenko"
+).split()
+POSITIONS = [
+    "Project Manager",
+    "Backend Developer",
+    "Frontend Developer",
+    "QA Engineer",
+    "DevOps Engineer",
+    "Designer",
+    "Data Analyst",
+]
+BATCH_SIZE = 5000
+
+
+def legacy_search(queryset, query):
+    return (
+        queryset.annotate(
+            email_match=Case(When(email__icontains=query, then=1), default=0),
+            first_name_match=Case(When(first_name__icontains=query, then=1), default=0),
+            last_name_match=Case(When(last_name__icontains=query, then=1), default=0),
+            position_match=Case(
+                When(position__name__icontains=query, then=1), default=0
+            ),
+        )
+        .filter(
+            Q(email__icontains=query)
+            | Q(position__name__icontains=query)
+            | Q(first_name__icontains=query)
+            | Q(last_name__icontains=query)
+        )
+        .order_by(
+            "-last_name_match", "-first_name_match", "-email_match", "-position_match"
+        )
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures employee search latency (p50/p95) on generated employees for the "
+        "legacy icontains query and the indexed search modes. "
+        "All generated rows are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employees", type=int, default=100_000)
+        parser.add_argument("--queries", type=int, default=200)
+        parser.add_argument("--page-size", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        modes = {"legacy": legacy_search, "prefix": None}
+        if connection.vendor == "postgresql":
+            modes["trigram"] = None
+
+        with transaction.atomic():
+            self.seed(options["employees"], rng)
+            queries = [self.random_query(rng) for _ in range(options["queries"])]
+
+            UserModel = get_user_model()
+            for mode, search in modes.items():
+                timings = []
+                for query in queries:
+                    queryset = UserModel.objects.select_related("position")
+                    if search is not None:
+                        queryset = search(queryset, query)
+                    else:
+                        queryset = search_employees(queryset, query, mode=mode)
+                    started = time.perf_counter()
+                    list(queryset[: options["page_size"]])
+                    timings.append(time.perf_counter() - started)
+                self.report(mode, timings)
+
+            transaction.set_rollback(True)
+
+    def seed(self, size, rng):
+        positions = Position.objects.bulk_create(
+            Position(name=name) for name in POSITIONS
+        )
+        UserModel = get_user_model()
+        with preset_slugs(UserModel):
+            for start in range(0, size, BATCH_SIZE):
+                employees = []
+                for i in range(start, min(start + BATCH_SIZE, size)):
+                    first_name = rng.choice(FIRST_NAMES)
+                    last_name = rng.choice(LAST_NAMES)
+                    employee = UserModel(
+                        username=f"bench-{i}",
+                        slug=f"bench-{i}",
+                        password="!",
+                        first_name=first_name.title(),
+                        last_name=last_name.title(),
+                        email=f"{first_name}.{last_name}{i}@example.com",
+                        position=rng.choice(positions),
+                    )
+                    employee.search_text = employee_search_text(employee)
+                    employees.append(employee)
+                UserModel.objects.bulk_create(employees)
+                EmployeeSearchToken.objects.bulk_create(
+                    EmployeeSearchToken(employee=employee, token=token)
+                    for employee in employees
+                    for token in set(search_tokens(employee.search_text))
+                )
+
+    @staticmethod
+    def random_query(rng):
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        return rng.choice(
+            [
+                first_name[: rng.randint(3, len(first_name))],
+                last_name[: rng.randint(3, len(last_name))],
+                f"{first_name} {last_name[:3]}",
+                rng.choice(POSITIONS).split()[0].lower(),
+            ]
+        )
+
+    def report(self, mode, timings):
+        quantiles = statistics.quantiles(timings, n=20)
+        self.stdout.write(
+            f"{mode:<8} p50 {statistics.median(timings) * 1000:8.2f} ms  "
+            f"p95 {quantiles[18] * 1000:8.2f} ms  "
+            f"max {max(timings) * 1000:8.2f} ms"
+        )
@@ -0,0 +1,37 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from employees.mail import send_queued_mail
+
+
+class Command(BaseCommand):
+    help = "Delivers queued emails in batches, one SMTP connection per batch"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.MAIL_QUEUE_BATCH_SIZE
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the queue instead of exiting once it is drained",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds to wait between polls with --loop",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        while True:
+            sent, failed = send_queued_mail(batch_size)
+            if sent or failed:
+                self.stdout.write(f"Sent {sent} emails, {failed} failed")
+            if sent + failed < batch_size:
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
@@ -0,0 +1,20 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from employees.search import update_search_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the employee search text and prefix tokens, e.g. after loading "
+        "fixtures, which bypass Employee.save"
+    )
+
+    def handle(self, *args, **options):
+        employees = get_user_model().objects.select_related("position")
+        with transaction.atomic():
+            update_search_index(employees)
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {employees.count()} employees for search")
+        )
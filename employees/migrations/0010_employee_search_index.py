@@ -0,0 +1,95 @@
+# Generated by Django 5.1.1 on 2026-10-18 20:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from employees.search import search_tokens
+
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX employees_employee_search_text_trgm_idx "
+    "ON employees_employee USING GIN (search_text gin_trgm_ops)",
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS employees_employee_search_text_trgm_idx",
+]
+
+
+def build_search_index(apps, schema_editor):
+    Employee = apps.get_model("employees", "Employee")
+    EmployeeSearchToken = apps.get_model("employees", "EmployeeSearchToken")
+
+    employees = list(Employee.objects.select_related("position"))
+    for employee in employees:
+        parts = (
+            employee.first_name,
+            employee.last_name,
+            employee.email,
+            employee.position.name,
+        )
+        employee.search_text = " ".join(part for part in parts if part).lower()
+    Employee.objects.bulk_update(employees, ["search_text"], batch_size=1000)
+    EmployeeSearchToken.objects.bulk_create(
+        EmployeeSearchToken(employee=employee, token=token)
+        for employee in employees
+        for token in set(search_tokens(employee.search_text))
+    )
+
+    if schema_editor.connection.vendor == "postgresql":
+        for statement in POSTGRES_FORWARD:
+            schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        for statement in POSTGRES_BACKWARD:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0009_alter_team_members"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="employee",
+            name="search_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.CreateModel(
+            name="EmployeeSearchToken",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("token", models.CharField(max_length=255)),
+                (
+                    "employee",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_tokens",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["token", "employee"],
+                        name="employees_e_token_107637_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(build_search_index, drop_search_index),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.1 on 2026-10-18 21:05
+
+from django.db import migrations
+
+# Case-insensitive prefix lookups (istartswith) of the autocomplete widgets
+PREFIX_COLUMNS = [
+    ("employees_employee", "first_name"),
+    ("employees_employee", "last_name"),
+    ("employees_employee", "username"),
+    ("employees_team", "name"),
+]
+
+FORWARD = {
+    "postgresql": [
+        f"CREATE INDEX {table}_{column}_prefix_idx "
+        f"ON {table} (UPPER({column}::text) text_pattern_ops)"
+        for table, column in PREFIX_COLUMNS
+    ],
+    "sqlite": [
+        f"CREATE INDEX {table}_{column}_prefix_idx "
+        f"ON {table} ({column} COLLATE NOCASE)"
+        for table, column in PREFIX_COLUMNS
+    ],
+}
+
+BACKWARD = [
+    f"DROP INDEX IF EXISTS {table}_{column}_prefix_idx"
+    for table, column in PREFIX_COLUMNS
+]
+
+
+def create_prefix_indexes(apps, schema_editor):
+    for statement in FORWARD.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor in FORWARD:
+        for statement in BACKWARD:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0011_queued_email"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.1.1 on 2026-10-18 21:05
+
+from collections import defaultdict
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_email_duplicates(apps, schema_editor):
+    # employee_email_ci_unique can't be created while employees share an email
+    # in different cases. Which account to keep is not ours to guess, so list
+    # them to be merged or changed by hand before migrating again
+    Employee = apps.get_model("employees", "Employee")
+    duplicates = (
+        Employee.objects.exclude(email="")
+        .order_by()
+        .values(email_lower=Lower("email"))
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .values("email_lower")
+    )
+    conflicts = defaultdict(list)
+    rows = (
+        Employee.objects.annotate(email_lower=Lower("email"))
+        .filter(email_lower__in=duplicates)
+        .order_by("email_lower", "pk")
+        .values_list("email_lower", "username", "email")
+    )
+    for email_lower, username, email in rows:
+        conflicts[email_lower].append(f"{username} <{email}>")
+    if conflicts:
+        raise RuntimeError(
+            "Employees share these emails in different cases, merge them or "
+            "change their emails before migrating:\n"
+            + "\n".join(
+                f"{email}: {', '.join(accounts)}"
+                for email, accounts in conflicts.items()
+            )
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("employees", "0012_prefix_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="invitation",
+            index=models.Index(
+                fields=["-created_at", "id"], name="invitation_ordering_idx"
+            ),
+        ),
+        migrations.RunPython(check_email_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="employee",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                condition=models.Q(("email", ""), _negated=True),
+                name="employee_email_ci_unique",
+                violation_error_message="An employee with this email already exists.",
+            ),
+        ),
+    ]
@@ -1,9 +1,19 @@
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
 from django_extensions.db.fields import AutoSlugField
 
+from employees.search import (
+    SEARCH_TEXT_FIELDS,
+    employee_search_text,
+    rebuild_search_tokens,
+    update_search_index,
+)
+
 
 class Position(models.Model):
     name = models.CharField(max_length=100)
@@ -11,16 +21,70 @@ class Position(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if not adding:
+                update_search_index(self.employee_set.select_related("position"))
+
 
 class Employee(AbstractUser):
     position = models.ForeignKey("Position", on_delete=models.RESTRICT)
     slug = AutoSlugField(
         populate_from=["username", "first_name", "last_name"], unique=True
     )
+    search_text = models.TextField(blank=True, default="", editable=False)
+
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            # Also serves the login lookup in employees.backends
+            models.UniqueConstraint(
+                Lower("email"),
+                condition=~Q(email=""),
+                name="employee_email_ci_unique",
+                violation_error_message="An employee with this email already exists.",
+            )
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
+    def get_session_auth_hash(self):
+        # Users loaded from the session user cache carry the hash instead of
+        # the password, see employees.backends
+        if "password" in self.get_deferred_fields():
+            session_auth_hash = getattr(self, "cached_session_auth_hash", None)
+            if session_auth_hash is not None:
+                return session_auth_hash
+        return super().get_session_auth_hash()
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and SEARCH_TEXT_FIELDS.isdisjoint(update_fields):
+            return super().save(*args, **kwargs)
+
+        search_text = employee_search_text(self)
+        if search_text == self.search_text and not self._state.adding:
+            return super().save(*args, **kwargs)
+
+        self.search_text = search_text
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "search_text"}
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            rebuild_search_tokens([self])
+
+
+class EmployeeSearchToken(models.Model):
+    employee = models.ForeignKey(
+        Employee, on_delete=models.CASCADE, related_name="search_tokens"
+    )
+    token = models.CharField(max_length=255)
+
+    class Meta:
+        indexes = [models.Index(fields=["token", "employee"])]
+
 
 class Invitation(models.Model):
     email = models.EmailField(unique=True)
@@ -28,10 +92,18 @@ class Invitation(models.Model):
     invited_by = models.ForeignKey(get_user_model(), on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
     is_accepted = models.BooleanField(default=False)
-    slug = AutoSlugField(populate_from=["position", "created_at"], unique=True)
+    # Bulk invitations set unique slugs on the instances themselves, which are
+    # kept instead of probing the table for each one
+    slug = AutoSlugField(
+        populate_from=["position", "created_at"], unique=True, overwrite_on_add=False
+    )
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            # Cursor pagination appends the primary key to the ordering
+            models.Index(fields=["-created_at", "id"], name="invitation_ordering_idx"),
+        ]
 
 
 class Team(models.Model):
@@ -46,3 +118,44 @@ class Team(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class QueuedEmail(models.Model):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+    STATUS_CHOICES = (
+        (PENDING, "Pending"),
+        (SENT, "Sent"),
+        (FAILED, "Failed"),
+    )
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True, default="")
+    from_email = models.CharField(max_length=255)
+    recipients = models.JSONField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"], name="queued_email_due_idx"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.recipients)}"
+
+
+class DisplayNameChange(models.Model):
+    # Employees whose display name changed, replayed by the name index of every
+    # process (see employees.names). A null employee stands for every name
+    employee_id = models.BigIntegerField(null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
@@ -0,0 +1,197 @@
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from employees.models import DisplayNameChange
+from task_manager_project.generations import bump_generation, get_generation
+
+GENERATION_KEY = "employee-names:generation"
+# Processes that haven't synced for this long, or are further behind than
+# MAX_REPLAYED_CHANGES, reload every name. Changes are kept twice as long
+REPLAY_WINDOW = 60 * 60
+MAX_REPLAYED_CHANGES = 100
+# Changes older than twice the window are deleted every PRUNE_EVERY changes
+PRUNE_EVERY = 100
+# pg_advisory_xact_lock key that orders writers of the change log
+CHANGE_LOG_LOCK = 0x4E414D45
+
+
+def _display_name(first_name, last_name):
+    # Same as Employee.__str__
+    return f"{first_name} {last_name}"
+
+
+class DisplayNameIndex:
+    """
+    Process-level map of employee id to display name, kept as a sorted array
+    of ids and a parallel list of names. Both are replaced together as one
+    tuple and never changed in place, so readers need no lock.
+
+    Changes are logged in the DisplayNameChange table, which each process
+    replays from the last change it applied. A generation in the cache tells
+    processes when there is something to replay; losing it costs one query.
+    """
+
+    __slots__ = (
+        "entries",
+        "generation",
+        "change_id",
+        "synced_at",
+        "checked_at",
+        "lock",
+    )
+
+    def __init__(self):
+        self.entries = (array("q"), [])
+        self.generation = None
+        # Last change applied, None until every name is loaded
+        self.change_id = None
+        self.synced_at = 0.0
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+    def get(self, employee_id):
+        ids, names = self.entries
+        position = bisect_left(ids, employee_id)
+        if position < len(ids) and ids[position] == employee_id:
+            return names[position]
+        return None
+
+    def load(self):
+        change_id = DisplayNameChange.objects.aggregate(last=Max("pk"))["last"] or 0
+        rows = (
+            get_user_model()
+            .objects.order_by("pk")
+            .values_list("pk", "first_name", "last_name")
+        )
+        ids, names = array("q"), []
+        for pk, first_name, last_name in rows.iterator(chunk_size=2000):
+            ids.append(pk)
+            names.append(_display_name(first_name, last_name))
+        self.entries = (ids, names)
+        self.change_id = change_id
+
+    def update(self, employee_ids):
+        employee_ids = set(employee_ids)
+        rows = (
+            get_user_model()
+            .objects.filter(pk__in=employee_ids)
+            .values_list("pk", "first_name", "last_name")
+        )
+        ids, names = self.entries
+        ids, names = array("q", ids), list(names)
+        for pk, first_name, last_name in rows:
+            position = bisect_left(ids, pk)
+            name = _display_name(first_name, last_name)
+            if position < len(ids) and ids[position] == pk:
+                names[position] = name
+            else:
+                ids.insert(position, pk)
+                names.insert(position, name)
+            employee_ids.discard(pk)
+        for pk in employee_ids:
+            position = bisect_left(ids, pk)
+            if position < len(ids) and ids[position] == pk:
+                del ids[position]
+                del names[position]
+        self.entries = (ids, names)
+
+    def replay(self):
+        changes = list(
+            DisplayNameChange.objects.filter(pk__gt=self.change_id)
+            .order_by("pk")
+            .values_list("pk", "employee_id")[: MAX_REPLAYED_CHANGES + 1]
+        )
+        employee_ids = {employee_id for _, employee_id in changes}
+        if len(changes) > MAX_REPLAYED_CHANGES or None in employee_ids:
+            self.load()
+        elif changes:
+            self.update(employee_ids)
+            self.change_id = changes[-1][0]
+
+    def sync(self, force=False):
+        now = time.monotonic()
+        if (
+            not force
+            and self.change_id is not None
+            and now - self.checked_at < settings.EMPLOYEE_NAMES_SYNC_INTERVAL
+        ):
+            return
+        with self.lock:
+            self.checked_at = now
+            # Read before the log, so changes logged after it bump it again
+            generation = get_generation(GENERATION_KEY)
+            if generation == self.generation and self.change_id is not None:
+                return
+            if self.change_id is None or now - self.synced_at > REPLAY_WINDOW:
+                self.load()
+            else:
+                self.replay()
+            self.generation = generation
+            self.synced_at = now
+
+    def resolve(self, employee_ids):
+        self.sync()
+        names = {pk: self.get(pk) for pk in employee_ids}
+        missing = [pk for pk, name in names.items() if name is None]
+        if missing:
+            # Rows created without signals, e.g. by bulk_create
+            with self.lock:
+                self.update(missing)
+            names.update((pk, self.get(pk) or "") for pk in missing)
+        return names
+
+
+index = DisplayNameIndex()
+
+
+def display_name(employee_id):
+    if employee_id is None:
+        return ""
+    return index.resolve([employee_id])[employee_id]
+
+
+def display_names(employee_ids):
+    names = index.resolve(employee_ids)
+    return [names[pk] for pk in employee_ids]
+
+
+def log_display_name_changes(employee_ids):
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            # Held until commit, so changes are numbered in commit order and a
+            # process replaying from its last change can't skip a late commit.
+            # SQLite writers are serialized already
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_xact_lock(%s)", [CHANGE_LOG_LOCK])
+        changes = DisplayNameChange.objects.bulk_create(
+            DisplayNameChange(employee_id=employee_id) for employee_id in employee_ids
+        )
+        if any(change.pk % PRUNE_EVERY == 0 for change in changes):
+            DisplayNameChange.objects.filter(
+                created_at__lt=timezone.now() - timedelta(seconds=2 * REPLAY_WINDOW)
+            ).delete()
+        transaction.on_commit(lambda: bump_generation(GENERATION_KEY))
+
+
+def invalidate_display_names(employee_ids):
+    employee_ids = list(employee_ids)
+    if not employee_ids:
+        return
+    log_display_name_changes(employee_ids)
+    with index.lock:
+        index.update(employee_ids)
+
+
+def invalidate_all_display_names():
+    log_display_name_changes([None])
+    with index.lock:
+        index.change_id = None
@@ -0,0 +1,164 @@
+import datetime
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
+from django.views.generic import ListView
+
+CURSOR_SALT = "employees.pagination.cursor"
+
+
+def _to_json(value):
+    # Keep full precision: a truncated timestamp would skip or repeat rows.
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+class CursorPage:
+    cursor_based = True
+
+    def __init__(self, object_list, paginator, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Keyset paginator: pages are fetched with a WHERE on the ordering columns
+    of the last (or first) row seen instead of OFFSET, and no COUNT is run.
+    """
+
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = self.get_ordering(queryset)
+
+    @staticmethod
+    def get_ordering(queryset):
+        query = queryset.query
+        ordering = list(query.order_by or query.get_meta().ordering)
+        fields = []
+        for item in ordering:
+            if not isinstance(item, str) or item == "?":
+                raise ImproperlyConfigured(
+                    "Cursor pagination requires ordering by field names, got %r" % item
+                )
+            fields.append((item.lstrip("-"), item.startswith("-")))
+        if not any(name in ("pk", query.get_meta().pk.name) for name, _ in fields):
+            fields.append(("pk", False))
+        return fields
+
+    def page(self, cursor=None):
+        values, backwards = self.decode_cursor(cursor)
+
+        queryset = self.queryset
+        if values is not None:
+            queryset = queryset.filter(self.keyset_filter(values, backwards))
+        if backwards:
+            queryset = queryset.order_by(
+                *(name if desc else f"-{name}" for name, desc in self.ordering)
+            )
+        else:
+            queryset = queryset.order_by(
+                *(f"-{name}" if desc else name for name, desc in self.ordering)
+            )
+
+        rows = list(queryset[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if backwards:
+            rows.reverse()
+
+        next_cursor = previous_cursor = None
+        if rows:
+            if has_more or backwards:
+                next_cursor = self.encode_cursor(rows[-1], backwards=False)
+            if (has_more and backwards) or (values is not None and not backwards):
+                previous_cursor = self.encode_cursor(rows[0], backwards=True)
+        return CursorPage(rows, self, next_cursor, previous_cursor)
+
+    def keyset_filter(self, values, backwards):
+        condition = Q()
+        equal = Q()
+        for (name, desc), value in zip(self.ordering, values):
+            lookup = "lt" if desc != backwards else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def encode_cursor(self, obj, backwards):
+        values = [_to_json(self.get_value(obj, name)) for name, _ in self.ordering]
+        return signing.dumps(
+            {"v": values, "b": backwards}, salt=CURSOR_SALT, compress=True
+        )
+
+    def decode_cursor(self, cursor):
+        if not cursor:
+            return None, False
+        try:
+            payload = signing.loads(cursor, salt=CURSOR_SALT)
+            values = payload["v"]
+            backwards = bool(payload["b"])
+        except (signing.BadSignature, KeyError, TypeError):
+            return None, False
+        if len(values) != len(self.ordering):
+            return None, False
+        return [
+            self.to_python(name, value)
+            for (name, _), value in zip(self.ordering, values)
+        ], backwards
+
+    def to_python(self, name, value):
+        opts = self.queryset.model._meta
+        try:
+            field = opts.pk if name == "pk" else opts.get_field(name)
+        except FieldDoesNotExist:
+            return value
+        return field.to_python(value)
+
+    @staticmethod
+    def get_value(obj, name):
+        for attr in name.split(LOOKUP_SEP):
+            obj = getattr(obj, attr)
+        return obj
+
+
+class CursorPaginationMixin(ListView):
+    pagination_mode = None
+    cursor_kwarg = "cursor"
+
+    def get_pagination_mode(self):
+        return self.pagination_mode or settings.PAGINATION_MODE
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.get_pagination_mode() != "cursor":
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = CursorPaginator(queryset, page_size)
+        page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        return paginator, page, page.object_list, page.has_other_pages()
@@ -0,0 +1,108 @@
+import re
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Case, Exists, F, OuterRef, Q, Value, When
+
+TOKEN_RE = re.compile(r"[^\W\d_]+|\d+")
+BATCH_SIZE = 1000
+SEARCH_TEXT_FIELDS = {"first_name", "last_name", "email", "position"}
+
+
+def search_tokens(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def employee_search_text(employee):
+    parts = (
+        employee.first_name,
+        employee.last_name,
+        employee.email,
+        employee.position.name if employee.position_id else "",
+    )
+    return " ".join(part for part in parts if part).lower()
+
+
+def rebuild_search_tokens(employees):
+    from employees.models import EmployeeSearchToken
+
+    employee_ids = [employee.pk for employee in employees]
+    for start in range(0, len(employee_ids), BATCH_SIZE):
+        EmployeeSearchToken.objects.filter(
+            employee__in=employee_ids[start : start + BATCH_SIZE]
+        ).delete()
+    EmployeeSearchToken.objects.bulk_create(
+        (
+            EmployeeSearchToken(employee=employee, token=token)
+            for employee in employees
+            for token in set(search_tokens(employee.search_text))
+        ),
+        batch_size=BATCH_SIZE,
+    )
+
+
+def update_search_index(employees):
+    from employees.models import Employee
+
+    employees = list(employees)
+    for employee in employees:
+        employee.search_text = employee_search_text(employee)
+    Employee.objects.bulk_update(employees, ["search_text"], batch_size=BATCH_SIZE)
+    rebuild_search_tokens(employees)
+
+
+def get_search_mode(queryset):
+    if settings.EMPLOYEE_SEARCH_MODE:
+        return settings.EMPLOYEE_SEARCH_MODE
+    if connections[queryset.db].vendor == "postgresql":
+        return "trigram"
+    return "prefix"
+
+
+def trigram_search(queryset, query):
+    from django.contrib.postgres.lookups import TrigramWordSimilar
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    query = " ".join(query.lower().split())
+    return (
+        queryset.filter(
+            Q(search_text__contains=query)
+            | Q(TrigramWordSimilar(F("search_text"), Value(query)))
+        )
+        .annotate(search_rank=TrigramWordSimilarity(Value(query), "search_text"))
+        .order_by("-search_rank", "last_name", "first_name")
+    )
+
+
+def prefix_search(queryset, query):
+    from employees.models import EmployeeSearchToken
+
+    terms = search_tokens(query)
+    if not terms:
+        return queryset.none()
+
+    exact_matches = []
+    for term in terms:
+        # A range keeps the lookup on the token index on every backend,
+        # unlike LIKE 'term%' which SQLite only optimizes for NOCASE columns.
+        upper_bound = term[:-1] + chr(ord(term[-1]) + 1)
+        matching = EmployeeSearchToken.objects.filter(
+            token__gte=term, token__lt=upper_bound
+        )
+        queryset = queryset.filter(pk__in=matching.values("employee"))
+        exact = EmployeeSearchToken.objects.filter(employee=OuterRef("pk"), token=term)
+        exact_matches.append(Case(When(Exists(exact), then=1), default=0))
+
+    return queryset.annotate(
+        search_rank=sum(exact_matches[1:], exact_matches[0]),
+    ).order_by("-search_rank", "last_name", "first_name")
+
+
+SEARCH_MODES = {
+    "trigram": trigram_search,
+    "prefix": prefix_search,
+}
+
+
+def search_employees(queryset, query, mode=None):
+    return SEARCH_MODES[mode or get_search_mode(queryset)](queryset, query)
@@ -0,0 +1,28 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from employees.backends import invalidate_session_users
+from employees.models import Position
+from employees.names import invalidate_display_names
+
+NAME_FIELDS = {"first_name", "last_name"}
+
+
+@receiver(post_save, sender=get_user_model())
+def employee_saved(sender, instance, update_fields, **kwargs):
+    invalidate_session_users([instance.pk])
+    if update_fields is None or not NAME_FIELDS.isdisjoint(update_fields):
+        invalidate_display_names([instance.pk])
+
+
+@receiver(post_delete, sender=get_user_model())
+def employee_deleted(sender, instance, **kwargs):
+    invalidate_session_users([instance.pk])
+    invalidate_display_names([instance.pk])
+
+
+@receiver(post_save, sender=Position)
+def position_saved(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_session_users(instance.employee_set.values_list("id", flat=True))
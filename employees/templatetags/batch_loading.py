@@ -0,0 +1,26 @@
+from django import template
+
+from task_manager_project.batch_loading import batch_loader
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def related(context, obj, relation):
+    """
+    {% related team "members" as members %} loads a relation through the
+    request's batch loader, together with the other objects listed on the page.
+    """
+    request = context.get("request")
+    if request is None:
+        return getattr(obj, relation).all()
+    return batch_loader(request).load(obj, relation)
+
+
+@register.simple_tag(takes_context=True)
+def related_ids(context, obj, relation):
+    """Like related, for the primary keys of a many-to-many relation."""
+    request = context.get("request")
+    if request is None:
+        return list(getattr(obj, relation).values_list("pk", flat=True))
+    return batch_loader(request).load_ids(obj, relation)
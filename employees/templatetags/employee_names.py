@@ -0,0 +1,15 @@
+from django import template
+
+from employees import names
+
+register = template.Library()
+
+
+@register.filter
+def employee_name(employee_id):
+    return names.display_name(employee_id)
+
+
+@register.filter
+def employee_names(employee_ids):
+    return names.display_names(employee_ids)
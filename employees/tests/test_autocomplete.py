@@ -0,0 +1,85 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls.base import reverse
+
+from employees.forms import TeamForm
+from employees.models import Position, Team
+
+
+class AutocompleteTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        position = Position.objects.create(name="Test Position")
+        self.employee = get_user_model().objects.create_user(
+            username="testuser",
+            password="Testpass123",
+            first_name="Zed",
+            position=position,
+        )
+        get_user_model().objects.bulk_create(
+            get_user_model()(
+                username=f"user{i}",
+                slug=f"user{i}",
+                first_name=f"Jane{i:02}",
+                position=position,
+            )
+            for i in range(15)
+        )
+        self.client.force_login(self.employee)
+
+    def render_members(self, team=None):
+        form = TeamForm(instance=team)
+        html = str(form["members"])
+        return html, form.fields["members"].widget.field_id
+
+    def search(self, field_id, term, page=1):
+        return self.client.get(
+            reverse("autocomplete"),
+            {"field_id": field_id, "term": term, "page": page},
+        ).json()
+
+    def test_only_selected_options_are_rendered(self):
+        team = Team.objects.create(name="Test Team")
+        team.members.add(self.employee)
+
+        html = self.render_members(team)[0]
+
+        self.assertEqual(html.count("<option"), 1)
+        self.assertIn("Zed", html)
+
+    def test_prefix_search_is_paginated(self):
+        field_id = self.render_members()[1]
+
+        first_page = self.search(field_id, "jan")
+        self.assertEqual(len(first_page["results"]), 10)
+        self.assertTrue(first_page["more"])
+
+        second_page = self.search(field_id, "jan", page=2)
+        self.assertEqual(len(second_page["results"]), 5)
+        self.assertFalse(second_page["more"])
+
+        self.assertEqual(self.search(field_id, "ane")["results"], [])
+
+    def test_results_are_cached(self):
+        field_id = self.render_members()[1]
+        self.assertEqual(len(self.search(field_id, "zed")["results"]), 1)
+
+        get_user_model().objects.filter(first_name="Zed").update(first_name="Amy")
+        self.assertEqual(len(self.search(field_id, "zed")["results"]), 1)
+
+        cache.clear()
+        self.render_members()
+        self.assertEqual(self.search(field_id, "zed")["results"], [])
+
+    def test_rendered_widgets_outlive_the_default_cache(self):
+        field_id = self.render_members()[1]
+        cache.clear()
+        self.assertEqual(len(self.search(field_id, "zed")["results"]), 1)
+
+    def test_requires_login(self):
+        field_id = self.render_members()[1]
+        self.client.logout()
+
+        response = self.client.get(reverse("autocomplete"), {"field_id": field_id})
+        self.assertEqual(response.status_code, 302)
@@ -0,0 +1,89 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls.base import reverse
+
+from employees.backends import EmailBackend, session_user_key
+from employees.models import Position
+
+
+class EmailBackendGetUserTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.position = Position.objects.create(name="Test Position")
+        self.employee = get_user_model().objects.create_user(
+            username="testuser",
+            email="testuser@example.com",
+            password="Testpass123",
+            first_name="Jane",
+            position=self.position,
+        )
+        self.backend = EmailBackend()
+
+    def test_user_is_loaded_once(self):
+        with self.assertNumQueries(1):
+            user = self.backend.get_user(self.employee.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.backend.get_user(self.employee.pk), user)
+            self.assertEqual(user.position.name, "Test Position")
+        self.assertIn("search_text", user.get_deferred_fields())
+
+    def test_password_hash_is_not_cached(self):
+        user = self.backend.get_user(self.employee.pk)
+        self.assertNotIn(user.password, repr(cache.get(session_user_key(user.pk))))
+
+        cached_user = self.backend.get_user(self.employee.pk)
+        self.assertIn("password", cached_user.get_deferred_fields())
+        self.assertEqual(
+            cached_user.get_session_auth_hash(), self.employee.get_session_auth_hash()
+        )
+
+    def test_cached_user_keeps_the_session(self):
+        self.client.force_login(self.employee)
+        for _ in range(2):
+            response = self.client.get(reverse("tasks:dashboard"))
+            self.assertEqual(response.status_code, 200)
+
+    def test_user_cached_before_commit_is_dropped(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employee.is_active = False
+            self.employee.save()
+            # what a request reading the committed row would cache meanwhile
+            cache.set(session_user_key(self.employee.pk), {"stale": True})
+        self.assertIsNone(self.backend.get_user(self.employee.pk))
+
+    @override_settings(SESSION_USER_CACHE_TIMEOUT=0)
+    def test_user_is_not_cached_without_timeout(self):
+        self.backend.get_user(self.employee.pk)
+        with self.assertNumQueries(1):
+            self.backend.get_user(self.employee.pk)
+
+    def test_cached_user_is_invalidated_on_save(self):
+        self.backend.get_user(self.employee.pk)
+        self.employee.first_name = "Janet"
+        self.employee.save()
+        self.assertEqual(self.backend.get_user(self.employee.pk).first_name, "Janet")
+
+        self.position.name = "Renamed Position"
+        self.position.save()
+        user = self.backend.get_user(self.employee.pk)
+        self.assertEqual(user.position.name, "Renamed Position")
+
+    def test_inactive_and_deleted_users_are_not_loaded(self):
+        self.employee.is_active = False
+        self.employee.save()
+        self.assertIsNone(self.backend.get_user(self.employee.pk))
+
+        self.employee.delete()
+        self.assertIsNone(self.backend.get_user(self.employee.pk))
+
+    def test_session_expires_at_browser_close_unless_remembered(self):
+        login_url = reverse("employees:employee-login")
+        credentials = {"username": "testuser@example.com", "password": "Testpass123"}
+
+        self.client.post(login_url, credentials)
+        self.assertTrue(self.client.session.get_expire_at_browser_close())
+
+        self.client.logout()
+        self.client.post(login_url, {**credentials, "remember_me": True})
+        self.assertFalse(self.client.session.get_expire_at_browser_close())
@@ -3,9 +3,10 @@ from django.test import TestCase
 from django.urls.base import reverse
 
 from employees.models import Position, Invitation
+from task_manager_project.query_budget import QueryBudgetTestMixin
 
 
-class BaseEmployeeTests(TestCase):
+class BaseEmployeeTests(QueryBudgetTestMixin, TestCase):
     def setUp(self):
         self.position = Position.objects.create(name="Test Position")
         self.employee = get_user_model().objects.create_user(
@@ -207,6 +208,17 @@ class EmployeeLoginTests(BaseEmployeeTests):
         self.assertRedirects(response, reverse("tasks:dashboard"))
         self.assertTrue(response.wsgi_request.user.is_authenticated)
 
+    def test_employee_login_email_is_case_insensitive(self):
+        get_user_model().objects.create_user(
+            username="testlogin",
+            email="TestUser@example.com",
+            password="password123",
+            position=self.position,
+        )
+        post_data = {"username": "testuser@EXAMPLE.com", "password": "password123"}
+        response = self.client.post(reverse("employees:employee-login"), data=post_data)
+        self.assertRedirects(response, reverse("tasks:dashboard"))
+
     def test_employee_login_view_post_invalid(self):
         post_data = {
             "username": "invalid@example.com",
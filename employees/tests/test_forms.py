@@ -30,6 +30,16 @@ class EmployeeInvitationFormTests(TestCase):
         self.assertFalse(form.is_valid())
         self.assertIn("email", form.errors)
 
+    def test_email_of_existing_employee(self):
+        self.employee.email = "Jane@example.com"
+        self.employee.save()
+        form_data = {"email": "jane@EXAMPLE.com", "position": self.position.id}
+        form = EmployeeInvitationForm(data=form_data)
+        self.assertFalse(form.is_valid())
+        self.assertEqual(
+            form.errors["email"], ["An employee with this email already exists."]
+        )
+
 
 class EmployeeCreationFormTests(TestCase):
     def test_valid_form(self):
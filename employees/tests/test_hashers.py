@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher, identify_hasher, make_password
+from django.test import TestCase, override_settings
+from django.urls.base import reverse
+
+from employees.models import Position
+
+PRODUCTION_HASHERS = list(settings.PASSWORD_HASHER_CLASSES.values())
+
+
+class TestPasswordHashersTests(TestCase):
+    def test_tests_use_a_fast_hasher(self):
+        self.assertEqual(get_hasher().algorithm, "md5")
+        self.assertEqual(settings.PASSWORD_HASHERS[1:], PRODUCTION_HASHERS)
+
+
+@override_settings(
+    PASSWORD_HASHERS=PRODUCTION_HASHERS,
+    PASSWORD_ARGON2_MEMORY_COST=1024,
+    PASSWORD_ARGON2_TIME_COST=1,
+)
+class PasswordHasherPolicyTests(TestCase):
+    def test_argon2_costs_come_from_settings(self):
+        encoded = make_password("password123")
+        self.assertIn("$m=1024,t=1,p=1$", encoded)
+
+        with override_settings(PASSWORD_ARGON2_MEMORY_COST=2048):
+            self.assertTrue(get_hasher().must_update(encoded))
+
+    @override_settings(
+        PASSWORD_HASHERS=[PRODUCTION_HASHERS[2]], PASSWORD_PBKDF2_MAX_ITERATIONS=1000
+    )
+    def test_pbkdf2_iterations_are_capped(self):
+        self.assertTrue(make_password("password123").startswith("pbkdf2_sha256$1000$"))
+
+    def test_hash_is_upgraded_on_login(self):
+        with override_settings(PASSWORD_HASHERS=[PRODUCTION_HASHERS[2]]):
+            employee = get_user_model().objects.create_user(
+                username="testuser",
+                email="testuser@example.com",
+                password="password123",
+                position=Position.objects.create(name="Test Position"),
+            )
+        self.assertEqual(identify_hasher(employee.password).algorithm, "pbkdf2_sha256")
+
+        response = self.client.post(
+            reverse("employees:employee-login"),
+            {"username": "testuser@example.com", "password": "password123"},
+        )
+        self.assertRedirects(response, reverse("tasks:dashboard"))
+
+        employee.refresh_from_db()
+        self.assertEqual(identify_hasher(employee.password).algorithm, "argon2")
+        self.assertTrue(employee.check_password("password123"))
@@ -1,11 +1,17 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError
 from django.test import TestCase
 from django.urls.base import reverse
 
-from employees.models import Position, Invitation
+from employees.models import Position, Invitation, QueuedEmail
+from employees.utils import unique_slugs
+from task_manager_project.query_budget import QueryBudgetTestMixin
 
 
-class PublicInvitationTests(TestCase):
+class PublicInvitationTests(QueryBudgetTestMixin, TestCase):
     def setUp(self):
         self.position = Position.objects.create(name="Test Position")
 
@@ -29,7 +35,7 @@ class PublicInvitationTests(TestCase):
         self.assertNotEqual(response.status_code, 200)
 
 
-class BasePrivateInvitationTests(TestCase):
+class BasePrivateInvitationTests(QueryBudgetTestMixin, TestCase):
     def setUp(self):
         self.position = Position.objects.create(name="Test Position")
         self.employee = get_user_model().objects.create_user(
@@ -101,3 +107,111 @@ class PrivateInvitationListTests(BasePrivateInvitationTests):
         self.assertEqual(len(response.context["invitation_list"]), 5)
         self.assertContains(response, "test1@email.com")
         self.assertNotContains(response, "test5@email.com")
+
+
+class PrivateBulkInvitationTests(BasePrivateInvitationTests):
+    BULK_INVITE_URL = reverse("employees:employee-bulk-invite")
+
+    def setUp(self):
+        super().setUp()
+        self.developer = Position.objects.create(name="Developer")
+        Invitation.objects.create(
+            email="existing@email.com",
+            position=self.position,
+            invited_by=self.employee,
+        )
+
+    def test_get_bulk_invitation_view(self):
+        response = self.client.get(self.BULK_INVITE_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "employees/employee_bulk_invite.html")
+
+    def test_post_bulk_invitation_view(self):
+        form_data = {
+            "emails": "a@email.com\nb@email.com, Developer\n\na@email.com\n"
+            "existing@email.com",
+            "position": self.position.id,
+        }
+        response = self.client.post(self.BULK_INVITE_URL, data=form_data)
+
+        self.assertRedirects(response, reverse("employees:invitation-list"))
+        invitations = Invitation.objects.exclude(email="existing@email.com")
+        self.assertEqual(
+            dict(invitations.values_list("email", "position__name")),
+            {"a@email.com": "Test Position", "b@email.com": "Developer"},
+        )
+        self.assertEqual(Invitation.objects.values("slug").distinct().count(), 3)
+        self.assertEqual(
+            sorted(QueuedEmail.objects.values_list("recipients", flat=True)),
+            [["a@email.com"], ["b@email.com"]],
+        )
+        for invitation in invitations:
+            self.assertIn(
+                reverse("employees:employee-register", args=[invitation.slug]),
+                QueuedEmail.objects.get(recipients=[invitation.email]).body,
+            )
+
+    def test_post_bulk_invitation_rolled_back_when_queueing_fails(self):
+        form_data = {"emails": "a@email.com", "position": self.position.id}
+        with mock.patch(
+            "employees.views.queue_mass_mail", side_effect=DatabaseError
+        ), self.assertRaises(DatabaseError):
+            self.client.post(self.BULK_INVITE_URL, data=form_data)
+        self.assertFalse(Invitation.objects.filter(email="a@email.com").exists())
+
+    def test_post_bulk_invitation_csv_upload(self):
+        upload = SimpleUploadedFile(
+            "emails.csv", b"c@email.com,Developer\nd@email.com\n", "text/csv"
+        )
+        response = self.client.post(
+            self.BULK_INVITE_URL, data={"file": upload, "position": self.position.id}
+        )
+
+        self.assertRedirects(response, reverse("employees:invitation-list"))
+        self.assertEqual(
+            Invitation.objects.get(email="c@email.com").position, self.developer
+        )
+        self.assertEqual(
+            Invitation.objects.get(email="d@email.com").position, self.position
+        )
+
+    def test_post_bulk_invitation_invalid_rows(self):
+        form_data = {
+            "emails": "not-an-email\ne@email.com, Unknown",
+            "position": self.position.id,
+        }
+        response = self.client.post(self.BULK_INVITE_URL, data=form_data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context["form"].non_field_errors(),
+            [
+                "not-an-email is not a valid email address.",
+                "Position Unknown does not exist.",
+            ],
+        )
+        self.assertEqual(Invitation.objects.count(), 1)
+        self.assertFalse(QueuedEmail.objects.exists())
+
+    def test_post_bulk_invitation_employee_emails(self):
+        self.employee.email = "Jane@email.com"
+        self.employee.save()
+        form_data = {
+            "emails": "jane@EMAIL.com\nf@email.com",
+            "position": self.position.id,
+        }
+        response = self.client.post(self.BULK_INVITE_URL, data=form_data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context["form"].non_field_errors(),
+            ["An employee with the email jane@EMAIL.com already exists."],
+        )
+        self.assertEqual(Invitation.objects.count(), 1)
+
+    def test_unique_slugs_skip_existing_and_repeated(self):
+        slug = Invitation.objects.get().slug
+        self.assertEqual(
+            unique_slugs(Invitation, [slug, slug, "other"]),
+            [f"{slug}-2", f"{slug}-3", "other"],
+        )
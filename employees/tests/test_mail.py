@@ -0,0 +1,145 @@
+import socket
+from datetime import timedelta
+from io import StringIO
+
+from aiosmtpd.controller import Controller
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from employees.mail import queue_mail, send_queued_mail
+from employees.models import Position, QueuedEmail
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.messages = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.startswith("bounce"):
+            return "550 Mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append((session.peer, envelope.rcpt_tos))
+        return "250 Message accepted for delivery"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class SMTPTestCase(TestCase):
+    def setUp(self):
+        self.handler = RecordingHandler()
+        port = free_port()
+        self.controller = Controller(self.handler, hostname="127.0.0.1", port=port)
+        self.controller.start()
+        self.addCleanup(self.controller.stop)
+        smtp_settings = override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+            EMAIL_HOST="127.0.0.1",
+            EMAIL_PORT=port,
+            EMAIL_USE_TLS=False,
+            EMAIL_HOST_USER="",
+            EMAIL_HOST_PASSWORD="",
+        )
+        smtp_settings.enable()
+        self.addCleanup(smtp_settings.disable)
+
+
+class TestSendQueuedMail(SMTPTestCase):
+    def test_batch_is_sent_over_one_connection(self):
+        for index in range(3):
+            queue_mail("Subject", "Body", "from@example.com", [f"user{index}@x.com"])
+
+        self.assertEqual(send_queued_mail(), (3, 0))
+
+        self.assertEqual(len(self.handler.messages), 3)
+        self.assertEqual(len({peer for peer, _ in self.handler.messages}), 1)
+        self.assertFalse(QueuedEmail.objects.exclude(status=QueuedEmail.SENT).exists())
+
+    @override_settings(MAIL_QUEUE_RETRY_DELAY=60, MAIL_QUEUE_MAX_ATTEMPTS=3)
+    def test_failed_email_is_retried_with_backoff(self):
+        bounced = queue_mail("Subject", "Body", "from@example.com", ["bounce@x.com"])
+        queue_mail("Subject", "Body", "from@example.com", ["user@x.com"])
+
+        self.assertEqual(send_queued_mail(), (1, 1))
+
+        bounced.refresh_from_db()
+        self.assertEqual(bounced.status, QueuedEmail.PENDING)
+        self.assertEqual(bounced.attempts, 1)
+        self.assertIn("SMTPRecipientsRefused", bounced.last_error)
+        self.assertGreater(bounced.next_attempt_at, timezone.now())
+        self.assertEqual(self.handler.messages[0][1], ["user@x.com"])
+        self.assertEqual(send_queued_mail(), (0, 0))
+
+        bounced.next_attempt_at = timezone.now()
+        bounced.save()
+        send_queued_mail()
+        bounced.refresh_from_db()
+        self.assertEqual(bounced.attempts, 2)
+        self.assertGreaterEqual(
+            bounced.next_attempt_at, timezone.now() + timedelta(seconds=110)
+        )
+
+        bounced.next_attempt_at = timezone.now()
+        bounced.save()
+        send_queued_mail()
+        bounced.refresh_from_db()
+        self.assertEqual(bounced.status, QueuedEmail.FAILED)
+
+    def test_command_drains_queue_in_batches(self):
+        for index in range(5):
+            queue_mail("Subject", "Body", "from@example.com", [f"user{index}@x.com"])
+
+        out = StringIO()
+        call_command("send_queued_mail", batch_size=2, stdout=out)
+
+        self.assertEqual(len(self.handler.messages), 5)
+        self.assertEqual(len({peer for peer, _ in self.handler.messages}), 3)
+        self.assertIn("Sent 1 emails, 0 failed", out.getvalue())
+
+
+class TestViewsQueueMail(TestCase):
+    def setUp(self):
+        self.position = Position.objects.create(name="Test Position")
+        self.employee = get_user_model().objects.create_user(
+            username="testuser",
+            password="Testpass123",
+            email="testuser@x.com",
+            position=self.position,
+        )
+
+    def test_invitation_is_queued(self):
+        self.client.force_login(self.employee)
+        self.client.post(
+            reverse("employees:employee-invite"),
+            data={"email": "invited@x.com", "position": self.position.id},
+        )
+
+        self.assertEqual(len(mail.outbox), 0)
+        email = QueuedEmail.objects.get()
+        self.assertEqual(email.recipients, ["invited@x.com"])
+        self.assertIn("/employees/register/", email.body)
+
+    def test_password_reset_is_queued(self):
+        response = self.client.post(
+            reverse("employees:password_reset"), data={"email": "testuser@x.com"}
+        )
+
+        self.assertRedirects(response, reverse("employees:password_reset_done"))
+        self.assertEqual(len(mail.outbox), 0)
+        email = QueuedEmail.objects.get()
+        self.assertEqual(email.recipients, ["testuser@x.com"])
+        self.assertIn("/employees/password_reset/confirm/", email.body)
+
+        send_queued_mail()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, email.subject)
@@ -1,3 +1,7 @@
+from importlib import import_module
+
+from django.apps import apps
+from django.db import IntegrityError, connection
 from django.test import TestCase
 
 from employees.models import Position, Employee, Team
@@ -37,6 +41,38 @@ class TestEmployeeModel(TestCase):
         ).lower()
         self.assertEqual(self.employee.slug, test_slug)
 
+    def test_employee_email_is_unique_ignoring_case(self):
+        Employee.objects.create_user(
+            username="other", email="Test@Example.com", position=self.position
+        )
+        with self.assertRaises(IntegrityError):
+            Employee.objects.create_user(
+                username="another", email="test@example.com", position=self.position
+            )
+
+    def test_employees_without_email_are_allowed(self):
+        Employee.objects.create_user(username="other", position=self.position)
+        self.assertEqual(Employee.objects.filter(email="").count(), 2)
+
+    def test_migration_reports_email_duplicates_ignoring_case(self):
+        migration = import_module("employees.migrations.0013_hot_path_indexes")
+        migration.check_email_duplicates(apps, None)
+
+        with connection.cursor() as cursor:
+            cursor.execute("DROP INDEX employee_email_ci_unique")
+        for username, email in [
+            ("jane", "Jane@example.com"),
+            ("jane2", "jane@example.com"),
+            ("other", "other@example.com"),
+        ]:
+            Employee.objects.create_user(
+                username=username, email=email, position=self.position
+            )
+        with self.assertRaisesMessage(
+            RuntimeError, "jane@example.com: jane <Jane@example.com>, jane2 <"
+        ):
+            migration.check_email_duplicates(apps, None)
+
 
 class TestTeamMode(TestCase):
     def test_team_str(self):
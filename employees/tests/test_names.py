@@ -0,0 +1,111 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from employees import names
+from employees.models import Position
+
+
+@override_settings(EMPLOYEE_NAMES_SYNC_INTERVAL=0)
+class DisplayNameIndexTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.position = Position.objects.create(name="Test Position")
+        self.employees = [
+            get_user_model().objects.create_user(
+                username=f"user{i}",
+                first_name=f"Jane{i}",
+                last_name="Doe",
+                position=self.position,
+            )
+            for i in range(3)
+        ]
+        self.ids = [employee.pk for employee in self.employees]
+        names.index.sync()
+
+    def test_names_are_resolved_without_queries(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                names.display_names(self.ids), ["Jane0 Doe", "Jane1 Doe", "Jane2 Doe"]
+            )
+            self.assertEqual(names.display_name(self.ids[1]), str(self.employees[1]))
+            self.assertEqual(names.display_name(None), "")
+
+    def test_changes_are_applied_in_this_process(self):
+        self.employees[0].first_name = "Janet"
+        self.employees[0].save()
+        self.employees[1].delete()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(names.display_name(self.ids[0]), "Janet Doe")
+        self.assertEqual(names.display_name(self.ids[1]), "")
+
+    def rename(self, employee, first_name):
+        # Other processes hear of committed changes only
+        with self.captureOnCommitCallbacks(execute=True):
+            employee.first_name = first_name
+            employee.save()
+
+    def test_other_processes_replay_changes(self):
+        other = names.DisplayNameIndex()
+        other.sync()
+
+        self.rename(self.employees[0], "Janet")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employees[0].save(update_fields=["last_login"])
+
+        # The change log, then the changed names
+        with self.assertNumQueries(2):
+            other.sync()
+        self.assertEqual(other.get(self.ids[0]), "Janet Doe")
+        self.assertEqual(len(other.entries[0]), 3)
+        with self.assertNumQueries(0):
+            other.sync()
+
+    def test_lost_generation_replays_changes_without_reloading(self):
+        other = names.DisplayNameIndex()
+        other.sync()
+        self.rename(self.employees[0], "Janet")
+        # e.g. culled from a full cache
+        cache.delete(names.GENERATION_KEY)
+
+        with self.assertNumQueries(2):
+            other.sync()
+        self.assertEqual(other.get(self.ids[0]), "Janet Doe")
+
+    def test_other_processes_reload_after_invalidating_all(self):
+        other = names.DisplayNameIndex()
+        other.sync()
+        with self.captureOnCommitCallbacks(execute=True):
+            names.invalidate_all_display_names()
+
+        # The change log, then the last change and every name
+        with self.assertNumQueries(3):
+            other.sync()
+        self.assertEqual(other.get(self.ids[2]), "Jane2 Doe")
+
+    def test_updates_replace_the_entries_readers_hold(self):
+        ids, display_names = names.index.entries
+        position = list(ids).index(self.ids[0])
+        self.rename(self.employees[0], "Janet")
+        self.assertEqual(display_names[position], "Jane0 Doe")
+        self.assertIsNot(names.index.entries[0], ids)
+        self.assertEqual(names.display_name(self.ids[0]), "Janet Doe")
+
+    def test_rows_created_without_signals_are_loaded(self):
+        employee = get_user_model().objects.bulk_create(
+            [
+                get_user_model()(
+                    username="bulk",
+                    slug="bulk",
+                    first_name="Bulk",
+                    last_name="Created",
+                    position=self.position,
+                )
+            ]
+        )[0]
+
+        with self.assertNumQueries(1):
+            self.assertEqual(names.display_name(employee.pk), "Bulk Created")
+        with self.assertNumQueries(0):
+            names.display_name(employee.pk)
@@ -0,0 +1,100 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from employees.models import Position, Invitation
+from employees.pagination import CursorPaginator
+
+
+class CursorPaginatorTests(TestCase):
+    def setUp(self):
+        self.position = Position.objects.create(name="Test Position")
+        self.employee = get_user_model().objects.create_user(
+            username="testuser", password="Testpass123", position=self.position
+        )
+        for i in range(12):
+            Invitation.objects.create(
+                email=f"test{i}@email.com",
+                position=self.position,
+                invited_by=self.employee,
+            )
+        self.paginator = CursorPaginator(Invitation.objects.all(), 5)
+        self.ordered = list(Invitation.objects.order_by("-created_at", "pk"))
+
+    def test_ordering_from_meta_with_pk_tiebreaker(self):
+        self.assertEqual(self.paginator.ordering, [("created_at", True), ("pk", False)])
+
+    def test_walk_forward_and_back(self):
+        first = self.paginator.page()
+        self.assertEqual(list(first), self.ordered[:5])
+        self.assertFalse(first.has_previous())
+        self.assertTrue(first.has_next())
+
+        second = self.paginator.page(first.next_cursor)
+        self.assertEqual(list(second), self.ordered[5:10])
+        self.assertTrue(second.has_previous())
+
+        third = self.paginator.page(second.next_cursor)
+        self.assertEqual(list(third), self.ordered[10:])
+        self.assertFalse(third.has_next())
+
+        back = self.paginator.page(third.previous_cursor)
+        self.assertEqual(list(back), self.ordered[5:10])
+        self.assertTrue(back.has_next())
+
+        start = self.paginator.page(back.previous_cursor)
+        self.assertEqual(list(start), self.ordered[:5])
+        self.assertFalse(start.has_previous())
+
+    def test_pages_run_single_query(self):
+        cursor = self.paginator.page().next_cursor
+        with self.assertNumQueries(1):
+            list(self.paginator.page(cursor))
+
+    def test_invalid_cursor_returns_first_page(self):
+        page = self.paginator.page("not-a-cursor")
+        self.assertEqual(list(page), self.ordered[:5])
+
+
+@override_settings(PAGINATION_MODE="cursor")
+class CursorPaginatedListViewTests(TestCase):
+    INVITATION_LIST_URL = reverse("employees:invitation-list")
+
+    def setUp(self):
+        self.position = Position.objects.create(name="Test Position")
+        self.employee = get_user_model().objects.create_user(
+            username="testuser", password="Testpass123", position=self.position
+        )
+        self.client.force_login(self.employee)
+        for i in range(6):
+            Invitation.objects.create(
+                email=f"test{i}@email.com",
+                position=self.position,
+                invited_by=self.employee,
+            )
+
+    def test_list_view_uses_cursor_pages(self):
+        response = self.client.get(self.INVITATION_LIST_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["is_paginated"])
+        page = response.context["page_obj"]
+        self.assertEqual(len(response.context["invitation_list"]), 5)
+        self.assertContains(response, "cursor=")
+
+        response = self.client.get(
+            self.INVITATION_LIST_URL, {"cursor": page.next_cursor}
+        )
+        self.assertEqual(len(response.context["invitation_list"]), 1)
+
+    def test_search_with_cursor_pages(self):
+        response = self.client.get(self.INVITATION_LIST_URL, {"query": "test"})
+        page = response.context["page_obj"]
+        response = self.client.get(
+            self.INVITATION_LIST_URL, {"query": "test", "cursor": page.next_cursor}
+        )
+        self.assertEqual(len(response.context["invitation_list"]), 1)
+
+    def test_project_list_cursor_pages(self):
+        response = self.client.get(reverse("tasks:project-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.context["is_paginated"])
@@ -0,0 +1,92 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from employees.models import Position
+from employees.search import search_employees, search_tokens
+
+
+class EmployeeSearchIndexTests(TestCase):
+    def setUp(self):
+        self.position = Position.objects.create(name="Backend Developer")
+        self.employee = get_user_model().objects.create_user(
+            username="johndoe",
+            password="Testpass123",
+            first_name="John",
+            last_name="Doe",
+            email="john.doe1@email.com",
+            position=self.position,
+        )
+
+    def tokens(self, employee):
+        return set(employee.search_tokens.values_list("token", flat=True))
+
+    def test_search_tokens(self):
+        self.assertEqual(
+            search_tokens("John test1@email.com"), ["john", "test", "1", "email", "com"]
+        )
+
+    def test_search_text_on_create(self):
+        self.assertEqual(
+            self.employee.search_text, "john doe john.doe1@email.com backend developer"
+        )
+        self.assertEqual(
+            self.tokens(self.employee),
+            {"john", "doe", "1", "email", "com", "backend", "developer"},
+        )
+
+    def test_search_text_on_update(self):
+        self.employee.last_name = "Smith"
+        self.employee.save()
+        self.assertTrue(self.employee.search_text.startswith("john smith "))
+        self.assertIn("smith", self.tokens(self.employee))
+
+    def test_search_text_on_position_rename(self):
+        self.position.name = "Designer"
+        self.position.save()
+        self.employee.refresh_from_db()
+        self.assertTrue(self.employee.search_text.endswith("designer"))
+        self.assertIn("designer", self.tokens(self.employee))
+
+    def test_unrelated_update_skips_index(self):
+        with self.assertNumQueries(1):
+            self.employee.save(update_fields=["last_login"])
+
+
+class PrefixSearchTests(TestCase):
+    def setUp(self):
+        position = Position.objects.create(name="Designer")
+        self.john = get_user_model().objects.create_user(
+            username="john",
+            password="Testpass123",
+            first_name="John",
+            last_name="Johnson",
+            position=position,
+        )
+        self.johnny = get_user_model().objects.create_user(
+            username="johnny",
+            password="Testpass123",
+            first_name="Johnny",
+            last_name="Walker",
+            position=position,
+        )
+
+    def search(self, query):
+        return list(
+            search_employees(get_user_model().objects.all(), query, mode="prefix")
+        )
+
+    def test_prefix_match(self):
+        self.assertCountEqual(self.search("joh"), [self.john, self.johnny])
+
+    def test_exact_token_matches_rank_first(self):
+        self.assertEqual(self.search("johnny"), [self.johnny])
+        self.assertEqual(self.search("john"), [self.john, self.johnny])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self.search("john walk"), [self.johnny])
+
+    def test_position_match(self):
+        self.assertEqual(len(self.search("design")), 2)
+
+    def test_query_without_terms(self):
+        self.assertEqual(self.search("@@"), [])
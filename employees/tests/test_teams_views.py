@@ -3,9 +3,10 @@ from django.test import TestCase
 from django.urls.base import reverse
 
 from employees.models import Position, Team
+from task_manager_project.query_budget import QueryBudgetTestMixin
 
 
-class BaseTeamTests(TestCase):
+class BaseTeamTests(QueryBudgetTestMixin, TestCase):
     def setUp(self):
         self.position = Position.objects.create(name="Test Position")
         self.employee = get_user_model().objects.create_user(
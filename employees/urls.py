@@ -4,6 +4,7 @@ from django.contrib.auth import views as auth_views
 
 from employees.views import (
     EmployeeInvitationView,
+    BulkInvitationView,
     EmployeeRegisterView,
     EmployeeListView,
     EmployeeLoginView,
@@ -24,6 +25,11 @@ app_name = "employees"
 urlpatterns = [
     # Invitations
     path("employees/invite/", EmployeeInvitationView.as_view(), name="employee-invite"),
+    path(
+        "employees/invite/bulk/",
+        BulkInvitationView.as_view(),
+        name="employee-bulk-invite",
+    ),
     path(
         "employees/invitations/", InvitationListView.as_view(), name="invitation-list"
     ),
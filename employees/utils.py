@@ -0,0 +1,63 @@
+from contextlib import contextmanager
+
+from django.db.models import Q
+
+
+@contextmanager
+def preset_slugs(*models):
+    # AutoSlugField regenerates (and probes the table for) a unique slug on
+    # every insert, including bulk_create. Inside this block slugs that are
+    # already set on the instances are kept as-is.
+    fields = [model._meta.get_field("slug") for model in models]
+    previous = [field.overwrite_on_add for field in fields]
+    for field in fields:
+        field.overwrite_on_add = False
+    try:
+        yield
+    finally:
+        for field, overwrite_on_add in zip(fields, previous):
+            field.overwrite_on_add = overwrite_on_add
+
+
+def unique_slugs(model, bases):
+    # Resolves a batch of slugs against the table with a single query, using
+    # the same "-2", "-3" suffixes AutoSlugField would probe for one at a time
+    if not bases:
+        return []
+    field = model._meta.get_field("slug")
+    bases = [base[: field.max_length] for base in bases]
+    starts_with = Q()
+    for base in set(bases):
+        starts_with |= Q(slug__startswith=base)
+    taken = set(model.objects.filter(starts_with).values_list("slug", flat=True))
+
+    slugs = []
+    for base in bases:
+        slug, index = base, 2
+        while slug in taken:
+            end = f"-{index}"
+            slug = f"{base[: field.max_length - len(end)].rstrip('-')}{end}"
+            index += 1
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+@contextmanager
+def preset_timestamps(*models):
+    # auto_now/auto_now_add fields overwrite their value on save and
+    # bulk_create. Inside this block values set on the instances are kept.
+    fields = [
+        field
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    previous = [(field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, (auto_now, auto_now_add) in zip(fields, previous):
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
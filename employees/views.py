@@ -1,4 +1,3 @@
-from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import login, get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -8,7 +7,7 @@ from django.contrib.auth.views import (
     PasswordResetCompleteView,
     LogoutView,
 )
-from django.core.mail import send_mail
+from django.db import transaction
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse, reverse_lazy
@@ -17,13 +16,27 @@ from django.views.generic import UpdateView, DeleteView, ListView, CreateView
 
 from employees.forms import (
     EmployeeInvitationForm,
+    BulkInvitationForm,
     EmployeeCreationForm,
     EmployeeUpdateForm,
     EmployeeAuthenticationForm,
+    EmployeePasswordResetForm,
     TeamForm,
 )
+from employees.mail import queue_mail, queue_mass_mail
 from employees.mixins import InvitationSearchMixin, EmployeeSearchMixin, TeamSearchMixin
 from employees.models import Invitation, Team, Employee
+from employees.pagination import CursorPaginationMixin
+from task_manager_project.batch_loading import BatchLoadingMixin
+
+
+def invitation_email(request, invitation):
+    return (
+        "You have been invited!",
+        f"{request.user} has invited you to join. Proceed to {request.build_absolute_uri(reverse('employees:employee-register', args={invitation.slug}))}",
+        "from@example.com",
+        [invitation.email],
+    )
 
 
 class EmployeeInvitationView(LoginRequiredMixin, View):
@@ -38,13 +51,7 @@ class EmployeeInvitationView(LoginRequiredMixin, View):
             invitation.invited_by = request.user
             invitation.save()
 
-            send_mail(
-                "You have been invited!",
-                f"{request.user} has invited you to join. Proceed to {request.build_absolute_uri(reverse('employees:employee-register', args={invitation.slug}))}",
-                "from@example.com",
-                [invitation.email],
-                fail_silently=False,
-            )
+            queue_mail(*invitation_email(request, invitation))
 
             messages.success(request, "Invitation sent successfully")
             return redirect(reverse("employees:invitation-list"))
@@ -52,7 +59,35 @@ class EmployeeInvitationView(LoginRequiredMixin, View):
             return render(request, "employees/employee_invite.html", {"form": form})
 
 
-class InvitationListView(LoginRequiredMixin, InvitationSearchMixin, ListView):
+class BulkInvitationView(LoginRequiredMixin, View):
+    def get(self, request: HttpRequest) -> HttpResponse:
+        form = BulkInvitationForm()
+        return render(request, "employees/employee_bulk_invite.html", {"form": form})
+
+    def post(self, request: HttpRequest) -> HttpResponse:
+        form = BulkInvitationForm(request.POST, request.FILES)
+        if form.is_valid():
+            with transaction.atomic():
+                invitations = form.save(invited_by=request.user)
+                queue_mass_mail(
+                    invitation_email(request, invitation) for invitation in invitations
+                )
+
+            messages.success(request, f"{len(invitations)} invitations sent")
+            if form.already_invited:
+                messages.warning(
+                    request, f"Already invited: {', '.join(form.already_invited)}"
+                )
+            return redirect(reverse("employees:invitation-list"))
+        else:
+            return render(
+                request, "employees/employee_bulk_invite.html", {"form": form}
+            )
+
+
+class InvitationListView(
+    LoginRequiredMixin, CursorPaginationMixin, InvitationSearchMixin, ListView
+):
     model = Invitation
     template_name = "employees/invitations/invitation_list.html"
     paginate_by = 5
@@ -96,11 +131,9 @@ class EmployeeLoginView(LoginView):
         return super().dispatch(request, *args, **kwargs)
 
     def form_valid(self, form):
-        remember_me = form.cleaned_data["remember_me"]
-
-        if remember_me:
-            self.request.session.set_expiry(settings.SESSION_COOKIE_AGE)
-        else:
+        # Remembered sessions keep the default SESSION_COOKIE_AGE, so only
+        # browser-length sessions need their expiry stored
+        if not form.cleaned_data["remember_me"]:
             self.request.session.set_expiry(0)
 
         return super(EmployeeLoginView, self).form_valid(form)
@@ -117,8 +150,9 @@ class EmployeeLogoutView(LogoutView):
 
 
 class EmployeePasswordResetView(PasswordResetView):
+    form_class = EmployeePasswordResetForm
     template_name = "employees/reset_password/password_reset.html"
-    email_template_name = "employees/password_reset_email.html"
+    email_template_name = "employees/reset_password/password_reset_email.html"
     success_url = reverse_lazy("employees:password_reset_done")
 
 
@@ -131,13 +165,17 @@ class EmployeePasswordResetCompleteView(PasswordResetCompleteView):
         return context
 
 
-class EmployeeListView(LoginRequiredMixin, EmployeeSearchMixin, ListView):
+class EmployeeListView(
+    LoginRequiredMixin,
+    BatchLoadingMixin,
+    CursorPaginationMixin,
+    EmployeeSearchMixin,
+    ListView,
+):
     model = get_user_model()
     template_name = "employees/employee_list.html"
     paginate_by = 5
-    queryset = (
-        get_user_model().objects.select_related("position").prefetch_related("teams")
-    )
+    queryset = get_user_model().objects.select_related("position")
 
 
 class EmployeeUpdateView(LoginRequiredMixin, UpdateView):
@@ -159,9 +197,14 @@ class EmployeeDeleteView(LoginRequiredMixin, DeleteView):
         return super(EmployeeDeleteView, self).delete(request, *args, **kwargs)
 
 
-class TeamListView(LoginRequiredMixin, TeamSearchMixin, ListView):
+class TeamListView(
+    LoginRequiredMixin,
+    BatchLoadingMixin,
+    CursorPaginationMixin,
+    TeamSearchMixin,
+    ListView,
+):
     model = Team
-    queryset = Team.objects.prefetch_related("members")
     template_name = "employees/teams/team_list.html"
     paginate_by = 5
 
@@ -0,0 +1,40 @@
+from django.contrib.auth import get_user_model
+from django_select2.forms import ModelSelect2MultipleWidget
+
+from employees.models import Team
+
+
+class AutocompleteWidget(ModelSelect2MultipleWidget):
+    """
+    Renders only the selected options and loads the rest page by page from
+    the autocomplete view with case-insensitive prefix lookups, which are
+    backed by indexes.
+    """
+
+    max_results = 10
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("data_view", "autocomplete")
+        super().__init__(*args, **kwargs)
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        base_attrs = {"data-minimum-input-length": 1, **base_attrs}
+        return super().build_attrs(base_attrs, extra_attrs)
+
+
+class EmployeeWidget(AutocompleteWidget):
+    queryset = (
+        get_user_model()
+        .objects.only("first_name", "last_name")
+        .order_by("first_name", "last_name", "pk")
+    )
+    search_fields = [
+        "first_name__istartswith",
+        "last_name__istartswith",
+        "username__istartswith",
+    ]
+
+
+class TeamWidget(AutocompleteWidget):
+    queryset = Team.objects.only("name").order_by("name", "pk")
+    search_fields = ["name__istartswith"]
@@ -1,8 +1,29 @@
 function initSelect2(selector) {
     $(document).ready(function() {
-        $(selector).select2({
+        var $element = $(selector);
+        var options = {
             allowClear: true,
-        });
+        };
 
+        // Heavy widgets load their options from the autocomplete view
+        if ($element.data("field_id")) {
+            options.ajax = {
+                data: function(params) {
+                    return {
+                        term: params.term,
+                        page: params.page,
+                        field_id: $element.data("field_id"),
+                    };
+                },
+                processResults: function(data) {
+                    return {
+                        results: data.results,
+                        pagination: {more: data.more},
+                    };
+                },
+            };
+        }
+
+        $element.select2(options);
     });
 }
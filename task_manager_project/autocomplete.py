@@ -0,0 +1,37 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.cache import cache
+from django.http import HttpResponse
+from django_select2.views import AutoResponseView
+
+
+class AutocompleteView(LoginRequiredMixin, AutoResponseView):
+    """
+    Serves the heavy Select2 widgets. Responses are cached for
+    AUTOCOMPLETE_CACHE_TIMEOUT seconds per queryset, term and page, so every
+    rendered copy of a widget shares them.
+    """
+
+    def get(self, request, *args, **kwargs):
+        widget = self.get_widget_or_404()
+        key = self.cache_key(widget)
+        content = cache.get(key)
+        if content is None:
+            response = super().get(request, *args, **kwargs)
+            cache.set(key, response.content, settings.AUTOCOMPLETE_CACHE_TIMEOUT)
+            return response
+        return HttpResponse(content, content_type="application/json")
+
+    def cache_key(self, widget):
+        parts = (
+            type(widget).__qualname__,
+            str(widget.queryset.query),
+            widget.search_fields,
+            widget.max_results,
+            self.request.GET.get("term", ""),
+            self.request.GET.get("page", ""),
+        )
+        digest = hashlib.md5(repr(parts).encode()).hexdigest()
+        return f"autocomplete:{digest}"
@@ -0,0 +1,92 @@
+from collections import defaultdict
+
+from django.db.models import ManyToManyRel, prefetch_related_objects
+
+
+def related_ids(objects, relation):
+    """
+    Returns {pk: [related pks]} for a many-to-many relation of objects, read
+    from the through table without loading the related rows.
+    """
+    objects = list(objects)
+    if not objects:
+        return {}
+    field = objects[0]._meta.get_field(relation)
+    if isinstance(field, ManyToManyRel):
+        field = field.field
+        source, target = field.m2m_reverse_field_name(), field.m2m_field_name()
+    else:
+        source, target = field.m2m_field_name(), field.m2m_reverse_field_name()
+    rows = (
+        field.remote_field.through.objects.filter(
+            **{f"{source}__in": [obj.pk for obj in objects]}
+        )
+        .order_by("pk")
+        .values_list(source, target)
+    )
+    ids = defaultdict(list)
+    for pk, related_pk in rows:
+        ids[pk].append(related_pk)
+    return {obj.pk: ids[obj.pk] for obj in objects}
+
+
+class BatchLoader:
+    """
+    Request-scoped loader for many-to-many and reverse relations. Objects are
+    registered in batches (usually the page of a list view). The first time a
+    relation is requested for any object of a batch, it is loaded for the
+    whole batch with one query, and the results are kept for the rest of the
+    request.
+    """
+
+    def __init__(self):
+        self.batches = {}
+        self.loaded = {}
+
+    @staticmethod
+    def key(obj):
+        return (obj._meta.label, obj.pk)
+
+    def register(self, objects):
+        batch = list(objects)
+        for obj in batch:
+            self.batches.setdefault(self.key(obj), batch)
+        return batch
+
+    def load(self, obj, relation):
+        key = self.key(obj) + (relation,)
+        if key not in self.loaded:
+            batch = self.batches.get(self.key(obj)) or self.register([obj])
+            prefetch_related_objects(batch, relation)
+            for item in batch:
+                self.loaded[self.key(item) + (relation,)] = list(
+                    getattr(item, relation).all()
+                )
+        return self.loaded[key]
+
+    def load_ids(self, obj, relation):
+        key = self.key(obj) + (relation, "ids")
+        if key not in self.loaded:
+            batch = self.batches.get(self.key(obj)) or self.register([obj])
+            for pk, ids in related_ids(batch, relation).items():
+                self.loaded[(obj._meta.label, pk, relation, "ids")] = ids
+        return self.loaded[key]
+
+
+def batch_loader(request):
+    if not hasattr(request, "_batch_loader"):
+        request._batch_loader = BatchLoader()
+    return request._batch_loader
+
+
+class BatchLoadingMixin:
+    """Registers the objects listed by a ListView with the batch loader."""
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        objects = batch_loader(self.request).register(context["object_list"])
+        context["object_list"] = objects
+        context_object_name = self.get_context_object_name(self.object_list)
+        if context_object_name is not None:
+            context[context_object_name] = objects
+        return context
@@ -0,0 +1,33 @@
+import time
+
+from django.core.cache import cache
+
+
+def fresh_generation():
+    # Generations restart from the clock when their key is lost, e.g. culled
+    # from a full cache, so they never return to a value that the keys of
+    # stale entries still use
+    return time.time_ns() // 1000
+
+
+def get_generation(key):
+    return cache.get_or_set(key, fresh_generation, timeout=None)
+
+
+async def aget_generation(key):
+    return await cache.aget_or_set(key, fresh_generation, timeout=None)
+
+
+def bump_generation(key):
+    """
+    Moves the generation stored at `key` forward and returns it. A lost key is
+    added back from the clock, which is already past every earlier generation.
+    """
+    generation = fresh_generation()
+    if cache.add(key, generation, timeout=None):
+        return generation
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, generation, timeout=None)
+        return generation
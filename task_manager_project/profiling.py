@@ -0,0 +1,118 @@
+import cProfile
+import io
+import pstats
+import random
+import time
+from collections import deque
+from itertools import count
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.shortcuts import render
+from django.utils import timezone
+
+from task_manager_project.query_budget import QueryRecorder
+
+# Per-process ring buffer of the most recent profiles
+profiles = deque(maxlen=settings.PROFILER_BUFFER_SIZE)
+profile_ids = count(1)
+
+
+def should_profile(request):
+    if request.headers.get(settings.PROFILER_HEADER):
+        return request.user.is_staff
+    return random.random() < settings.PROFILER_SAMPLE_RATE
+
+
+async def ashould_profile(request):
+    if request.headers.get(settings.PROFILER_HEADER):
+        user = await request.auser()
+        return user.is_staff
+    return random.random() < settings.PROFILER_SAMPLE_RATE
+
+
+def format_stats(profiler, limit=40):
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    return output.getvalue()
+
+
+class SamplingProfilerMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not should_profile(request):
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with recorder.record():
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        self.save_profile(request, response, profiler, recorder, started)
+        return response
+
+    async def __acall__(self, request):
+        if not await ashould_profile(request):
+            return await self.get_response(request)
+
+        # Only profiles the event loop thread; time spent in sync_to_async
+        # workers shows up as waiting
+        profiler = cProfile.Profile()
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        async with recorder.arecord():
+            profiler.enable()
+            try:
+                response = await self.get_response(request)
+            finally:
+                profiler.disable()
+        self.save_profile(request, response, profiler, recorder, started)
+        return response
+
+    def save_profile(self, request, response, profiler, recorder, started):
+        duration = time.perf_counter() - started
+        profiles.appendleft(
+            {
+                "id": next(profile_ids),
+                "created_at": timezone.now(),
+                "method": request.method,
+                "path": request.get_full_path(),
+                "view_name": getattr(request.resolver_match, "view_name", ""),
+                "status_code": response.status_code,
+                "duration": duration * 1000,
+                "query_count": recorder.count,
+                "query_duration": recorder.duration * 1000,
+                "slowest_queries": [
+                    (duration * 1000, sql)
+                    for sql, duration in sorted(
+                        recorder.queries, key=lambda query: query[1], reverse=True
+                    )[:10]
+                ],
+                "repeated_queries": recorder.repeated()[:10],
+                "stats": format_stats(profiler),
+            }
+        )
+
+
+@staff_member_required
+def profile_list(request):
+    return render(
+        request,
+        "profiling/profile_list.html",
+        {"profiles": list(profiles), "header": settings.PROFILER_HEADER},
+    )
@@ -0,0 +1,138 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.test.utils import override_settings
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER_LIST_RE = re.compile(r"\((?:%s, )*%s\)")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def fingerprint(sql):
+    # Collapses IN (%s, %s, ...) so the same statement over lists of
+    # different length counts as a repeat
+    return PLACEHOLDER_LIST_RE.sub("(...)", sql)
+
+
+class QueryRecorder:
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - started))
+
+    @contextmanager
+    def record(self):
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self))
+            yield self
+
+    @asynccontextmanager
+    async def arecord(self):
+        # Async ORM queries run on the thread-sensitive executor, which has its
+        # own connections, so the wrappers are installed from that thread
+        record = self.record()
+        await sync_to_async(record.__enter__)()
+        try:
+            yield self
+        finally:
+            await sync_to_async(record.__exit__)(None, None, None)
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def duration(self):
+        return sum(duration for _, duration in self.queries)
+
+    def repeated(self):
+        counts = Counter(fingerprint(sql) for sql, _ in self.queries)
+        return [(sql, count) for sql, count in counts.most_common() if count > 1]
+
+    def summary(self):
+        lines = [f"{self.count} queries in {self.duration * 1000:.1f} ms"]
+        for sql, count in self.repeated()[:5]:
+            lines.append(f"  {count}x {sql}")
+        return "\n".join(lines)
+
+
+def query_budget(view_name):
+    return settings.QUERY_BUDGETS.get(view_name, settings.QUERY_BUDGET_DEFAULT)
+
+
+def check_query_budget(view_name, recorder):
+    budget = query_budget(view_name)
+    if budget is None or recorder.count <= budget:
+        return
+    message = (
+        f"{view_name} exceeded its budget of {budget} queries: {recorder.summary()}"
+    )
+    if settings.QUERY_BUDGET_RAISE:
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+class QueryBudgetMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        with recorder.record():
+            response = self.get_response(request)
+        return self.process_recorded(request, response, recorder)
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        async with recorder.arecord():
+            response = await self.get_response(request)
+        return self.process_recorded(request, response, recorder)
+
+    def process_recorded(self, request, response, recorder):
+        response.query_recorder = recorder
+        if request.resolver_match is not None:
+            check_query_budget(request.resolver_match.view_name, recorder)
+        return response
+
+
+class QueryBudgetTestMixin:
+    # Makes any request through the test client fail the test when its view
+    # runs more queries than its budget
+    def setUp(self):
+        super().setUp()
+        self.enterContext(override_settings(QUERY_BUDGET_RAISE=True))
+
+    @contextmanager
+    def assertQueryBudget(self, view_name):
+        recorder = QueryRecorder()
+        with recorder.record():
+            yield recorder
+        budget = query_budget(view_name)
+        if budget is not None and recorder.count > budget:
+            self.fail(
+                f"{view_name} exceeded its budget of {budget} queries: "
+                f"{recorder.summary()}"
+            )
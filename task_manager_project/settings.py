@@ -11,12 +11,16 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 import os
+import sys
 from dotenv import load_dotenv
 from pathlib import Path
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 
 load_dotenv()
 
+TESTING = sys.argv[1:2] == ["test"]
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -33,7 +37,7 @@ ALLOWED_HOSTS = [
     "task-manager-project-pw7u.onrender.com",
     "127.0.0.1",
     "localhost",
-    "test-deploy-6uh5.onrender.com"
+    "test-deploy-6uh5.onrender.com",
 ]
 
 
@@ -48,7 +52,7 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     # 3rd party
     "django_extensions",
-    "debug_toolbar",
+    "django_select2",
     # local apps
     "employees",
     "tasks",
@@ -57,17 +61,46 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     # white noise for staticfiles
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "task_manager_project.middleware.AsyncWhiteNoiseMiddleware",
+    "task_manager_project.query_budget.QueryBudgetMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    # 3rd party
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
+    "task_manager_project.profiling.SamplingProfilerMiddleware",
 ]
 
+if DEBUG:
+    INSTALLED_APPS.append("debug_toolbar")
+    MIDDLEWARE.append("debug_toolbar.middleware.DebugToolbarMiddleware")
+
+# Sampling profiler: profiles PROFILER_SAMPLE_RATE (0-1) of all requests, and
+# requests from staff users that send the PROFILER_HEADER header. The latest
+# PROFILER_BUFFER_SIZE profiles of each process are shown at /admin/profiles/
+PROFILER_SAMPLE_RATE = float(os.getenv("DJANGO_PROFILER_SAMPLE_RATE") or 0)
+PROFILER_HEADER = "X-Profile"
+PROFILER_BUFFER_SIZE = 50
+
+# Maximum number of SQL queries per request, by URL name. Requests over budget
+# are logged, or raise QueryBudgetExceeded when QUERY_BUDGET_RAISE is set
+QUERY_BUDGETS = {
+    "tasks:dashboard": 8,
+    "tasks:project-list": 7,
+    "tasks:project-detail": 8,
+    # Also the budget of completing or reopening a task, which posts to the
+    # same URL: the session and user, the savepoint and its release, locking
+    # the task, the task and project counter updates and the assignees whose
+    # dashboards are stale
+    "tasks:task-detail": 8,
+    "employees:employee-list": 7,
+    "employees:team-list": 7,
+    "employees:invitation-list": 6,
+}
+QUERY_BUDGET_DEFAULT = 20
+QUERY_BUDGET_RAISE = False
+
 AUTH_USER_MODEL = "employees.Employee"
 
 LOGIN_URL = "employees:employee-login"
@@ -78,7 +111,6 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [(BASE_DIR / "templates")],
-        "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.debug",
@@ -86,18 +118,85 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
             ],
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        (
+                            "task_manager_project.template_loaders.Loader",
+                            [
+                                "django.template.loaders.filesystem.Loader",
+                                "django.template.loaders.app_directories.Loader",
+                            ],
+                        ),
+                    ],
+                ),
+            ],
         },
     },
 ]
 
+# Small static templates that are copied into the templates including them
+# when those are compiled, see task_manager_project.template_loaders
+TEMPLATE_INLINE_INCLUDES = {
+    "includes/svg/arrow_down.html",
+    "includes/svg/dot.html",
+    "includes/svg/exclamation_diamond.html",
+}
+
 WSGI_APPLICATION = "task_manager_project.wsgi.application"
 
 SESSION_COOKIE_AGE = 60 * 60 * 24 * 7
 
+# "cached_db" reads sessions from the cache and falls back to the database,
+# "signed_cookies" keeps them in the cookie and needs no storage at all
+SESSION_ENGINES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+SESSION_ENGINE = SESSION_ENGINES[os.getenv("DJANGO_SESSION_MODE", "cached_db")]
+
+# List views paginate with "offset" (numbered pages) or "cursor" (keyset, no COUNT)
+PAGINATION_MODE = os.getenv("DJANGO_PAGINATION_MODE", "offset")
+
+# Serve the dashboard and project pages with the async views of
+# tasks.async_views. Opt-in, for ASGI servers only: under WSGI they would run in
+# a new event loop per request, and benchmark_servers measured them at about
+# half the throughput of the sync views under WSGI
+ASYNC_VIEWS = (os.getenv("DJANGO_ASYNC_VIEWS") or "False") == "True"
+
 AUTHENTICATION_BACKENDS = [
     "employees.backends.EmailBackend",  # authentication using EMAIL
 ]
 
+# New passwords are hashed with PASSWORD_HASHER. The other hashers only verify
+# existing hashes, which are rehashed on the next successful login, as are
+# hashes made with different costs
+PASSWORD_HASHER_CLASSES = {
+    "argon2": "employees.hashers.Argon2PasswordHasher",
+    "scrypt": "employees.hashers.ScryptPasswordHasher",
+    "pbkdf2": "employees.hashers.PBKDF2PasswordHasher",
+}
+PASSWORD_HASHER = os.getenv("DJANGO_PASSWORD_HASHER", "argon2")
+PASSWORD_HASHERS = [PASSWORD_HASHER_CLASSES[PASSWORD_HASHER]] + [
+    path for name, path in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER
+]
+PASSWORD_ARGON2_TIME_COST = int(os.getenv("DJANGO_ARGON2_TIME_COST", 2))
+# In KiB
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv("DJANGO_ARGON2_MEMORY_COST", 19 * 1024))
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv("DJANGO_ARGON2_PARALLELISM", 1))
+PASSWORD_SCRYPT_WORK_FACTOR = int(os.getenv("DJANGO_SCRYPT_WORK_FACTOR", 2**14))
+# Caps PBKDF2 iterations, e.g. for staging
+PASSWORD_PBKDF2_MAX_ITERATIONS = int(os.getenv("DJANGO_PBKDF2_MAX_ITERATIONS", 0))
+
+if TESTING:
+    # Tests create users in setUp, so hash their passwords cheaply
+    PASSWORD_HASHERS = [
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+        *PASSWORD_HASHERS,
+    ]
+
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
@@ -111,15 +210,105 @@ DATABASES = {
 db_from_env = dj_database_url.config(conn_max_age=500)
 DATABASES["default"].update(db_from_env)
 
+# Cache settings
+# Choose the cache backend with DJANGO_CACHE_BACKEND: "locmem", "file" or "redis".
+# Invalidations only reach the workers that share the cache, so the default is
+# redis when REDIS_URL is set, otherwise the file cache shared by the workers of
+# one host. locmem is private to each process: it is the default for tests only
+# and is refused when WEB_CONCURRENCY starts several workers
+CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "task-manager",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION") or BASE_DIR / "cache",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+    "redis": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_URL") or "redis://127.0.0.1:6379",
+    },
+}
+CACHE_BACKEND = os.getenv("DJANGO_CACHE_BACKEND") or (
+    "locmem" if TESTING else "redis" if os.getenv("REDIS_URL") else "file"
+)
+if CACHE_BACKEND == "locmem" and int(os.getenv("WEB_CONCURRENCY") or 1) > 1:
+    raise ImproperlyConfigured(
+        "The locmem cache isn't shared between workers, "
+        "set DJANGO_CACHE_BACKEND to file or redis"
+    )
+# Heavy Select2 widgets register their querysets when rendered, and the
+# autocomplete requests of a page may reach any worker. The registrations get a
+# cache of their own on the same backend, so rendered fragments filling the
+# default cache don't cull them while a form is open
+SELECT2_CACHE = {**CACHE_BACKENDS[CACHE_BACKEND], "TIMEOUT": 60 * 60 * 24}
+if CACHE_BACKEND == "locmem":
+    SELECT2_CACHE["LOCATION"] = "select2"
+elif CACHE_BACKEND == "file":
+    SELECT2_CACHE["LOCATION"] = Path(SELECT2_CACHE["LOCATION"]) / "select2"
+# Rendered task rows are keyed on the task version, the row generation and the
+# template, so they never go stale and each process can keep its own. They are
+# shared in redis, but not in the file cache, which scans its directory on
+# every set
+TASK_ROW_CACHE = (
+    CACHE_BACKENDS["redis"]
+    if CACHE_BACKEND == "redis"
+    else {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "task-rows",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    }
+)
+CACHES = {
+    "default": CACHE_BACKENDS[CACHE_BACKEND],
+    "select2": SELECT2_CACHE,
+    "task_rows": TASK_ROW_CACHE,
+}
+SELECT2_CACHE_BACKEND = "select2"
+
+# Logged-in users are loaded from the cache, see EmailBackend.get_user. The
+# cached users hold the session auth hash, is_active and is_staff, so they are
+# only cached (0 turns it off) when changes reach every worker: in a shared
+# cache, or in the single process of the tests
+SESSION_USER_CACHE_TIMEOUT = 60 * 5 if CACHE_BACKEND != "locmem" or TESTING else 0
+
+DASHBOARD_CACHE_TIMEOUT = 60 * 60
+# Rendered task table rows, see TASK_ROW_CACHE
+TASK_ROW_CACHE_TIMEOUT = 60 * 60 * 24
+# How often each process checks for employee renames made by other processes,
+# see employees.names
+EMPLOYEE_NAMES_SYNC_INTERVAL = 1
+
+# Autocomplete responses of the Select2 widgets, cached in the default cache
+AUTOCOMPLETE_CACHE_TIMEOUT = 30
+
+# Full-text search backend (dotted path), chosen by database vendor when unset
+SEARCH_BACKEND = os.getenv("DJANGO_SEARCH_BACKEND")
+
+# Employee search: "trigram" (PostgreSQL pg_trgm) or "prefix", chosen by database
+# vendor when unset
+EMPLOYEE_SEARCH_MODE = os.getenv("DJANGO_EMPLOYEE_SEARCH_MODE")
+
 # Email settings
 # EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
-EMAIL_HOST = "smtp.gmail.com"
-EMAIL_PORT = 587
-EMAIL_USE_TLS = True
+# Empty values, as in .env.example, fall back to the defaults
+EMAIL_HOST = os.getenv("EMAIL_HOST") or "smtp.gmail.com"
+EMAIL_PORT = int(os.getenv("EMAIL_PORT") or 587)
+EMAIL_USE_TLS = (os.getenv("EMAIL_USE_TLS") or "True") == "True"
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 
+# Views only queue outgoing mail, `manage.py send_queued_mail` delivers it.
+# Failed deliveries are retried after MAIL_QUEUE_RETRY_DELAY seconds, doubling
+# with every attempt
+MAIL_QUEUE_BATCH_SIZE = 100
+MAIL_QUEUE_MAX_ATTEMPTS = 5
+MAIL_QUEUE_RETRY_DELAY = 60
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
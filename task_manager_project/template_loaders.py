@@ -0,0 +1,72 @@
+import re
+
+from django.conf import settings
+from django.template import Origin, TemplateDoesNotExist
+from django.template.loaders.base import Loader as BaseLoader
+
+INCLUDE_RE = re.compile(
+    r"""{%\s*include\s+(?P<quote>["'])(?P<name>[^"']+)(?P=quote)"""
+    r"""(?:\s+with\s+(?P<extra>.+?))?\s*%}"""
+)
+# Tags that behave differently once copied into the including template
+NOT_INLINABLE_RE = re.compile(r"{%\s*(?:extends|block|load)\b")
+MAX_INLINE_DEPTH = 5
+
+
+class Loader(BaseLoader):
+    """
+    Wraps other loaders and replaces literal {% include %} tags of the
+    templates listed in TEMPLATE_INLINE_INCLUDES with their source, so they
+    are compiled once into the including template instead of being looked up
+    and rendered as a nested template on every use.
+    """
+
+    def __init__(self, engine, loaders):
+        super().__init__(engine)
+        self.loaders = engine.get_template_loaders(loaders)
+
+    def get_template_sources(self, template_name):
+        for loader in self.loaders:
+            for source_origin in loader.get_template_sources(template_name):
+                origin = Origin(
+                    name=source_origin.name,
+                    template_name=source_origin.template_name,
+                    loader=self,
+                )
+                origin.source_origin = source_origin
+                yield origin
+
+    def get_contents(self, origin):
+        return self.inline(self.get_source_contents(origin))
+
+    def get_source_contents(self, origin):
+        source_origin = origin.source_origin
+        return source_origin.loader.get_contents(source_origin)
+
+    def find_source(self, template_name):
+        for origin in self.get_template_sources(template_name):
+            try:
+                return self.get_source_contents(origin)
+            except TemplateDoesNotExist:
+                continue
+        return None
+
+    def inline(self, source, depth=0):
+        if depth >= MAX_INLINE_DEPTH:
+            return source
+
+        def replace(match):
+            extra = match["extra"]
+            if match["name"] not in settings.TEMPLATE_INLINE_INCLUDES or (
+                extra and extra.split()[-1] == "only"
+            ):
+                return match[0]
+            included = self.find_source(match["name"])
+            if included is None or NOT_INLINABLE_RE.search(included):
+                return match[0]
+            included = self.inline(included, depth + 1)
+            if extra:
+                return f"{{% with {extra} %}}{included}{{% endwith %}}"
+            return included
+
+        return INCLUDE_RE.sub(replace, source)
@@ -15,12 +15,22 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
-from debug_toolbar.toolbar import debug_toolbar_urls
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 
+from task_manager_project.autocomplete import AutocompleteView
+from task_manager_project.profiling import profile_list
+
 urlpatterns = [
+    path("admin/profiles/", profile_list, name="profile-list"),
     path("admin/", admin.site.urls),
+    path("autocomplete/", AutocompleteView.as_view(), name="autocomplete"),
     path("", include("employees.urls", namespace="employees")),
     path("", include("tasks.urls", namespace="tasks")),
-] + debug_toolbar_urls()
+]
+
+if settings.DEBUG:
+    from debug_toolbar.toolbar import debug_toolbar_urls
+
+    urlpatterns += debug_toolbar_urls()
@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class TasksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "tasks"
+
+    def ready(self):
+        import tasks.signals  # noqa: F401
+        from tasks.search.sqlite import restore_fts_triggers
+
+        post_migrate.connect(restore_fts_triggers, sender=self)
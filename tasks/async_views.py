@@ -0,0 +1,58 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import AccessMixin
+from django.http import Http404
+
+from tasks.dashboard import aget_dashboard_snapshot
+from tasks.views import ProjectDetailView, ProjectListView, UserDashboardView
+
+
+class AsyncLoginRequiredMixin(AccessMixin):
+    """
+    Loads the user without blocking and sets it on the request, so the sync
+    views' login checks and context code reuse it.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class AsyncUserDashboardView(AsyncLoginRequiredMixin, UserDashboardView):
+    async def get(self, request, *args, **kwargs):
+        self.snapshot = await aget_dashboard_snapshot(request.user)
+        context = await sync_to_async(self.get_context_data)(**kwargs)
+        return self.render_to_response(context)
+
+    def get_snapshot(self):
+        return self.snapshot
+
+
+class AsyncProjectListView(AsyncLoginRequiredMixin, ProjectListView):
+    async def get(self, request, *args, **kwargs):
+        # Search and cursor pages run raw SQL eagerly, so they stay sync
+        self.object_list = await sync_to_async(self.get_queryset)()
+        self.object_count = None
+        if self.get_pagination_mode() != "cursor":
+            self.object_count = await self.object_list.acount()
+        context = await sync_to_async(self.get_context_data)()
+        return self.render_to_response(context)
+
+    def get_paginator(self, *args, **kwargs):
+        paginator = super().get_paginator(*args, **kwargs)
+        if self.object_count is not None:
+            paginator.count = self.object_count
+        return paginator
+
+
+class AsyncProjectDetailView(AsyncLoginRequiredMixin, ProjectDetailView):
+    async def get(self, request, *args, **kwargs):
+        try:
+            self.object = await self.get_queryset().aget(
+                slug=kwargs[self.slug_url_kwarg]
+            )
+        except self.model.DoesNotExist:
+            raise Http404("No project found matching the query")
+        context = await sync_to_async(self.get_context_data)(object=self.object)
+        return self.render_to_response(context)
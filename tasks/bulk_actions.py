@@ -0,0 +1,104 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+
+from tasks.dashboard import invalidate_dashboard_snapshots
+from tasks.models import Task
+from tasks.signals import bump_task_versions
+
+# Bulk changes write the through tables directly, so m2m_changed doesn't fire
+# and dashboards and task versions are kept fresh here instead
+
+
+def assignee_ids(task_ids):
+    return set(
+        Task.assignees.through.objects.filter(task__in=task_ids).values_list(
+            "employee_id", flat=True
+        )
+    )
+
+
+def reassign_tasks(task_ids, employee_ids):
+    Assignee = Task.assignees.through
+    employee_ids = set(employee_ids)
+    with transaction.atomic():
+        previous_ids = defaultdict(set)
+        removed = []
+        assignees = Assignee.objects.filter(task__in=task_ids).values_list(
+            "pk", "task_id", "employee_id"
+        )
+        for pk, task_id, employee_id in assignees:
+            previous_ids[task_id].add(employee_id)
+            if employee_id not in employee_ids:
+                removed.append(pk)
+        changed = [
+            task_id for task_id in task_ids if previous_ids[task_id] != employee_ids
+        ]
+        Assignee.objects.filter(pk__in=removed).delete()
+        Assignee.objects.bulk_create(
+            [
+                Assignee(task_id=task_id, employee_id=employee_id)
+                for task_id in changed
+                for employee_id in employee_ids - previous_ids[task_id]
+            ],
+            ignore_conflicts=True,
+        )
+        bump_task_versions(changed)
+        if changed:
+            invalidate_dashboard_snapshots(
+                employee_ids.union(*(previous_ids[task_id] for task_id in changed))
+            )
+    return len(changed)
+
+
+def add_task_tags(task_ids, tag_ids):
+    Tag = Task.tags.through
+    with transaction.atomic():
+        existing = set(
+            Tag.objects.filter(task__in=task_ids, tasktag__in=tag_ids).values_list(
+                "task_id", "tasktag_id"
+            )
+        )
+        added = [
+            Tag(task_id=task_id, tasktag_id=tag_id)
+            for task_id in task_ids
+            for tag_id in tag_ids
+            if (task_id, tag_id) not in existing
+        ]
+        Tag.objects.bulk_create(added, ignore_conflicts=True)
+        changed = {tag.task_id for tag in added}
+        bump_task_versions(changed)
+    return len(changed)
+
+
+def remove_task_tags(task_ids, tag_ids):
+    with transaction.atomic():
+        tags = Task.tags.through.objects.filter(task__in=task_ids, tasktag__in=tag_ids)
+        changed = set(tags.values_list("task_id", flat=True))
+        tags.delete()
+        bump_task_versions(changed)
+    return len(changed)
+
+
+def set_task_priority(task_ids, priority):
+    with transaction.atomic():
+        changed = (
+            Task.objects.filter(pk__in=task_ids)
+            .exclude(priority=priority)
+            .update(priority=priority, version=F("version") + 1)
+        )
+        if changed:
+            invalidate_dashboard_snapshots(assignee_ids(task_ids))
+    return changed
+
+
+def shift_task_deadlines(task_ids, days):
+    with transaction.atomic():
+        changed = Task.objects.filter(pk__in=task_ids).update(
+            deadline=F("deadline") + timedelta(days=days),
+            version=F("version") + 1,
+        )
+        invalidate_dashboard_snapshots(assignee_ids(task_ids))
+    return changed
@@ -0,0 +1,67 @@
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import F
+
+from tasks.dashboard import invalidate_dashboard_snapshots
+from tasks.models import Project, Task
+
+
+# Attempts before giving up on tasks that keep changing under the update
+CONFLICT_RETRIES = 3
+
+
+def set_completed(tasks, is_completed, user=None):
+    """
+    Completes (or reopens) the tasks of the ``tasks`` queryset that are in the
+    other state, with a single UPDATE conditional on that state. Only
+    is_completed, completed_by and version are written. Returns the ids of the
+    tasks that changed.
+    """
+    for _ in range(CONFLICT_RETRIES):
+        with transaction.atomic(using=tasks.db):
+            rows = list(
+                tasks.filter(is_completed=not is_completed)
+                .select_for_update()
+                .values_list("pk", "project")
+            )
+            if not rows:
+                return []
+            changed = (
+                Task.objects.using(tasks.db)
+                .filter(pk__in=[pk for pk, _ in rows], is_completed=not is_completed)
+                .update(
+                    is_completed=is_completed,
+                    completed_by=user if is_completed else None,
+                    version=F("version") + 1,
+                )
+            )
+            if changed == len(rows):
+                # What Task.save() and the task_saved signal would do
+                tasks_moved(rows, is_completed)
+                return [pk for pk, _ in rows]
+            # Another request changed some of the tasks since they were read,
+            # where select_for_update() doesn't lock (SQLite). Start over
+            transaction.set_rollback(True)
+    return []
+
+
+def tasks_moved(rows, is_completed):
+    projects_by_count = defaultdict(list)
+    for project_id, count in Counter(project_id for _, project_id in rows).items():
+        projects_by_count[count].append(project_id)
+    for count, project_ids in projects_by_count.items():
+        Project.objects.filter(pk__in=project_ids).move_task_count(is_completed, count)
+
+    assignee_ids = Task.assignees.through.objects.filter(
+        task__in=[pk for pk, _ in rows]
+    ).values_list("employee_id", flat=True)
+    invalidate_dashboard_snapshots(set(assignee_ids))
+
+
+def complete_tasks(tasks, user):
+    return set_completed(tasks, True, user)
+
+
+def reopen_tasks(tasks):
+    return set_completed(tasks, False)
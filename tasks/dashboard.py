@@ -0,0 +1,119 @@
+import asyncio
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from employees.models import Team
+from task_manager_project.generations import (
+    aget_generation,
+    bump_generation,
+    get_generation,
+)
+from tasks.models import Project, Task
+
+DASHBOARD_GENERATION_KEY = "dashboard:generation"
+
+
+def _dashboard_key(generation, user_id):
+    return f"dashboard:{generation}:{user_id}"
+
+
+def open_tasks_for(user):
+    return (
+        Task.objects.filter(assignees=user, is_completed=False)
+        .distinct()
+        .order_by("deadline")
+        .annotate(project_name=F("project__name"), project_slug=F("project__slug"))
+    )
+
+
+def dashboard_querysets(user):
+    user_projects = Project.objects.for_member(user)
+
+    user_teams = Team.objects.filter(members=user).distinct()
+
+    user_tasks = open_tasks_for(user)
+
+    return {
+        "projects": user_projects.values("id", "name", "slug"),
+        "teams": user_teams.values_list("name", flat=True),
+        "tasks": user_tasks.values(
+            "id",
+            "name",
+            "slug",
+            "priority",
+            "deadline",
+            "version",
+            "project_name",
+            "project_slug",
+        ),
+    }
+
+
+def build_dashboard_snapshot(user):
+    return {
+        name: list(queryset) for name, queryset in dashboard_querysets(user).items()
+    }
+
+
+async def _alist(queryset):
+    return [item async for item in queryset]
+
+
+async def abuild_dashboard_snapshot(user):
+    querysets = dashboard_querysets(user)
+    results = await asyncio.gather(*map(_alist, querysets.values()))
+    return dict(zip(querysets, results))
+
+
+def get_dashboard_snapshot(user):
+    key = _dashboard_key(get_generation(DASHBOARD_GENERATION_KEY), user.pk)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = build_dashboard_snapshot(user)
+        cache.set(key, snapshot, settings.DASHBOARD_CACHE_TIMEOUT)
+    return snapshot
+
+
+async def aget_dashboard_snapshot(user):
+    key = _dashboard_key(await aget_generation(DASHBOARD_GENERATION_KEY), user.pk)
+    snapshot = await cache.aget(key)
+    if snapshot is None:
+        snapshot = await abuild_dashboard_snapshot(user)
+        await cache.aset(key, snapshot, settings.DASHBOARD_CACHE_TIMEOUT)
+    return snapshot
+
+
+def _delete_dashboard_snapshots(user_ids):
+    generation = get_generation(DASHBOARD_GENERATION_KEY)
+    cache.delete_many([_dashboard_key(generation, user_id) for user_id in user_ids])
+
+
+def invalidate_dashboard_snapshots(user_ids):
+    # Snapshots rebuilt before the change commits would still show the old data,
+    # so they are dropped once it has committed
+    user_ids = set(user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: _delete_dashboard_snapshots(user_ids))
+
+
+def invalidate_all_dashboard_snapshots():
+    transaction.on_commit(lambda: bump_generation(DASHBOARD_GENERATION_KEY))
+
+
+def team_member_ids(team_ids):
+    return set(
+        get_user_model().objects.filter(teams__in=team_ids).values_list("id", flat=True)
+    )
+
+
+def project_member_ids(project_ids):
+    UserModel = get_user_model()
+    assignee_ids = UserModel.objects.filter(tasks__project__in=project_ids).values_list(
+        "id", flat=True
+    )
+    team_ids = Team.objects.filter(project__in=project_ids).values_list("id", flat=True)
+    return set(assignee_ids) | team_member_ids(team_ids)
@@ -1,8 +1,18 @@
 from django import forms
+from django.contrib.auth import get_user_model
 from django.utils import timezone
-from django_select2.forms import Select2MultipleWidget
 
-from tasks.models import Project, Task
+from employees.widgets import EmployeeWidget, TeamWidget
+from tasks.bulk_actions import (
+    add_task_tags,
+    reassign_tasks,
+    remove_task_tags,
+    set_task_priority,
+    shift_task_deadlines,
+)
+from tasks.completion import complete_tasks, reopen_tasks
+from tasks.models import Project, Task, TaskTag
+from tasks.widgets import TaskTagWidget
 
 
 class ProjectForm(forms.ModelForm):
@@ -12,7 +22,7 @@ class ProjectForm(forms.ModelForm):
         widgets = {
             "name": forms.TextInput(attrs={"placeholder": "Title"}),
             "description": forms.Textarea(attrs={"placeholder": "Description"}),
-            "teams": Select2MultipleWidget(),
+            "teams": TeamWidget(),
         }
 
     def __init__(self, *args, **kwargs):
@@ -55,8 +65,8 @@ class TaskForm(forms.ModelForm):
             "deadline": forms.DateTimeInput(
                 attrs={"type": "datetime-local", "title": "Deadline"}
             ),
-            "assignees": Select2MultipleWidget(),
-            "tags": Select2MultipleWidget(),
+            "assignees": EmployeeWidget(),
+            "tags": TaskTagWidget(),
         }
 
     def clean_deadline(self):
@@ -95,3 +105,75 @@ class TaskSearchForm(forms.Form):
         label="",
         widget=forms.TextInput(attrs={"placeholder": "Search.."}),
     )
+
+
+class TaskBulkActionForm(forms.Form):
+    ACTION_CHOICES = (
+        ("complete", "Complete"),
+        ("reopen", "Reopen"),
+        ("reassign", "Reassign"),
+        ("add_tags", "Add tags"),
+        ("remove_tags", "Remove tags"),
+        ("priority", "Change priority"),
+        ("shift_deadline", "Shift deadline"),
+    )
+    # The field each action needs besides the tasks
+    ACTION_FIELDS = {
+        "reassign": "assignees",
+        "add_tags": "tags",
+        "remove_tags": "tags",
+        "priority": "priority",
+        "shift_deadline": "days",
+    }
+
+    action = forms.ChoiceField(choices=ACTION_CHOICES)
+    tasks = forms.ModelMultipleChoiceField(queryset=Task.objects.none())
+    assignees = forms.ModelMultipleChoiceField(
+        queryset=get_user_model().objects.only("pk"),
+        required=False,
+        widget=EmployeeWidget(),
+    )
+    tags = forms.ModelMultipleChoiceField(
+        queryset=TaskTag.objects.only("pk"), required=False, widget=TaskTagWidget()
+    )
+    priority = forms.ChoiceField(choices=Task.PRIORITY_CHOICES, required=False)
+    days = forms.IntegerField(
+        required=False,
+        widget=forms.NumberInput(attrs={"placeholder": "Days, e.g. 7 or -2"}),
+    )
+
+    def __init__(self, *args, project, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["tasks"].queryset = Task.objects.filter(project=project).only("pk")
+        field_name = self.ACTION_FIELDS.get(self.data.get("action"))
+        if field_name:
+            self.fields[field_name].required = True
+        for field_name, field in self.fields.items():
+            field.widget.attrs.update({"class": "form-control"})
+            if field_name in ("action", "priority"):
+                field.widget.attrs["class"] += " form-select"
+        # Select2 measures hidden selects as zero wide
+        for field_name in ("assignees", "tags"):
+            self.fields[field_name].widget.attrs["style"] = "width: 100%"
+
+    def save(self, user):
+        """Applies the action, and returns the number of tasks it changed."""
+        action = self.cleaned_data["action"]
+        task_ids = [task.pk for task in self.cleaned_data["tasks"]]
+        if action in ("complete", "reopen"):
+            tasks = Task.objects.filter(pk__in=task_ids)
+            if action == "complete":
+                return len(complete_tasks(tasks, user))
+            return len(reopen_tasks(tasks))
+        if action == "priority":
+            return set_task_priority(task_ids, self.cleaned_data["priority"])
+        if action == "shift_deadline":
+            return shift_task_deadlines(task_ids, self.cleaned_data["days"])
+
+        if action == "reassign":
+            employee_ids = [employee.pk for employee in self.cleaned_data["assignees"]]
+            return reassign_tasks(task_ids, employee_ids)
+        tag_ids = [tag.pk for tag in self.cleaned_data["tags"]]
+        if action == "add_tags":
+            return add_task_tags(task_ids, tag_ids)
+        return remove_task_tags(task_ids, tag_ids)
@@ -0,0 +1,80 @@
+import hashlib
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import caches
+from django.template.loader import get_template, render_to_string
+from django.utils.safestring import mark_safe
+
+from task_manager_project.batch_loading import related_ids
+from task_manager_project.generations import bump_generation, get_generation
+from tasks.models import Task
+from tasks.rendering import RenderContext
+
+TASK_ROWS_GENERATION_KEY = "task-rows:generation"
+
+
+def invalidate_all_task_rows():
+    # For changes to names rendered inside rows (types, tags, employees, projects)
+    bump_generation(TASK_ROWS_GENERATION_KEY)
+
+
+@lru_cache
+def template_fingerprint(template_name):
+    # Rows rendered by the templates of a previous deploy are not reused
+    source = get_template(template_name).template.source
+    return hashlib.md5(source.encode()).hexdigest()[:8]
+
+
+def task_row_key(generation, template_name, row):
+    # The deadline colour is part of the key, so rows roll over to the next
+    # bucket without being invalidated. So is the project of dashboard rows,
+    # which project renames don't version
+    project = row.get("project_slug"), row.get("project_name")
+    return (
+        f"task-row:{generation}:{template_name}:"
+        f"{template_fingerprint(template_name)}:"
+        f"{row['id']}:{row.get('version')}:{row['deadline_coloring']}:"
+        f"{hashlib.md5(repr(project).encode()).hexdigest()[:8]}"
+    )
+
+
+def load_task_rows(pks):
+    """
+    Loads tasks for rendering rows in a fixed number of queries: one for the
+    tasks with their type, one each for assignee ids and tags.
+    """
+    tasks = list(Task.objects.filter(pk__in=pks).with_detail_relations())
+    assignee_ids = related_ids(tasks, "assignees")
+    for task in tasks:
+        task.assignee_ids = assignee_ids[task.pk]
+    return tasks
+
+
+def render_task_rows(template_name, rows, load=None, context=None):
+    """
+    Renders one fragment per row, reusing cached fragments. Rows are dicts
+    with at least id, version and deadline; `load(pks)` returns the tasks to
+    render for cache misses, otherwise the rows themselves are rendered.
+    Rows and loaded tasks are annotated through the request's `context`.
+    """
+    context = context or RenderContext()
+    context.annotate(rows)
+    generation = get_generation(TASK_ROWS_GENERATION_KEY)
+    keys = [task_row_key(generation, template_name, row) for row in rows]
+    fragments = caches["task_rows"].get_many(keys)
+
+    missing = {row["id"]: key for row, key in zip(rows, keys) if key not in fragments}
+    if missing:
+        if load is None:
+            tasks = {row["id"]: row for row in rows if row["id"] in missing}
+        else:
+            tasks = {task.pk: task for task in context.annotate(load(list(missing)))}
+        rendered = {
+            missing[pk]: render_to_string(template_name, {"task": task})
+            for pk, task in tasks.items()
+        }
+        caches["task_rows"].set_many(rendered, settings.TASK_ROW_CACHE_TIMEOUT)
+        fragments.update(rendered)
+
+    return [mark_safe(fragments[key]) for key in keys if key in fragments]
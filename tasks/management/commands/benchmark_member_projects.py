@@ -0,0 +1,134 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from employees.models import Position, Team
+from employees.utils import preset_slugs
+from tasks.models import Project, Task, TaskType
+
+EMPLOYEES_NUM = 500
+TEAMS_NUM = 50
+TEAM_SIZE = 10
+TASKS_PER_PROJECT = 100
+BATCH_SIZE = 5000
+
+
+def union_projects(user):
+    projects_by_tasks = Project.objects.filter(tasks__assignees=user).distinct()
+    projects_by_teams = Project.objects.filter(teams__members=user).distinct()
+    return projects_by_tasks | projects_by_teams.exclude(
+        id__in=projects_by_tasks.values("id")
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the old dashboard projects union with Project.objects.for_member "
+        "on generated data. All generated rows are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[10_000, 100_000, 1_000_000],
+            help="Numbers of tasks to benchmark against",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Timed runs per query"
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        for size in options["sizes"]:
+            with transaction.atomic():
+                user = self.seed(size, random.Random(options["seed"]))
+                self.report(size, user, options["repeat"])
+                transaction.set_rollback(True)
+
+    def seed(self, size, rng):
+        position = Position.objects.create(name="Benchmark")
+        task_type = TaskType.objects.create(name="Benchmark")
+        UserModel = get_user_model()
+
+        with preset_slugs(UserModel, Team, Project, Task):
+            employees = UserModel.objects.bulk_create(
+                UserModel(
+                    username=f"bench-{i}",
+                    slug=f"bench-{i}",
+                    password="!",
+                    position=position,
+                )
+                for i in range(EMPLOYEES_NUM)
+            )
+            teams = Team.objects.bulk_create(
+                Team(name=f"Bench team {i}", slug=f"bench-team-{i}")
+                for i in range(TEAMS_NUM)
+            )
+            Team.members.through.objects.bulk_create(
+                Team.members.through(team=team, employee=employee)
+                for team in teams
+                for employee in rng.sample(employees, TEAM_SIZE)
+            )
+
+            projects = Project.objects.bulk_create(
+                Project(name=f"Bench project {i}", slug=f"bench-project-{i}")
+                for i in range(max(size // TASKS_PER_PROJECT, 1))
+            )
+            Project.teams.through.objects.bulk_create(
+                Project.teams.through(project=project, team=team)
+                for project in projects
+                for team in rng.sample(teams, 2)
+            )
+
+            deadline = timezone.now() + timedelta(days=1)
+            for start in range(0, size, BATCH_SIZE):
+                tasks = Task.objects.bulk_create(
+                    Task(
+                        name=f"Bench task {i}",
+                        slug=f"bench-task-{i}",
+                        project=rng.choice(projects),
+                        deadline=deadline,
+                        priority=rng.choice("1234"),
+                        task_type=task_type,
+                    )
+                    for i in range(start, min(start + BATCH_SIZE, size))
+                )
+                Task.assignees.through.objects.bulk_create(
+                    Task.assignees.through(task=task, employee=employee)
+                    for task in tasks
+                    for employee in rng.sample(employees, 2)
+                )
+
+        return employees[0]
+
+    def report(self, size, user, repeat):
+        expressions = {
+            "union": lambda: list(union_projects(user).values_list("id", flat=True)),
+            "for_member": lambda: list(
+                Project.objects.for_member(user).values_list("id", flat=True)
+            ),
+        }
+        results = {}
+        for name, run in expressions.items():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                results[name] = run()
+                timings.append(time.perf_counter() - started)
+            self.stdout.write(
+                f"{size:>9} tasks  {name:<10} "
+                f"median {statistics.median(timings) * 1000:8.2f} ms  "
+                f"min {min(timings) * 1000:8.2f} ms  "
+                f"({len(results[name])} projects)"
+            )
+
+        if sorted(results["union"]) != sorted(results["for_member"]):
+            self.stderr.write(self.style.ERROR("Query results differ"))
@@ -0,0 +1,126 @@
+import statistics
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.template.backends.django import DjangoTemplates
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.safestring import mark_safe
+
+from employees.models import Position
+from employees.utils import preset_slugs
+from tasks.forms import TaskSearchForm
+from tasks.fragments import load_task_rows
+from tasks.models import Project, Task, TaskTag, TaskType
+
+FILESYSTEM_LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+LOADER_CONFIGS = {
+    "uncached": FILESYSTEM_LOADERS,
+    "cached": [("django.template.loaders.cached.Loader", FILESYSTEM_LOADERS)],
+    "cached+inline": settings.TEMPLATES[0]["OPTIONS"]["loaders"],
+}
+
+
+def template_backend(loaders):
+    config = settings.TEMPLATES[0]
+    return DjangoTemplates(
+        {
+            "NAME": "benchmark",
+            "DIRS": config["DIRS"],
+            "APP_DIRS": False,
+            "OPTIONS": {**config["OPTIONS"], "loaders": loaders},
+        }
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Renders a project page with every task row rendered from its template "
+        "(as on a cold fragment cache) under different template loader setups. "
+        "All generated rows are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=500)
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="Timed renders per setup"
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            project, user = self.seed(options["tasks"])
+            tasks = load_task_rows(project.tasks.values_list("pk", flat=True))
+            request = RequestFactory().get(
+                reverse("tasks:project-detail", args=[project.slug])
+            )
+            request.user = user
+
+            for name, loaders in LOADER_CONFIGS.items():
+                backend = template_backend(loaders)
+                timings = []
+                for _ in range(options["repeat"]):
+                    started = time.perf_counter()
+                    self.render(backend, project, tasks, request)
+                    timings.append(time.perf_counter() - started)
+                timings.sort()
+                self.stdout.write(
+                    f"{len(tasks):>5} tasks  {name:<14} "
+                    f"median {statistics.median(timings) * 1000:8.2f} ms  "
+                    f"p95 {timings[int(len(timings) * 0.95) - 1] * 1000:8.2f} ms"
+                )
+            transaction.set_rollback(True)
+
+    def seed(self, size):
+        position = Position.objects.create(name="Benchmark")
+        user = get_user_model().objects.create_user(
+            username="bench-user", first_name="Bench", position=position
+        )
+        task_type = TaskType.objects.create(name="Benchmark")
+        tag = TaskTag.objects.create(name="benchmark")
+        project = Project.objects.create(name="Bench project")
+
+        deadline = timezone.now()
+        with preset_slugs(Task):
+            tasks = Task.objects.bulk_create(
+                Task(
+                    name=f"Bench task {i}",
+                    slug=f"bench-task-{i}",
+                    project=project,
+                    deadline=deadline + timedelta(days=i % 7 - 2),
+                    priority=str(i % 4 + 1),
+                    is_completed=i % 5 == 0,
+                    completed_by=user if i % 5 == 0 else None,
+                    task_type=task_type,
+                )
+                for i in range(size)
+            )
+        Task.assignees.through.objects.bulk_create(
+            Task.assignees.through(task=task, employee=user) for task in tasks
+        )
+        Task.tags.through.objects.bulk_create(
+            Task.tags.through(task=task, tasktag=tag) for task in tasks
+        )
+        return project, user
+
+    def render(self, backend, project, tasks, request):
+        row = backend.get_template("tasks/includes/project_task_row.html")
+        task_rows = [mark_safe(row.render({"task": task})) for task in tasks]
+        page = backend.get_template("tasks/projects/project_detail.html")
+        return page.render(
+            {
+                "project": project,
+                "object": project,
+                "tasks": tasks,
+                "task_rows": task_rows,
+                "search_form": TaskSearchForm(),
+            },
+            request,
+        )
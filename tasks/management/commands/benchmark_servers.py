@@ -0,0 +1,205 @@
+import http.client
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.urls import reverse
+
+from tasks.models import Project
+
+STARTUP_TIMEOUT = 30
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def server_command(server, port, workers):
+    if server == "wsgi":
+        return [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "task_manager_project.wsgi:application",
+            "--workers",
+            str(workers),
+            "--bind",
+            f"127.0.0.1:{port}",
+        ]
+    return [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "task_manager_project.asgi:application",
+        "--workers",
+        str(workers),
+        "--port",
+        str(port),
+        "--no-access-log",
+    ]
+
+
+def wait_for_port(port, process):
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise CommandError(f"Server exited with status {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise CommandError(f"Server did not listen on port {port}")
+
+
+def percentile(timings, fraction):
+    return timings[max(int(len(timings) * fraction) - 1, 0)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs the app under gunicorn sync workers (WSGI, sync views) and uvicorn "
+        "workers (ASGI, async views) with the same number of workers, and loads "
+        "the dashboard and project pages with concurrent keep-alive clients. "
+        "Uses the existing data of the configured database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument(
+            "--concurrency", type=int, default=16, help="Concurrent clients"
+        )
+        parser.add_argument(
+            "--duration", type=float, default=10, help="Seconds of load per URL"
+        )
+        parser.add_argument(
+            "--servers", nargs="+", choices=["wsgi", "asgi"], default=["wsgi", "asgi"]
+        )
+        parser.add_argument("--username", help="Defaults to the busiest assignee")
+
+    def handle(self, *args, **options):
+        user = self.get_user(options["username"])
+        project = Project.objects.for_member(user).order_by("pk").first()
+        if project is None:
+            raise CommandError(f"{user} is not a member of any project")
+        paths = [
+            reverse("tasks:dashboard"),
+            reverse("tasks:project-list"),
+            reverse("tasks:project-detail", args=[project.slug]),
+        ]
+
+        session = self.login(user)
+        try:
+            for server in options["servers"]:
+                self.benchmark(server, paths, session.session_key, options)
+        finally:
+            session.delete()
+
+    def get_user(self, username):
+        UserModel = get_user_model()
+        if username:
+            try:
+                return UserModel.objects.get(username=username)
+            except UserModel.DoesNotExist:
+                raise CommandError(f"No employee named {username}")
+        user = (
+            UserModel.objects.filter(tasks__isnull=False)
+            .alias(task_total=Count("tasks"))
+            .order_by("-task_total")
+            .first()
+        )
+        if user is None:
+            raise CommandError("No employee has tasks, load some data first")
+        return user
+
+    def login(self, user):
+        session = import_module(settings.SESSION_ENGINE).SessionStore()
+        session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.save()
+        return session
+
+    def benchmark(self, server, paths, session_key, options):
+        port = free_port()
+        env = {
+            **os.environ,
+            "DJANGO_ASYNC_VIEWS": str(server == "asgi"),
+            "WEB_CONCURRENCY": str(options["workers"]),
+        }
+        process = subprocess.Popen(
+            server_command(server, port, options["workers"]),
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_for_port(port, process)
+            for path in paths:
+                # Warms up every worker's caches before timing
+                self.load(port, path, session_key, options["concurrency"], 1)
+                timings, errors = self.load(
+                    port,
+                    path,
+                    session_key,
+                    options["concurrency"],
+                    options["duration"],
+                )
+                self.report(server, path, timings, errors, options["duration"])
+        finally:
+            process.terminate()
+            process.wait()
+
+    def load(self, port, path, session_key, concurrency, duration):
+        headers = {"Cookie": f"{settings.SESSION_COOKIE_NAME}={session_key}"}
+        deadline = time.monotonic() + duration
+        timings, errors = [], []
+
+        def client():
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            try:
+                while time.monotonic() < deadline:
+                    started = time.perf_counter()
+                    try:
+                        connection.request("GET", path, headers=headers)
+                        response = connection.getresponse()
+                        response.read()
+                    except (OSError, http.client.HTTPException) as e:
+                        errors.append(repr(e))
+                        connection.close()
+                        continue
+                    if response.status != 200:
+                        errors.append(f"HTTP {response.status}")
+                        continue
+                    timings.append(time.perf_counter() - started)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=client) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return sorted(timings), errors
+
+    def report(self, server, path, timings, errors, duration):
+        if not timings:
+            raise CommandError(f"{server} {path}: every request failed: {errors[:3]}")
+        self.stdout.write(
+            f"{server:<5} {path:<40} {len(timings) / duration:8.1f} req/s  "
+            f"p50 {statistics.median(timings) * 1000:8.2f} ms  "
+            f"p95 {percentile(timings, 0.95) * 1000:8.2f} ms  "
+            f"errors {len(errors)}"
+        )
@@ -0,0 +1,50 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from employees.backends import users_by_email
+from employees.models import Invitation
+from tasks.dashboard import open_tasks_for
+from tasks.models import Project
+
+
+class Command(BaseCommand):
+    help = (
+        "Prints the query plan of the hot view queries (login, dashboard, "
+        "project and invitation lists) to check that they use their indexes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run the queries and report actual timings (PostgreSQL only)",
+        )
+
+    def handle(self, *args, **options):
+        explain_options = {}
+        if options["analyze"]:
+            if connection.vendor != "postgresql":
+                raise CommandError("--analyze is only supported on PostgreSQL")
+            explain_options = {"analyze": True, "buffers": True}
+
+        for name, queryset in self.queries():
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(queryset.explain(**explain_options))
+            self.stdout.write("")
+
+    def queries(self):
+        user = get_user_model().objects.exclude(email="").first()
+        project = Project.objects.first()
+        if user is None or project is None:
+            raise CommandError(
+                "Needs at least one employee with an email and a project"
+            )
+
+        return [
+            ("Login by email", users_by_email(user.email)),
+            ("Dashboard open tasks", open_tasks_for(user)),
+            ("Project tasks", project.tasks.all()),
+            ("Project list", Project.objects.order_by("-created_at", "name", "pk")[:6]),
+            ("Invitation list", Invitation.objects.order_by("-created_at", "pk")[:6]),
+        ]
@@ -0,0 +1,192 @@
+import json
+import time
+from collections import defaultdict
+from itertools import groupby, islice
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from employees.names import invalidate_all_display_names
+from employees.search import update_search_index
+from employees.utils import preset_slugs, preset_timestamps, unique_slugs
+from tasks.dashboard import invalidate_all_dashboard_snapshots
+from tasks.models import Project
+
+# Models in dependency order, each with the field that identifies an existing row.
+# Fixtures list their records in this order, as dumpdata writes them
+NATURAL_KEYS = {
+    "employees.position": "name",
+    "employees.employee": "username",
+    "employees.invitation": "email",
+    "employees.team": "slug",
+    "tasks.tasktype": "name",
+    "tasks.tasktag": "name",
+    "tasks.project": "slug",
+    "tasks.task": "slug",
+}
+
+
+def iter_records(path, chunk_size=64 * 1024):
+    # Decodes the top-level JSON array one record at a time instead of
+    # loading the whole fixture
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as fixture:
+        buffer = fixture.read(chunk_size).lstrip()
+        if not buffer.startswith("["):
+            raise CommandError(f"{path} is not a JSON fixture")
+        buffer = buffer[1:]
+        while True:
+            buffer = buffer.lstrip().removeprefix(",").lstrip()
+            if buffer.startswith("]"):
+                return
+            try:
+                record, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                chunk = fixture.read(chunk_size)
+                if not chunk:
+                    raise CommandError(f"{path} ended unexpectedly")
+                buffer += chunk
+                continue
+            yield record
+            buffer = buffer[end:]
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Loads a JSON fixture with bulk inserts, skipping records that already "
+        "exist by natural key"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("fixture")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        self.batch_size = options["batch_size"]
+        started = time.perf_counter()
+
+        # fixture pk -> database pk, per model
+        self.pks = defaultdict(dict)
+        self.created = defaultdict(int)
+        self.skipped = 0
+        labels = list(NATURAL_KEYS)
+        loaded = 0
+        with transaction.atomic():
+            # Records are inserted a batch at a time as they are read, so a
+            # model's references are resolved once every earlier model is loaded
+            records = iter_records(options["fixture"])
+            for label, model_records in groupby(records, lambda r: r["model"]):
+                if label not in NATURAL_KEYS:
+                    raise CommandError(f"fastload does not support {label}")
+                if labels.index(label) < loaded:
+                    raise CommandError(
+                        f"{label} records must come before {labels[loaded]} records"
+                    )
+                loaded = labels.index(label)
+                model = apps.get_model(label)
+                for batch in batched(model_records, self.batch_size):
+                    self.load_batch(model, NATURAL_KEYS[label], batch)
+
+            if self.created[get_user_model()]:
+                invalidate_all_display_names()
+            if any(self.created.values()):
+                Project.objects.recount_tasks()
+                invalidate_all_dashboard_snapshots()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {sum(self.created.values())} objects, skipped "
+                f"{self.skipped} existing in {time.perf_counter() - started:.2f}s"
+            )
+        )
+
+    def resolve(self, field, value):
+        if value is None:
+            return None
+        # references to rows outside the fixture are taken as database pks
+        return self.pks[field.related_model].get(value, value)
+
+    def load_batch(self, model, key, records):
+        key_field = model._meta.get_field(key)
+        values = [key_field.to_python(record["fields"][key]) for record in records]
+        existing = dict(
+            model.objects.filter(**{f"{key}__in": values})
+            .order_by()
+            .values_list(key, "pk")
+        )
+
+        new_records = []
+        for record, value in zip(records, values):
+            pk = existing.get(value)
+            if pk is None:
+                new_records.append(record)
+            else:
+                self.pks[model][record.get("pk")] = pk
+        self.skipped += len(records) - len(new_records)
+        if not new_records:
+            return
+
+        objects, m2m = [], []
+        for record in new_records:
+            obj = model()
+            relations = {}
+            for name, value in record["fields"].items():
+                field = model._meta.get_field(name)
+                if field.many_to_many:
+                    relations[field] = value
+                elif field.is_relation:
+                    setattr(obj, field.attname, self.resolve(field, value))
+                else:
+                    setattr(obj, field.attname, field.to_python(value))
+            objects.append(obj)
+            m2m.append(relations)
+
+        has_slug = any(field.name == "slug" for field in model._meta.fields)
+        if has_slug and key != "slug":
+            slugs = unique_slugs(model, [obj.slug for obj in objects])
+            for obj, slug in zip(objects, slugs):
+                obj.slug = slug
+
+        slugged = [model] if has_slug else []
+        with preset_slugs(*slugged), preset_timestamps(model):
+            objects = model.objects.bulk_create(objects, batch_size=self.batch_size)
+        for record, obj in zip(new_records, objects):
+            self.pks[model][record.get("pk")] = obj.pk
+
+        self.load_m2m(model, objects, m2m)
+        self.created[model] += len(objects)
+        if model is get_user_model():
+            update_search_index(
+                model.objects.filter(pk__in=[obj.pk for obj in objects]).select_related(
+                    "position"
+                )
+            )
+
+    def load_m2m(self, model, objects, m2m):
+        rows = defaultdict(list)
+        for obj, relations in zip(objects, m2m):
+            for field, values in relations.items():
+                through = field.remote_field.through
+                source = field.m2m_field_name()
+                target = field.m2m_reverse_field_name()
+                rows[through].extend(
+                    through(
+                        **{
+                            f"{source}_id": obj.pk,
+                            f"{target}_id": self.resolve(field, value),
+                        }
+                    )
+                    for value in values
+                )
+        for through, through_rows in rows.items():
+            through.objects.bulk_create(
+                through_rows, batch_size=self.batch_size, ignore_conflicts=True
+            )
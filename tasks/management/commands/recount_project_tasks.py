@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from tasks.models import Project
+
+
+class Command(BaseCommand):
+    help = "Recalculates the denormalized active/completed task counters of projects"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "slugs", nargs="*", help="Slugs of projects to repair (all by default)"
+        )
+
+    def handle(self, *args, **options):
+        projects = Project.objects.all()
+        if options["slugs"]:
+            projects = projects.filter(slug__in=options["slugs"])
+
+        updated = projects.recount_tasks()
+        self.stdout.write(self.style.SUCCESS(f"Recounted tasks of {updated} projects"))
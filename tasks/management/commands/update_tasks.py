@@ -1,22 +1,63 @@
 import random
+import time
 from datetime import timedelta
+from itertools import islice
+
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
+
+from tasks.dashboard import invalidate_all_dashboard_snapshots
 from tasks.models import Task
 
+
 class Command(BaseCommand):
-    help = 'Randomly updates task deadlines to one of three choices: -2 days, +1 day, or +3 days'
+    help = "Randomly updates task deadlines to one of three choices: -2 days, +1 day, or +5 days"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--seed", type=int, help="Seed for reproducible deadlines")
 
-    def handle(self, *args, **kwargs):
-        tasks = Task.objects.all()
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        rng = random.Random(options["seed"])
         now = timezone.now()
+        deadlines = [
+            now - timedelta(days=2),
+            now + timedelta(days=1),
+            now + timedelta(days=5),
+        ]
 
-        for task in tasks:
-            deadline_choice = random.choice([
-                now - timedelta(days=2),
-                now + timedelta(days=1),
-                now + timedelta(days=5),
-            ])
+        started = time.perf_counter()
+        updated = 0
+        with transaction.atomic():
+            pks = (
+                Task.objects.order_by("pk")
+                .values_list("pk", flat=True)
+                .iterator(chunk_size=batch_size)
+            )
+            while batch := list(islice(pks, batch_size)):
+                # bulk_update issues a single CASE ... WHEN UPDATE per batch
+                Task.objects.bulk_update(
+                    [
+                        Task(
+                            pk=pk,
+                            deadline=rng.choice(deadlines),
+                            version=F("version") + 1,
+                        )
+                        for pk in batch
+                    ],
+                    fields=["deadline", "version"],
+                )
+                updated += len(batch)
+            # bulk_update skips the signals that keep dashboards fresh
+            invalidate_all_dashboard_snapshots()
 
-            task.deadline = deadline_choice
-            task.save()
\ No newline at end of file
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Updated {updated} task deadlines in {elapsed:.2f}s "
+                f"({updated / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+        )
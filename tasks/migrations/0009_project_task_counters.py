@@ -0,0 +1,53 @@
+# Generated by Django 5.1.1 on 2026-10-18 20:12
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def count_project_tasks(apps, schema_editor):
+    Project = apps.get_model("tasks", "Project")
+    Task = apps.get_model("tasks", "Task")
+
+    def count_tasks(is_completed):
+        tasks = (
+            Task.objects.filter(project=OuterRef("pk"), is_completed=is_completed)
+            .order_by()
+            .values("project")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return Coalesce(Subquery(tasks), Value(0))
+
+    Project.objects.update(
+        active_task_count=count_tasks(False),
+        completed_task_count=count_tasks(True),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0009_alter_team_members"),
+        ("tasks", "0008_alter_task_slug"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="active_task_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="completed_task_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["-created_at", "name"], name="project_ordering_idx"
+            ),
+        ),
+        migrations.RunPython(count_project_tasks, migrations.RunPython.noop),
+    ]
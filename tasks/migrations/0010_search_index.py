@@ -0,0 +1,99 @@
+from django.db import migrations
+
+SEARCH_CONFIG = "english"
+
+POSTGRES_FORWARD = (
+    [
+        f"""
+    ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(name, '')), 'A')
+        || setweight(
+            to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(description, '')), 'B'
+        )
+    ) STORED
+    """
+        for table in ("tasks_task", "tasks_project")
+    ]
+    + [
+        "CREATE INDEX tasks_task_search_vector_idx "
+        "ON tasks_task USING GIN (search_vector)",
+        "CREATE INDEX tasks_project_search_vector_idx "
+        "ON tasks_project USING GIN (search_vector)",
+    ]
+)
+
+POSTGRES_BACKWARD = [
+    "ALTER TABLE tasks_task DROP COLUMN search_vector",
+    "ALTER TABLE tasks_project DROP COLUMN search_vector",
+]
+
+
+def sqlite_fts_table(table, extra_columns=()):
+    fts_table = f"{table}_fts"
+    columns = ["name", "description", *extra_columns]
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    fts_columns = ", ".join(
+        ["name", "description", *(f"{column} UNINDEXED" for column in extra_columns)]
+    )
+    delete_old = (
+        f"INSERT INTO {fts_table} ({fts_table}, rowid, {column_list}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    insert_new = (
+        f"INSERT INTO {fts_table} (rowid, {column_list}) "
+        f"VALUES (new.id, {new_values});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE {fts_table} USING fts5("
+        f"{fts_columns}, content='{table}', content_rowid='id', "
+        "tokenize='porter unicode61')",
+        f"CREATE TRIGGER {table}_fts_insert AFTER INSERT ON {table} "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER {table}_fts_delete AFTER DELETE ON {table} "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER {table}_fts_update AFTER UPDATE ON {table} "
+        f"BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')",
+    ]
+
+
+SQLITE_FORWARD = sqlite_fts_table("tasks_task", ["project_id"]) + sqlite_fts_table(
+    "tasks_project"
+)
+
+SQLITE_BACKWARD = [
+    f"{statement} {table}{suffix}"
+    for table in ("tasks_task", "tasks_project")
+    for statement, suffix in (
+        ("DROP TRIGGER IF EXISTS", "_fts_insert"),
+        ("DROP TRIGGER IF EXISTS", "_fts_delete"),
+        ("DROP TRIGGER IF EXISTS", "_fts_update"),
+        ("DROP TABLE IF EXISTS", "_fts"),
+    )
+]
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0009_project_task_counters"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD}),
+            run_for_vendor(
+                {"postgresql": POSTGRES_BACKWARD, "sqlite": SQLITE_BACKWARD}
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.1 on 2026-10-18 21:05
+
+from django.db import migrations
+
+# Case-insensitive prefix lookups (istartswith) of the tag autocomplete widget
+FORWARD = {
+    "postgresql": [
+        "CREATE INDEX tasks_tasktag_name_prefix_idx "
+        "ON tasks_tasktag (UPPER(name::text) text_pattern_ops)"
+    ],
+    "sqlite": [
+        "CREATE INDEX tasks_tasktag_name_prefix_idx "
+        "ON tasks_tasktag (name COLLATE NOCASE)"
+    ],
+}
+
+BACKWARD = {
+    "postgresql": ["DROP INDEX IF EXISTS tasks_tasktag_name_prefix_idx"],
+    "sqlite": ["DROP INDEX IF EXISTS tasks_tasktag_name_prefix_idx"],
+}
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0011_task_version"),
+    ]
+
+    operations = [
+        migrations.RunPython(run_for_vendor(FORWARD), run_for_vendor(BACKWARD)),
+    ]
@@ -0,0 +1,60 @@
+from django.db import migrations
+
+# The FTS update triggers of 0010 fire on every update, e.g. version bumps and
+# completions. Fire them only when an indexed column changes
+
+
+def sqlite_update_trigger(table, columns, of_columns=True):
+    fts_table = f"{table}_fts"
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    event = f"UPDATE OF {column_list}" if of_columns else "UPDATE"
+    return [
+        f"DROP TRIGGER IF EXISTS {table}_fts_update",
+        f"CREATE TRIGGER {table}_fts_update AFTER {event} ON {table} BEGIN "
+        f"INSERT INTO {fts_table} ({fts_table}, rowid, {column_list}) "
+        f"VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts_table} (rowid, {column_list}) "
+        f"VALUES (new.id, {new_values}); END",
+    ]
+
+
+FTS_COLUMNS = {
+    "tasks_task": ("name", "description", "project_id"),
+    "tasks_project": ("name", "description"),
+}
+
+SQLITE_FORWARD = [
+    statement
+    for table, columns in FTS_COLUMNS.items()
+    for statement in sqlite_update_trigger(table, columns)
+]
+
+SQLITE_BACKWARD = [
+    statement
+    for table, columns in FTS_COLUMNS.items()
+    for statement in sqlite_update_trigger(table, columns, of_columns=False)
+]
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0013_task_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor({"sqlite": SQLITE_FORWARD}),
+            run_for_vendor({"sqlite": SQLITE_BACKWARD}),
+        ),
+    ]
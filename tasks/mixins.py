@@ -1,7 +1,7 @@
-from django.db.models import Case, When, Q
 from django.views.generic import ListView
 
 from tasks.forms import ProjectSearchForm
+from tasks.search import search
 
 
 class ProjectSearchMixin(ListView):
@@ -12,19 +12,6 @@ class ProjectSearchMixin(ListView):
         if form.is_valid():
             query = form.cleaned_data["query"]
             if query:
-                queryset = (
-                    queryset.annotate(
-                        name_match=Case(
-                            When(name__icontains=query, then=1),
-                            default=0,
-                        ),
-                        task_match=Case(
-                            When(tasks__name__icontains=query, then=1),
-                            default=0,
-                        ),
-                    )
-                    .filter(Q(name__icontains=query) | Q(tasks__name__icontains=query))
-                    .order_by("-name_match", "-task_match")
-                )
+                queryset = search(query, queryset=queryset)
 
         return queryset
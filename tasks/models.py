@@ -1,10 +1,30 @@
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Coalesce
 from django_extensions.db.fields import AutoSlugField
 
 from employees.models import Team
 
 
+class TaskQuerySet(models.QuerySet):
+    def with_detail_relations(self):
+        # What a task row renders besides employee names, which come from
+        # employees.names (see tasks.fragments.load_task_rows)
+        return self.select_related("task_type").prefetch_related(
+            Prefetch("tags", queryset=TaskTag.objects.only("name"))
+        )
+
+
 class Task(models.Model):
     PRIORITY_CHOICES = (
         ("1", "Urgent"),
@@ -32,13 +52,57 @@ class Task(models.Model):
     )
     tags = models.ManyToManyField("TaskTag", blank=True)
     slug = AutoSlugField(populate_from=["name"], unique=True, max_length=100)
+    # Bumped on every change that affects how the task renders, see
+    # tasks.fragments
+    version = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = TaskQuerySet.as_manager()
 
     class Meta:
         ordering = ("is_completed", "priority", "-deadline", "name")
+        indexes = [
+            # Task tables of the project page, in the default ordering
+            models.Index(
+                fields=["project", "is_completed", "priority", "-deadline", "name"],
+                name="task_project_ordering_idx",
+            ),
+            # Open tasks by deadline, as listed on the dashboard
+            models.Index(
+                fields=["deadline"],
+                condition=Q(is_completed=False),
+                name="task_open_deadline_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            previous = version = None
+            if not self._state.adding:
+                row = (
+                    Task.objects.select_for_update()
+                    .filter(pk=self.pk)
+                    .values_list("project_id", "is_completed", "version")
+                    .first()
+                )
+                if row is not None:
+                    previous, version = row[:2], row[2]
+            if version is not None:
+                self.version = version + 1
+                update_fields = kwargs.get("update_fields")
+                if update_fields is not None:
+                    kwargs["update_fields"] = {*update_fields, "version"}
+            super().save(*args, **kwargs)
+            current = (self.project_id, self.is_completed)
+            if previous != current:
+                if previous is not None:
+                    Project.objects.filter(pk=previous[0]).adjust_task_count(
+                        previous[1], -1
+                    )
+                Project.objects.filter(pk=current[0]).adjust_task_count(current[1], 1)
+
 
 class TaskType(models.Model):
     name = models.CharField(max_length=100)
@@ -54,15 +118,80 @@ class TaskTag(models.Model):
         return self.name
 
 
+TASK_COUNT_FIELDS = ("active_task_count", "completed_task_count")
+
+
+def task_count_field(is_completed):
+    return "completed_task_count" if is_completed else "active_task_count"
+
+
+class ProjectQuerySet(models.QuerySet):
+    def for_member(self, user):
+        assigned = Task.assignees.through.objects.filter(
+            task__project=OuterRef("pk"), employee=user
+        )
+        in_team = self.model.teams.through.objects.filter(
+            project=OuterRef("pk"),
+            team__in=Team.members.through.objects.filter(employee=user).values("team"),
+        )
+        return self.filter(Exists(assigned) | Exists(in_team))
+
+    def adjust_task_count(self, is_completed, delta):
+        field = task_count_field(is_completed)
+        return self.update(**{field: F(field) + delta})
+
+    def move_task_count(self, is_completed, delta):
+        # delta tasks of each project were completed, or reopened
+        to_field = task_count_field(is_completed)
+        from_field = task_count_field(not is_completed)
+        return self.update(
+            **{to_field: F(to_field) + delta, from_field: F(from_field) - delta}
+        )
+
+    def recount_tasks(self):
+        def count_tasks(is_completed):
+            tasks = (
+                Task.objects.filter(project=OuterRef("pk"), is_completed=is_completed)
+                .order_by()
+                .values("project")
+                .annotate(count=Count("pk"))
+                .values("count")
+            )
+            return Coalesce(Subquery(tasks), Value(0))
+
+        return self.update(
+            active_task_count=count_tasks(False),
+            completed_task_count=count_tasks(True),
+        )
+
+
 class Project(models.Model):
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True, null=True)
     teams = models.ManyToManyField(Team, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     slug = AutoSlugField(populate_from=["name"], unique=True)
+    active_task_count = models.PositiveIntegerField(default=0, editable=False)
+    completed_task_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = ProjectQuerySet.as_manager()
 
     class Meta:
         ordering = ["-created_at", "name"]
+        indexes = [
+            models.Index(fields=["-created_at", "name"], name="project_ordering_idx"),
+        ]
 
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        # Task counters are only changed through F() updates, so a stale
+        # instance must never write them back.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in TASK_COUNT_FIELDS
+            ]
+        super().save(*args, **kwargs)
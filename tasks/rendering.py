@@ -0,0 +1,50 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from tasks.models import Task
+
+PRIORITY_LABELS = dict(Task.PRIORITY_CHOICES)
+PRIORITY_COLORS = {"1": "red", "2": "yellow", "3": "green", "4": "grey"}
+DEADLINE_WARNING_PERIOD = timedelta(days=3)
+
+
+class RenderContext:
+    """
+    Values shared by every row rendered for one request, so a page agrees
+    on a single `now` and rows carry precomputed display attributes instead
+    of doing date arithmetic and priority lookups in templates.
+    """
+
+    def __init__(self, now=None):
+        self.now = now or timezone.now()
+        self.warning_after = self.now + DEADLINE_WARNING_PERIOD
+
+    def deadline_coloring(self, deadline):
+        if deadline > self.warning_after:
+            return "success"
+        if deadline <= self.now:
+            return "danger"
+        return "warning"
+
+    def annotate(self, tasks):
+        """
+        Sets deadline_coloring, priority_label and priority_color on tasks,
+        which may be model instances or value dicts.
+        """
+        for task in tasks:
+            if isinstance(task, dict):
+                values = task
+            else:
+                values = task.__dict__
+            values["deadline_coloring"] = self.deadline_coloring(values["deadline"])
+            if "priority" in values:
+                values["priority_label"] = PRIORITY_LABELS.get(values["priority"], "")
+                values["priority_color"] = PRIORITY_COLORS.get(values["priority"], "")
+        return tasks
+
+
+def render_context(request):
+    if not hasattr(request, "_render_context"):
+        request._render_context = RenderContext()
+    return request._render_context
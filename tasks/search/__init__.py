@@ -0,0 +1,34 @@
+import re
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connections
+from django.utils.module_loading import import_string
+
+SEARCH_BACKENDS = {
+    "postgresql": "tasks.search.postgres.PostgresSearchBackend",
+    "sqlite": "tasks.search.sqlite.SQLiteSearchBackend",
+}
+
+
+def search_terms(query):
+    return re.findall(r"\w+", query.lower())
+
+
+@lru_cache
+def _load_backend(path):
+    return import_string(path)()
+
+
+def get_search_backend(using="default"):
+    path = settings.SEARCH_BACKEND or SEARCH_BACKENDS[connections[using].vendor]
+    return _load_backend(path)
+
+
+def search(query, scope=None, queryset=None):
+    """
+    Ranked full-text search. Returns the tasks of the ``scope`` project, or
+    projects matching by their own text or their tasks when no scope is given.
+    """
+    using = queryset.db if queryset is not None else "default"
+    return get_search_backend(using).search(query, scope=scope, queryset=queryset)
@@ -0,0 +1,100 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+from django.db.models import (
+    Exists,
+    Expression,
+    FloatField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Coalesce
+
+from tasks.models import Project, Task
+from tasks.search import search_terms
+
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+
+class StoredSearchVector(Expression):
+    """
+    The generated ``search_vector`` tsvector column (see migration 0010) of
+    the queryset's base table. It is not a model field, so that the models
+    keep working on databases without tsvector support.
+    """
+
+    output_field = SearchVectorField()
+
+    def __init__(self, alias=None):
+        super().__init__()
+        self.alias = alias
+
+    def resolve_expression(self, query=None, *args, **kwargs):
+        clone = self.copy()
+        if clone.alias is None:
+            clone.alias = query.get_initial_alias()
+        return clone
+
+    def relabeled_clone(self, change_map):
+        clone = self.copy()
+        clone.alias = change_map.get(self.alias, self.alias)
+        return clone
+
+    def as_sql(self, compiler, connection):
+        alias = compiler.quote_name_unless_alias(self.alias)
+        return f"{alias}.{connection.ops.quote_name(SEARCH_VECTOR_COLUMN)}", []
+
+
+class PostgresSearchBackend:
+    def search_query(self, query):
+        terms = search_terms(query)
+        if not terms:
+            return None
+        return SearchQuery(
+            " & ".join(f"{term}:*" for term in terms),
+            config=SEARCH_CONFIG,
+            search_type="raw",
+        )
+
+    def matching(self, queryset, search_query):
+        return queryset.alias(search_vector=StoredSearchVector()).filter(
+            search_vector=search_query
+        )
+
+    def search(self, query, scope=None, queryset=None):
+        if scope is not None:
+            queryset = scope.tasks.all() if queryset is None else queryset
+            queryset = queryset.filter(project=scope)
+        elif queryset is None:
+            queryset = Project.objects.all()
+
+        search_query = self.search_query(query)
+        if search_query is None:
+            return queryset.none()
+
+        if scope is not None:
+            return (
+                self.matching(queryset, search_query)
+                .annotate(search_rank=SearchRank(StoredSearchVector(), search_query))
+                .order_by("-search_rank")
+            )
+
+        matching_tasks = self.matching(
+            Task.objects.filter(project=OuterRef("pk")), search_query
+        )
+        task_rank = Subquery(
+            matching_tasks.annotate(rank=SearchRank(StoredSearchVector(), search_query))
+            .order_by("-rank")
+            .values("rank")[:1],
+            output_field=FloatField(),
+        )
+        return (
+            queryset.alias(search_vector=StoredSearchVector())
+            .filter(Q(search_vector=search_query) | Exists(matching_tasks))
+            .annotate(
+                search_rank=SearchRank(StoredSearchVector(), search_query),
+                task_rank=Coalesce(task_rank, Value(0.0)),
+            )
+            .order_by("-search_rank", "-task_rank")
+        )
@@ -0,0 +1,159 @@
+from django.db import connections
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.expressions import RawSQL
+
+from tasks.models import Project
+from tasks.search import search_terms
+
+# Every match is returned, but only the best ones are ranked, the others follow
+# them in primary key order
+RANKED_RESULTS_LIMIT = 500
+
+# bm25() weights for the (name, description) columns of both FTS5 tables
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+# FTS5 tables and their indexed/unindexed content columns
+FTS_COLUMNS = {
+    "tasks_task": ("name", "description", "project_id"),
+    "tasks_project": ("name", "description"),
+}
+
+
+def fts_triggers(table, columns):
+    fts_table = f"{table}_fts"
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    delete_old = (
+        f"INSERT INTO {fts_table} ({fts_table}, rowid, {column_list}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    insert_new = (
+        f"INSERT INTO {fts_table} (rowid, {column_list}) "
+        f"VALUES (new.id, {new_values});"
+    )
+    return {
+        f"{table}_fts_insert": f"AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"{table}_fts_delete": f"AFTER DELETE ON {table} BEGIN {delete_old} END",
+        # Only for the indexed columns, not version bumps or completions
+        f"{table}_fts_update": (
+            f"AFTER UPDATE OF {column_list} ON {table} "
+            f"BEGIN {delete_old} {insert_new} END"
+        ),
+    }
+
+
+def restore_fts_triggers(using="default", **kwargs):
+    # SQLite migrations that alter a table rebuild it, which drops its
+    # triggers. Recreate them after every migrate and reindex what they missed.
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT type, name FROM sqlite_master")
+        existing = set(cursor.fetchall())
+        for table, columns in FTS_COLUMNS.items():
+            fts_table = f"{table}_fts"
+            if ("table", fts_table) not in existing:
+                continue
+            missing = {
+                name: sql
+                for name, sql in fts_triggers(table, columns).items()
+                if ("trigger", name) not in existing
+            }
+            for name, sql in missing.items():
+                cursor.execute(f"CREATE TRIGGER {name} {sql}")
+            if missing:
+                cursor.execute(
+                    f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')"
+                )
+
+
+class SQLiteSearchBackend:
+    """
+    Searches the ``tasks_task_fts``/``tasks_project_fts`` FTS5 tables, kept in
+    sync with their content tables by triggers (see migration 0010).
+    """
+
+    def match_expression(self, query):
+        return " ".join(f'"{term}"*' for term in search_terms(query))
+
+    def ranked_ids(self, using, sql, params):
+        with connections[using].cursor() as cursor:
+            cursor.execute(sql, params)
+            return [row[0] for row in cursor.fetchall()]
+
+    def search(self, query, scope=None, queryset=None):
+        if scope is not None:
+            queryset = scope.tasks.all() if queryset is None else queryset
+            queryset = queryset.filter(project=scope)
+        elif queryset is None:
+            queryset = Project.objects.all()
+
+        match = self.match_expression(query)
+        if not match:
+            return queryset.none()
+
+        if scope is not None:
+            matches = Q(
+                pk__in=RawSQL(
+                    "SELECT rowid FROM tasks_task_fts "
+                    "WHERE tasks_task_fts MATCH %s AND project_id = %s",
+                    [match, scope.pk],
+                )
+            )
+            ids = self.ranked_ids(
+                queryset.db,
+                "SELECT rowid FROM tasks_task_fts "
+                "WHERE tasks_task_fts MATCH %s AND project_id = %s "
+                "ORDER BY bm25(tasks_task_fts, %s, %s) LIMIT %s",
+                [
+                    match,
+                    scope.pk,
+                    NAME_WEIGHT,
+                    DESCRIPTION_WEIGHT,
+                    RANKED_RESULTS_LIMIT,
+                ],
+            )
+        else:
+            matches = Q(
+                pk__in=RawSQL(
+                    "SELECT rowid FROM tasks_project_fts "
+                    "WHERE tasks_project_fts MATCH %s",
+                    [match],
+                )
+            ) | Q(
+                pk__in=RawSQL(
+                    "SELECT project_id FROM tasks_task_fts "
+                    "WHERE tasks_task_fts MATCH %s",
+                    [match],
+                )
+            )
+            project_ids = self.ranked_ids(
+                queryset.db,
+                "SELECT rowid FROM tasks_project_fts WHERE tasks_project_fts MATCH %s "
+                "ORDER BY bm25(tasks_project_fts, %s, %s) LIMIT %s",
+                [match, NAME_WEIGHT, DESCRIPTION_WEIGHT, RANKED_RESULTS_LIMIT],
+            )
+            task_project_ids = self.ranked_ids(
+                queryset.db,
+                "SELECT project_id FROM tasks_task_fts WHERE tasks_task_fts MATCH %s "
+                "ORDER BY bm25(tasks_task_fts, %s, %s) LIMIT %s",
+                [match, NAME_WEIGHT, DESCRIPTION_WEIGHT, RANKED_RESULTS_LIMIT],
+            )
+            ids = list(dict.fromkeys(project_ids + task_project_ids))
+
+        if not ids:
+            return queryset.none()
+        return self.order_by_ids(queryset.filter(matches), ids)
+
+    @staticmethod
+    def order_by_ids(queryset, ids):
+        return queryset.annotate(
+            search_rank=Case(
+                *(When(pk=pk, then=Value(position)) for position, pk in enumerate(ids)),
+                default=Value(len(ids)),
+                output_field=IntegerField(),
+            )
+        ).order_by("search_rank", "pk")
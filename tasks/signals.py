@@ -0,0 +1,142 @@
+from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from employees.models import Team
+from tasks.dashboard import (
+    invalidate_dashboard_snapshots,
+    project_member_ids,
+    team_member_ids,
+)
+from tasks.fragments import invalidate_all_task_rows
+from tasks.models import Project, Task, TaskTag, TaskType
+
+M2M_INVALIDATING_ACTIONS = ("post_add", "post_remove", "pre_clear")
+EMPLOYEE_NAME_FIELDS = {"first_name", "last_name"}
+
+
+def bump_task_versions(task_ids):
+    if task_ids:
+        Task.objects.filter(pk__in=task_ids).update(version=F("version") + 1)
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_dashboard_snapshots(
+            set(instance.assignees.values_list("id", flat=True))
+        )
+
+
+@receiver(pre_delete, sender=Task)
+def task_deleted(sender, instance, **kwargs):
+    invalidate_dashboard_snapshots(set(instance.assignees.values_list("id", flat=True)))
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted_counts(sender, instance, **kwargs):
+    Project.objects.filter(pk=instance.project_id).adjust_task_count(
+        instance.is_completed, -1
+    )
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def task_assignees_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in M2M_INVALIDATING_ACTIONS:
+        return
+    if reverse:
+        user_ids = {instance.pk}
+        if action == "pre_clear":
+            task_ids = set(instance.tasks.values_list("id", flat=True))
+        else:
+            task_ids = pk_set
+    else:
+        task_ids = {instance.pk}
+        if action == "pre_clear":
+            user_ids = set(instance.assignees.values_list("id", flat=True))
+        else:
+            user_ids = pk_set
+    invalidate_dashboard_snapshots(user_ids)
+    bump_task_versions(task_ids)
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+def task_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in M2M_INVALIDATING_ACTIONS:
+        return
+    if not reverse:
+        task_ids = {instance.pk}
+    elif action == "pre_clear":
+        task_ids = set(instance.task_set.values_list("id", flat=True))
+    else:
+        task_ids = pk_set
+    bump_task_versions(task_ids)
+
+
+@receiver(post_save, sender=TaskType)
+@receiver(post_save, sender=TaskTag)
+@receiver(post_delete, sender=TaskTag)
+def task_row_names_changed(sender, created=False, **kwargs):
+    if not created:
+        invalidate_all_task_rows()
+
+
+@receiver(post_save, sender=get_user_model())
+def employee_saved(sender, instance, created, update_fields, **kwargs):
+    if created or (update_fields and EMPLOYEE_NAME_FIELDS.isdisjoint(update_fields)):
+        return
+    invalidate_all_task_rows()
+
+
+@receiver(post_delete, sender=get_user_model())
+def employee_deleted(sender, instance, **kwargs):
+    invalidate_all_task_rows()
+
+
+@receiver(post_save, sender=Project)
+def project_saved(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_dashboard_snapshots(project_member_ids([instance.pk]))
+
+
+@receiver(pre_delete, sender=Project)
+def project_deleted(sender, instance, **kwargs):
+    invalidate_dashboard_snapshots(project_member_ids([instance.pk]))
+
+
+@receiver(m2m_changed, sender=Project.teams.through)
+def project_teams_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in M2M_INVALIDATING_ACTIONS:
+        return
+    if reverse:
+        user_ids = team_member_ids([instance.pk])
+    elif action == "pre_clear":
+        user_ids = team_member_ids(instance.teams.values_list("id", flat=True))
+    else:
+        user_ids = team_member_ids(pk_set)
+    invalidate_dashboard_snapshots(user_ids)
+
+
+@receiver(post_save, sender=Team)
+def team_saved(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_dashboard_snapshots(team_member_ids([instance.pk]))
+
+
+@receiver(pre_delete, sender=Team)
+def team_deleted(sender, instance, **kwargs):
+    invalidate_dashboard_snapshots(team_member_ids([instance.pk]))
+
+
+@receiver(m2m_changed, sender=Team.members.through)
+def team_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in M2M_INVALIDATING_ACTIONS:
+        return
+    if reverse:
+        user_ids = {instance.pk}
+    elif action == "pre_clear":
+        user_ids = set(instance.members.values_list("id", flat=True))
+    else:
+        user_ids = pk_set
+    invalidate_dashboard_snapshots(user_ids)
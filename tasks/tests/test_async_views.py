@@ -0,0 +1,118 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import include, path
+from django.utils import timezone
+
+from employees.models import Position, Team
+from tasks.async_views import (
+    AsyncProjectDetailView,
+    AsyncProjectListView,
+    AsyncUserDashboardView,
+)
+from tasks.dashboard import abuild_dashboard_snapshot, build_dashboard_snapshot
+from tasks.models import Project, Task, TaskType
+from task_manager_project.urls import urlpatterns as project_urlpatterns
+
+async_patterns = [
+    path("", AsyncUserDashboardView.as_view(), name="dashboard"),
+    path("projects/", AsyncProjectListView.as_view(), name="project-list"),
+    path(
+        "projects/<slug:slug>/",
+        AsyncProjectDetailView.as_view(),
+        name="project-detail",
+    ),
+]
+
+urlpatterns = [
+    path("async/", include((async_patterns, "async"))),
+] + project_urlpatterns
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.position = Position.objects.create(name="Test Position")
+        self.employee = get_user_model().objects.create_user(
+            username="testuser", password="Testpass123", position=self.position
+        )
+        self.team = Team.objects.create(name="Test Team")
+        self.team.members.add(self.employee)
+        self.task_type = TaskType.objects.create(name="Test Type")
+        self.projects = [
+            Project.objects.create(name=f"Project {i}", description="alpha")
+            for i in range(7)
+        ]
+        self.task = Task.objects.create(
+            name="Write report",
+            project=self.projects[0],
+            task_type=self.task_type,
+            deadline=timezone.now(),
+        )
+        self.task.assignees.add(self.employee)
+        Task.objects.create(
+            name="Review budget",
+            project=self.projects[0],
+            task_type=self.task_type,
+            deadline=timezone.now(),
+        )
+
+    async def test_anonymous_user_redirected_to_login(self):
+        response = await self.async_client.get("/async/")
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("?next=/async/", response.url)
+
+    async def test_dashboard(self):
+        await self.async_client.aforce_login(self.employee)
+        response = await self.async_client.get("/async/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [task["slug"] for task in response.context["user_tasks"]],
+            [self.task.slug],
+        )
+        self.assertEqual(list(response.context["user_teams"]), ["Test Team"])
+        self.assertContains(response, self.task.name)
+        self.assertGreater(response.query_recorder.count, 0)
+
+    async def test_snapshot_matches_sync_snapshot(self):
+        self.assertEqual(
+            await abuild_dashboard_snapshot(self.employee),
+            await sync_to_async(build_dashboard_snapshot)(self.employee),
+        )
+
+    async def test_project_list_pages(self):
+        await self.async_client.aforce_login(self.employee)
+        response = await self.async_client.get("/async/projects/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["project_list"]), 5)
+        self.assertEqual(response.context["paginator"].count, 7)
+
+        response = await self.async_client.get("/async/projects/?page=last")
+        self.assertEqual(len(response.context["project_list"]), 2)
+
+        response = await self.async_client.get("/async/projects/?page=9")
+        self.assertEqual(response.status_code, 404)
+
+    async def test_project_list_search(self):
+        await self.async_client.aforce_login(self.employee)
+        response = await self.async_client.get("/async/projects/?query=budget")
+        self.assertEqual(list(response.context["project_list"]), [self.projects[0]])
+
+    async def test_project_detail(self):
+        await self.async_client.aforce_login(self.employee)
+        url = f"/async/projects/{self.projects[0].slug}/"
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["project"], self.projects[0])
+        self.assertEqual(len(response.context["task_rows"]), 2)
+
+        response = await self.async_client.get(url, {"query": "report"})
+        self.assertEqual(len(response.context["task_rows"]), 1)
+        self.assertContains(response, self.task.name)
+
+    async def test_unknown_project_is_404(self):
+        await self.async_client.aforce_login(self.employee)
+        response = await self.async_client.get("/async/projects/missing/")
+        self.assertEqual(response.status_code, 404)
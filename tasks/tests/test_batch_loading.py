@@ -0,0 +1,82 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from employees import names
+from employees.models import Position, Team
+from task_manager_project.batch_loading import BatchLoader
+
+
+class BatchLoaderTests(TestCase):
+    def setUp(self):
+        position = Position.objects.create(name="Test Position")
+        self.employees = [
+            get_user_model().objects.create_user(
+                username=f"user{i}", first_name=f"Jane{i}", position=position
+            )
+            for i in range(3)
+        ]
+        self.teams = [Team.objects.create(name=f"Team {i}") for i in range(3)]
+        for team, employee in zip(self.teams, self.employees):
+            team.members.add(employee)
+        self.loader = BatchLoader()
+
+    def test_relation_is_loaded_once_per_batch(self):
+        teams = self.loader.register(Team.objects.order_by("name"))
+
+        with self.assertNumQueries(1):
+            members = [self.loader.load(team, "members") for team in teams]
+        self.assertEqual(members, [[employee] for employee in self.employees])
+
+        same_team = Team.objects.get(pk=teams[0].pk)
+        with self.assertNumQueries(0):
+            self.loader.load(same_team, "members")
+            self.loader.load(teams[1], "members")
+
+    def test_relations_are_batched_separately(self):
+        employees = self.loader.register(self.employees)
+        teams = self.loader.register(self.teams)
+
+        with self.assertNumQueries(2):
+            for employee, team in zip(employees, teams):
+                self.assertEqual(self.loader.load(employee, "teams"), [team])
+                self.assertEqual(self.loader.load(team, "members"), [employee])
+
+    def test_unregistered_object_is_loaded_alone(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.loader.load(self.teams[0], "members"), [self.employees[0]]
+            )
+
+
+class BatchLoadedListViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.position = Position.objects.create(name="Test Position")
+        self.employee = get_user_model().objects.create_user(
+            username="testuser", password="Testpass123", position=self.position
+        )
+        self.client.force_login(self.employee)
+
+    def add_teams(self, count):
+        for i in range(count):
+            team = Team.objects.create(name=f"Team {Team.objects.count()}")
+            team.members.add(self.employee)
+
+    def test_team_list_query_count_does_not_grow(self):
+        url = reverse("employees:team-list")
+        # caches the session and user, and syncs the employee name index with
+        # the cleared cache
+        self.client.get(url)
+        names.index.sync(force=True)
+        counts = []
+        for teams in (1, 4):
+            self.add_teams(teams)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertContains(response, "Team 0")
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
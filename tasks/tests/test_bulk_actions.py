@@ -0,0 +1,163 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from employees.models import Position
+from tasks.dashboard import get_dashboard_snapshot
+from tasks.models import Project, Task, TaskTag, TaskType
+
+
+class TaskBulkActionViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        position = Position.objects.create(name="Test Position")
+        self.employees = [
+            get_user_model().objects.create_user(
+                username=f"user{i}", password="Testpass123", position=position
+            )
+            for i in range(3)
+        ]
+        self.client.force_login(self.employees[0])
+        self.project = Project.objects.create(name="Test Project")
+        self.task_type = TaskType.objects.create(name="Test Type")
+        self.tags = [TaskTag.objects.create(name=f"tag{i}") for i in range(2)]
+        self.deadline = timezone.now() + timedelta(days=3)
+        self.tasks = [self.create_task(i) for i in range(4)]
+        for task in self.tasks:
+            task.assignees.add(self.employees[1])
+            task.tags.add(self.tags[0])
+        self.url = reverse("tasks:task-bulk-action", args=[self.project.slug])
+
+    def create_task(self, i, project=None):
+        return Task.objects.create(
+            name=f"Task {i}",
+            project=project or self.project,
+            task_type=self.task_type,
+            deadline=self.deadline,
+            priority="3",
+        )
+
+    def post(self, action, tasks=None, follow=True, **data):
+        tasks = self.tasks[:3] if tasks is None else tasks
+        return self.client.post(
+            self.url,
+            {"action": action, "tasks": [task.pk for task in tasks], **data},
+            follow=follow,
+        )
+
+    def versions(self):
+        return list(Task.objects.order_by("pk").values_list("version", flat=True))
+
+    def test_project_page_has_bulk_form(self):
+        response = self.client.get(
+            reverse("tasks:project-detail", args=[self.project.slug])
+        )
+        self.assertContains(response, 'id="bulkActionForm"')
+        self.assertContains(response, 'name="tasks"', count=4)
+
+    def test_complete_and_reopen(self):
+        response = self.post("complete")
+        self.assertContains(response, "3 tasks updated")
+        self.assertEqual(
+            list(Task.objects.filter(is_completed=True).order_by("pk")),
+            self.tasks[:3],
+        )
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.completed_task_count, 3)
+
+        response = self.post("reopen", tasks=self.tasks)
+        self.assertContains(response, "3 tasks updated")
+        self.assertFalse(Task.objects.filter(is_completed=True).exists())
+
+    def test_reassign(self):
+        get_dashboard_snapshot(self.employees[1])
+        self.tasks[2].assignees.set([self.employees[0], self.employees[2]])
+        versions = self.versions()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.post(
+                "reassign", assignees=[self.employees[0].pk, self.employees[2].pk]
+            )
+        self.assertContains(response, "2 tasks updated")
+
+        for task in self.tasks[:3]:
+            self.assertCountEqual(
+                task.assignees.all(), [self.employees[0], self.employees[2]]
+            )
+        self.assertEqual(list(self.tasks[3].assignees.all()), [self.employees[1]])
+        self.assertEqual(len(get_dashboard_snapshot(self.employees[1])["tasks"]), 1)
+        self.assertEqual([v + 1 for v in versions[:2]] + versions[2:], self.versions())
+
+    def test_reassign_runs_set_based_statements(self):
+        def count_queries(tasks):
+            with CaptureQueriesContext(connection) as queries:
+                self.post(
+                    "reassign",
+                    tasks=tasks,
+                    follow=False,
+                    assignees=[self.employees[2].pk],
+                )
+            return len(queries)
+
+        # caches the session and user
+        self.post("reassign", follow=False, assignees=[self.employees[1].pk])
+        more_tasks = self.tasks + [self.create_task(i) for i in range(4, 12)]
+        self.assertEqual(count_queries(self.tasks[:2]), count_queries(more_tasks))
+
+    def test_add_and_remove_tags(self):
+        self.tasks[0].tags.add(self.tags[1])
+        versions = self.versions()
+        response = self.post("add_tags", tags=[tag.pk for tag in self.tags])
+        self.assertContains(response, "2 tasks updated")
+        for task in self.tasks[:3]:
+            self.assertCountEqual(task.tags.all(), self.tags)
+        self.assertEqual(
+            versions[:1] + [v + 1 for v in versions[1:3]] + versions[3:],
+            self.versions(),
+        )
+
+        versions = self.versions()
+        response = self.post("remove_tags", tags=[self.tags[0].pk])
+        self.assertContains(response, "3 tasks updated")
+        for task in self.tasks[:3]:
+            self.assertEqual(list(task.tags.all()), [self.tags[1]])
+        self.assertEqual(list(self.tasks[3].tags.all()), [self.tags[0]])
+        self.assertEqual([v + 1 for v in versions[:3]] + versions[3:], self.versions())
+
+        response = self.post("remove_tags", tags=[self.tags[0].pk])
+        self.assertContains(response, "0 tasks updated")
+
+    def test_change_priority(self):
+        self.tasks[0].priority = "1"
+        self.tasks[0].save()
+        response = self.post("priority", priority="1")
+        self.assertContains(response, "2 tasks updated")
+        self.assertEqual(Task.objects.filter(priority="1").count(), 3)
+
+    def test_shift_deadline(self):
+        self.post("shift_deadline", days=-2)
+        for task in self.tasks[:3]:
+            task.refresh_from_db()
+            self.assertEqual(task.deadline, self.deadline - timedelta(days=2))
+        self.tasks[3].refresh_from_db()
+        self.assertEqual(self.tasks[3].deadline, self.deadline)
+
+    def test_action_requires_its_field(self):
+        versions = self.versions()
+        response = self.post("shift_deadline")
+        self.assertContains(response, "Days: This field is required.")
+        self.assertEqual(versions, self.versions())
+
+    def test_tasks_of_other_projects_are_rejected(self):
+        other_task = self.create_task(9, project=Project.objects.create(name="Other"))
+        response = self.post("complete", tasks=[self.tasks[0], other_task])
+        self.assertContains(response, "Select a valid choice.")
+        self.assertFalse(Task.objects.filter(is_completed=True).exists())
+
+    def test_get_not_allowed(self):
+        self.assertEqual(self.client.get(self.url).status_code, 405)
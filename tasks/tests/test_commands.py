@@ -0,0 +1,151 @@
+import json
+from datetime import timedelta
+from io import StringIO
+from tempfile import NamedTemporaryFile
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from employees.models import Position
+from tasks.management.commands.fastload import iter_records
+from tasks.models import Project, Task, TaskType
+
+
+class RecountProjectTasksCommandTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(name="Test Project")
+        task_type = TaskType.objects.create(name="Test Task Type")
+        for i in range(3):
+            Task.objects.create(
+                name=f"Test Task {i}",
+                project=self.project,
+                task_type=task_type,
+                deadline=timezone.now(),
+                is_completed=i == 0,
+            )
+
+    def test_recount_project_tasks(self):
+        Project.objects.update(active_task_count=0, completed_task_count=0)
+        out = StringIO()
+        call_command("recount_project_tasks", stdout=out)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.active_task_count, 2)
+        self.assertEqual(self.project.completed_task_count, 1)
+        self.assertIn("1 projects", out.getvalue())
+
+
+class UpdateTasksCommandTests(TestCase):
+    def setUp(self):
+        project = Project.objects.create(name="Test Project")
+        task_type = TaskType.objects.create(name="Test Task Type")
+        for i in range(5):
+            Task.objects.create(
+                name=f"Test Task {i}",
+                project=project,
+                task_type=task_type,
+                deadline=timezone.now() + timedelta(days=30),
+            )
+
+    def update_tasks(self, seed):
+        out = StringIO()
+        call_command("update_tasks", batch_size=2, seed=seed, stdout=out)
+        return out.getvalue()
+
+    def test_update_tasks_sets_every_deadline(self):
+        output = self.update_tasks(seed=1)
+
+        self.assertIn("Updated 5 task deadlines", output)
+        limit = timezone.now() + timedelta(days=6)
+        self.assertFalse(Task.objects.filter(deadline__gt=limit).exists())
+
+    def test_update_tasks_seed_is_reproducible(self):
+        self.update_tasks(seed=1)
+        first = [task.deadline.date() for task in Task.objects.order_by("pk")]
+        self.update_tasks(seed=1)
+        second = [task.deadline.date() for task in Task.objects.order_by("pk")]
+        self.assertEqual(first, second)
+
+
+class FastloadCommandTests(TestCase):
+    FIXTURE = settings.BASE_DIR / "task_manager_db_data.json"
+
+    def fastload(self):
+        out = StringIO()
+        call_command("fastload", self.FIXTURE, batch_size=10, stdout=out)
+        return out.getvalue()
+
+    def test_iter_records_streams_in_chunks(self):
+        records = list(iter_records(self.FIXTURE, chunk_size=64))
+        self.assertEqual(len(records), 81)
+        self.assertEqual(records[0]["model"], "employees.position")
+
+    def test_fastload(self):
+        self.assertIn("Created 81 objects", self.fastload())
+
+        task = Task.objects.get(slug="define-project-scope-and-objectives")
+        self.assertEqual(task.project.name, "Task Manager")
+        self.assertEqual(
+            list(task.assignees.values_list("username", flat=True)), ["johndoe"]
+        )
+        self.assertEqual(task.tags.count(), 2)
+        self.assertEqual(Project.objects.get(slug=task.project.slug).teams.count(), 1)
+        self.assertEqual(str(task.project.created_at.date()), "2024-09-24")
+        self.assertEqual(
+            task.project.active_task_count + task.project.completed_task_count,
+            task.project.tasks.count(),
+        )
+        employee = get_user_model().objects.get(username="johndoe")
+        self.assertTrue(employee.check_password("testAcc1"))
+        self.assertIn("john", employee.search_text)
+
+    def test_fastload_is_idempotent(self):
+        self.fastload()
+        with self.assertNumQueries(13):
+            self.assertIn("Created 0 objects, skipped 81", self.fastload())
+
+    def test_fastload_requires_dependency_order(self):
+        records = list(iter_records(self.FIXTURE))
+        tasks = [record for record in records if record["model"] == "tasks.task"]
+        with NamedTemporaryFile("w", suffix=".json") as fixture:
+            json.dump(tasks[:1] + records, fixture)
+            fixture.flush()
+            with self.assertRaisesMessage(
+                CommandError, "employees.position records must come before"
+            ):
+                call_command("fastload", fixture.name, stdout=StringIO())
+        self.assertFalse(Task.objects.exists())
+
+    def test_fastload_matches_existing_rows_by_natural_key(self):
+        position = Position.objects.create(name="Project Manager")
+        self.fastload()
+        self.assertEqual(Position.objects.filter(name="Project Manager").count(), 1)
+        self.assertEqual(
+            get_user_model().objects.get(username="johndoe").position, position
+        )
+
+
+class ExplainQueriesCommandTests(TestCase):
+    def test_reports_index_usage(self):
+        call_command("fastload", FastloadCommandTests.FIXTURE, stdout=StringIO())
+        out = StringIO()
+        call_command("explain_queries", stdout=out)
+
+        for index in (
+            "employee_email_ci_unique",
+            "task_project_ordering_idx",
+            "invitation_ordering_idx",
+        ):
+            self.assertIn(index, out.getvalue())
+
+
+class BenchmarkServersCommandTests(TestCase):
+    def test_requires_data(self):
+        with self.assertRaisesMessage(CommandError, "load some data first"):
+            call_command("benchmark_servers", stdout=StringIO())
+
+    def test_unknown_username(self):
+        with self.assertRaisesMessage(CommandError, "No employee named ghost"):
+            call_command("benchmark_servers", username="ghost", stdout=StringIO())
@@ -0,0 +1,117 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from employees.models import Position
+from tasks.completion import complete_tasks, reopen_tasks
+from tasks.dashboard import get_dashboard_snapshot
+from tasks.models import Project, Task, TaskType
+
+
+class TaskCompletionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.position = Position.objects.create(name="Test Position")
+        self.employee = get_user_model().objects.create_user(
+            username="testuser", password="Testpass123", position=self.position
+        )
+        task_type = TaskType.objects.create(name="Test Task Type")
+        self.projects = [Project.objects.create(name=f"Project {i}") for i in range(2)]
+        self.tasks = [
+            Task.objects.create(
+                name=f"Task {i}",
+                project=self.projects[i % 2],
+                task_type=task_type,
+                deadline=timezone.now(),
+            )
+            for i in range(5)
+        ]
+        self.tasks[0].assignees.add(self.employee)
+        for task in self.tasks:
+            task.refresh_from_db()
+
+    def assertCounts(self, project, active, completed):
+        project.refresh_from_db()
+        self.assertEqual(
+            (project.active_task_count, project.completed_task_count),
+            (active, completed),
+        )
+
+    def test_complete_tasks_with_one_update(self):
+        pks = [task.pk for task in self.tasks]
+        with CaptureQueriesContext(connection) as queries:
+            changed = complete_tasks(Task.objects.filter(pk__in=pks), self.employee)
+        self.assertCountEqual(changed, pks)
+        task_updates = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('UPDATE "tasks_task"')
+        ]
+        self.assertEqual(len(task_updates), 1)
+
+        for task in self.tasks:
+            version = task.version
+            task.refresh_from_db()
+            self.assertTrue(task.is_completed)
+            self.assertEqual(task.completed_by, self.employee)
+            self.assertEqual(task.version, version + 1)
+        self.assertCounts(self.projects[0], 0, 3)
+        self.assertCounts(self.projects[1], 0, 2)
+
+    def test_only_tasks_that_change_are_returned(self):
+        self.tasks[1].is_completed = True
+        self.tasks[1].save()
+        self.assertCounts(self.projects[1], 1, 1)
+
+        changed = complete_tasks(Task.objects.filter(project=self.projects[1]), None)
+        self.assertEqual(changed, [self.tasks[3].pk])
+        self.assertEqual(
+            complete_tasks(Task.objects.filter(pk=self.tasks[3].pk), None), []
+        )
+        self.assertCounts(self.projects[1], 0, 2)
+
+    def test_reopen_tasks(self):
+        complete_tasks(Task.objects.all(), self.employee)
+        self.assertEqual(
+            reopen_tasks(Task.objects.filter(pk=self.tasks[0].pk)), [self.tasks[0].pk]
+        )
+        self.tasks[0].refresh_from_db()
+        self.assertFalse(self.tasks[0].is_completed)
+        self.assertIsNone(self.tasks[0].completed_by)
+        self.assertCounts(self.projects[0], 1, 2)
+
+    def test_assignee_dashboards_invalidated(self):
+        self.assertEqual(len(get_dashboard_snapshot(self.employee)["tasks"]), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            complete_tasks(Task.objects.filter(pk=self.tasks[0].pk), self.employee)
+        self.assertEqual(get_dashboard_snapshot(self.employee)["tasks"], [])
+
+    def test_conflicting_update_is_retried(self):
+        update = QuerySet.update
+        updates = []
+
+        def racing_update(queryset, **kwargs):
+            if "completed_by" in kwargs:
+                if not updates:
+                    # another request completes a task after it was read
+                    task = Task.objects.filter(pk=self.tasks[0].pk)
+                    update(task, is_completed=True)
+                updates.append(kwargs)
+            return update(queryset, **kwargs)
+
+        with mock.patch.object(QuerySet, "update", racing_update):
+            changed = complete_tasks(
+                Task.objects.filter(project=self.projects[0]), self.employee
+            )
+        self.assertEqual(len(updates), 2)
+        self.assertCountEqual(
+            changed,
+            [task.pk for task in self.tasks if task.project == self.projects[0]],
+        )
+        self.assertCounts(self.projects[0], 0, 3)
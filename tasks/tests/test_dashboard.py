@@ -0,0 +1,142 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from employees.models import Position, Team
+from task_manager_project.generations import get_generation
+from tasks.dashboard import (
+    DASHBOARD_GENERATION_KEY,
+    _dashboard_key,
+    get_dashboard_snapshot,
+    invalidate_all_dashboard_snapshots,
+)
+from tasks.models import Project, Task, TaskType
+
+
+class BaseDashboardTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.position = Position.objects.create(name="Test Position")
+        self.employee = get_user_model().objects.create_user(
+            username="testuser", password="Testpass123", position=self.position
+        )
+        self.project = Project.objects.create(name="Test Project")
+        self.task_type = TaskType.objects.create(name="Test Task Type")
+        self.task = Task.objects.create(
+            name="Test Task",
+            project=self.project,
+            task_type=self.task_type,
+            deadline=timezone.now(),
+        )
+
+
+class DashboardViewTests(BaseDashboardTests):
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.employee)
+
+    def test_dashboard_uses_correct_template(self):
+        response = self.client.get(reverse("tasks:dashboard"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "tasks/dashboard.html")
+
+    def test_dashboard_shows_assigned_tasks(self):
+        self.task.assignees.add(self.employee)
+        response = self.client.get(reverse("tasks:dashboard"))
+        self.assertContains(response, self.task.name)
+        self.assertContains(response, self.project.name)
+
+
+class DashboardSnapshotTests(BaseDashboardTests):
+    def test_warm_snapshot_runs_no_queries(self):
+        get_dashboard_snapshot(self.employee)
+        with self.assertNumQueries(0):
+            get_dashboard_snapshot(self.employee)
+
+    def test_generation_never_goes_back_after_key_is_lost(self):
+        generation = get_generation(DASHBOARD_GENERATION_KEY)
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_all_dashboard_snapshots()
+        self.assertEqual(get_generation(DASHBOARD_GENERATION_KEY), generation + 1)
+        # e.g. culled from a full cache
+        cache.delete(DASHBOARD_GENERATION_KEY)
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_all_dashboard_snapshots()
+        self.assertGreater(get_generation(DASHBOARD_GENERATION_KEY), generation + 1)
+
+    def test_snapshot_invalidated_on_assignment(self):
+        self.assertEqual(get_dashboard_snapshot(self.employee)["tasks"], [])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.assignees.add(self.employee)
+        snapshot = get_dashboard_snapshot(self.employee)
+        self.assertEqual([task["slug"] for task in snapshot["tasks"]], [self.task.slug])
+        self.assertEqual(
+            [project["slug"] for project in snapshot["projects"]], [self.project.slug]
+        )
+
+    def test_snapshot_rebuilt_before_commit_is_dropped(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.assignees.add(self.employee)
+            # what a request reading the committed rows would cache meanwhile
+            generation = get_generation(DASHBOARD_GENERATION_KEY)
+            cache.set(
+                _dashboard_key(generation, self.employee.pk),
+                {"projects": [], "teams": [], "tasks": []},
+            )
+        self.assertEqual(len(get_dashboard_snapshot(self.employee)["tasks"]), 1)
+
+    def test_snapshot_invalidated_on_reverse_assignment(self):
+        get_dashboard_snapshot(self.employee)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employee.tasks.add(self.task)
+        self.assertEqual(len(get_dashboard_snapshot(self.employee)["tasks"]), 1)
+
+    def test_snapshot_invalidated_on_completion(self):
+        self.task.assignees.add(self.employee)
+        self.assertEqual(len(get_dashboard_snapshot(self.employee)["tasks"]), 1)
+        self.task.is_completed = True
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.save()
+        self.assertEqual(get_dashboard_snapshot(self.employee)["tasks"], [])
+
+    def test_snapshot_invalidated_on_task_delete(self):
+        self.task.assignees.add(self.employee)
+        get_dashboard_snapshot(self.employee)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.delete()
+        self.assertEqual(get_dashboard_snapshot(self.employee)["tasks"], [])
+
+    def test_snapshot_invalidated_on_team_membership(self):
+        team = Team.objects.create(name="Test Team")
+        self.project.teams.add(team)
+        self.assertEqual(get_dashboard_snapshot(self.employee)["teams"], [])
+        with self.captureOnCommitCallbacks(execute=True):
+            team.members.add(self.employee)
+        snapshot = get_dashboard_snapshot(self.employee)
+        self.assertEqual(snapshot["teams"], [team.name])
+        self.assertEqual(
+            [project["slug"] for project in snapshot["projects"]], [self.project.slug]
+        )
+
+    def test_snapshot_invalidated_on_project_teams_change(self):
+        team = Team.objects.create(name="Test Team")
+        team.members.add(self.employee)
+        self.assertEqual(get_dashboard_snapshot(self.employee)["projects"], [])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.teams.add(team)
+        self.assertEqual(len(get_dashboard_snapshot(self.employee)["projects"]), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.teams.clear()
+        self.assertEqual(get_dashboard_snapshot(self.employee)["projects"], [])
+
+    def test_snapshot_invalidated_on_project_rename(self):
+        self.task.assignees.add(self.employee)
+        get_dashboard_snapshot(self.employee)
+        self.project.name = "Renamed Project"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.save()
+        snapshot = get_dashboard_snapshot(self.employee)
+        self.assertEqual(snapshot["projects"][0]["name"], "Renamed Project")
+        self.assertEqual(snapshot["tasks"][0]["project_name"], "Renamed Project")
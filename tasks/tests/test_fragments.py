@@ -0,0 +1,133 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.test import TestCase
+from django.utils import timezone
+
+from employees.models import Position
+from tasks.dashboard import get_dashboard_snapshot
+from tasks.fragments import (
+    TASK_ROWS_GENERATION_KEY,
+    load_task_rows,
+    render_task_rows,
+)
+from tasks.models import Project, Task, TaskTag, TaskType
+
+PROJECT_ROW = "tasks/includes/project_task_row.html"
+DASHBOARD_ROW = "tasks/includes/dashboard_task_row.html"
+
+
+class TaskRowFragmentTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        caches["task_rows"].clear()
+        position = Position.objects.create(name="Test Position")
+        self.employee = get_user_model().objects.create_user(
+            username="testuser",
+            first_name="Jane",
+            last_name="Doe",
+            position=position,
+        )
+        self.project = Project.objects.create(name="Test Project")
+        self.task = Task.objects.create(
+            name="Test Task",
+            project=self.project,
+            task_type=TaskType.objects.create(name="Test Task Type"),
+            deadline=timezone.now() + timedelta(days=2),
+        )
+
+    def render_row(self):
+        rows = list(Task.objects.values("id", "version", "deadline"))
+        load_calls = []
+
+        def load(pks):
+            load_calls.append(pks)
+            return load_task_rows(pks)
+
+        rendered = render_task_rows(PROJECT_ROW, rows, load=load)
+        return rendered[0], bool(load_calls)
+
+    def test_row_is_rendered_once(self):
+        self.assertEqual(self.render_row()[1], True)
+        self.assertEqual(self.render_row()[1], False)
+
+    def test_rows_are_kept_out_of_the_default_cache(self):
+        with mock.patch("tasks.fragments.get_generation", return_value=1):
+            self.render_row()
+            cache.clear()
+            self.assertEqual(self.render_row()[1], False)
+
+    def test_row_is_rerendered_after_save(self):
+        self.render_row()
+        self.task.name = "Renamed Task"
+        self.task.save()
+
+        row, rendered = self.render_row()
+        self.assertTrue(rendered)
+        self.assertIn("Renamed Task", row)
+
+    def test_row_is_rerendered_after_m2m_change(self):
+        self.render_row()
+        self.task.assignees.add(self.employee)
+        self.assertIn("Jane Doe", self.render_row()[0])
+
+        tag = TaskTag.objects.create(name="backend")
+        tag.task_set.add(self.task)
+        self.assertIn("backend", self.render_row()[0])
+
+    def test_rows_are_rerendered_after_related_rename(self):
+        self.task.assignees.add(self.employee)
+        self.render_row()
+        self.employee.first_name = "Janet"
+        self.employee.save()
+        self.assertIn("Janet Doe", self.render_row()[0])
+
+    def test_lost_generation_does_not_bring_back_stale_rows(self):
+        self.task.assignees.add(self.employee)
+        self.render_row()
+        self.employee.first_name = "Janet"
+        self.employee.save()
+        self.render_row()
+        # e.g. culled from a full cache
+        cache.delete(TASK_ROWS_GENERATION_KEY)
+        row, rendered = self.render_row()
+        self.assertTrue(rendered)
+        self.assertIn("Janet Doe", row)
+
+    def test_rows_are_rerendered_after_template_change(self):
+        self.render_row()
+        # e.g. a deploy that edits the row template
+        with mock.patch("tasks.fragments.template_fingerprint", return_value="new"):
+            self.assertTrue(self.render_row()[1])
+
+    def test_dashboard_row_is_rerendered_after_project_rename(self):
+        self.task.assignees.add(self.employee)
+
+        def render_dashboard_row():
+            rows = get_dashboard_snapshot(self.employee)["tasks"]
+            return render_task_rows(DASHBOARD_ROW, rows)[0]
+
+        render_dashboard_row()
+        version = Task.objects.get(pk=self.task.pk).version
+        self.project.name = "Renamed Project"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.save()
+        self.assertEqual(Task.objects.get(pk=self.task.pk).version, version)
+        self.assertIn("Renamed Project", render_dashboard_row())
+
+    def test_deadline_bucket_rolls_over(self):
+        self.render_row()
+        later = timezone.now() + timedelta(days=3)
+        with mock.patch("django.utils.timezone.now", return_value=later):
+            row, rendered = self.render_row()
+        self.assertTrue(rendered)
+
+    def test_row_shows_precomputed_priority(self):
+        self.task.priority = "2"
+        self.task.save()
+
+        row = self.render_row()[0]
+        self.assertIn('fill="yellow"', row)
+        self.assertIn("High", row)
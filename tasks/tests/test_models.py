@@ -1,6 +1,8 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.utils import timezone
 
+from employees.models import Position, Team
 from tasks.models import Task, Project, TaskType, TaskTag
 
 
@@ -41,3 +43,112 @@ class TestTaskTagModel(BaseTasksModelsTests):
 class TestProjectModel(BaseTasksModelsTests):
     def test_project_str(self):
         self.assertEqual(str(self.project), self.project.name)
+
+
+class TestProjectForMember(BaseTasksModelsTests):
+    def setUp(self):
+        super().setUp()
+        position = Position.objects.create(name="Test Position")
+        self.employee = get_user_model().objects.create_user(
+            username="testuser", password="Testpass123", position=position
+        )
+        self.team = Team.objects.create(name="Test Team")
+        self.other_project = Project.objects.create(name="Other Project")
+
+    def test_for_member_without_relations(self):
+        self.assertQuerySetEqual(Project.objects.for_member(self.employee), [])
+
+    def test_for_member_by_task(self):
+        self.task.assignees.add(self.employee)
+        self.assertQuerySetEqual(
+            Project.objects.for_member(self.employee), [self.project]
+        )
+
+    def test_for_member_by_team(self):
+        self.team.members.add(self.employee)
+        self.other_project.teams.add(self.team)
+        self.assertQuerySetEqual(
+            Project.objects.for_member(self.employee), [self.other_project]
+        )
+
+    def test_for_member_without_duplicates(self):
+        self.task.assignees.add(self.employee)
+        Task.objects.create(
+            name="Another Task",
+            project=self.project,
+            task_type=self.task_type,
+            deadline=timezone.now(),
+        ).assignees.add(self.employee)
+        self.team.members.add(self.employee)
+        self.project.teams.add(self.team)
+        self.other_project.teams.add(self.team)
+        self.assertQuerySetEqual(
+            Project.objects.for_member(self.employee),
+            [self.other_project, self.project],
+        )
+
+
+class TestProjectTaskCounters(BaseTasksModelsTests):
+    def assertTaskCounts(self, project, active, completed):
+        project.refresh_from_db()
+        self.assertEqual(project.active_task_count, active)
+        self.assertEqual(project.completed_task_count, completed)
+
+    def test_counters_on_create(self):
+        self.assertTaskCounts(self.project, 1, 0)
+        Task.objects.create(
+            name="Completed Task",
+            project=self.project,
+            task_type=self.task_type,
+            deadline=timezone.now(),
+            is_completed=True,
+        )
+        self.assertTaskCounts(self.project, 1, 1)
+
+    def test_counters_on_complete_and_reopen(self):
+        self.task.is_completed = True
+        self.task.save()
+        self.assertTaskCounts(self.project, 0, 1)
+        self.task.save()
+        self.assertTaskCounts(self.project, 0, 1)
+        self.task.is_completed = False
+        self.task.save()
+        self.assertTaskCounts(self.project, 1, 0)
+
+    def test_counters_on_project_change(self):
+        other_project = Project.objects.create(name="Other Project")
+        self.task.project = other_project
+        self.task.save()
+        self.assertTaskCounts(self.project, 0, 0)
+        self.assertTaskCounts(other_project, 1, 0)
+
+    def test_counters_on_delete(self):
+        self.task.delete()
+        self.assertTaskCounts(self.project, 0, 0)
+
+    def test_counters_on_queryset_delete(self):
+        Task.objects.create(
+            name="Another Task",
+            project=self.project,
+            task_type=self.task_type,
+            deadline=timezone.now(),
+        )
+        Task.objects.filter(project=self.project).delete()
+        self.assertTaskCounts(self.project, 0, 0)
+
+    def test_project_save_keeps_counters(self):
+        stale_project = Project.objects.get(pk=self.project.pk)
+        Task.objects.create(
+            name="Another Task",
+            project=self.project,
+            task_type=self.task_type,
+            deadline=timezone.now(),
+        )
+        stale_project.name = "Updated name"
+        stale_project.save()
+        self.assertTaskCounts(self.project, 2, 0)
+
+    def test_recount_tasks(self):
+        Project.objects.update(active_task_count=10, completed_task_count=10)
+        Project.objects.recount_tasks()
+        self.assertTaskCounts(self.project, 1, 0)
@@ -0,0 +1,63 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from employees.models import Position
+from task_manager_project.profiling import profiles
+
+
+class SamplingProfilerTests(TestCase):
+    PROJECT_LIST_URL = reverse("tasks:project-list")
+    PROFILE_LIST_URL = reverse("profile-list")
+
+    def setUp(self):
+        profiles.clear()
+        self.position = Position.objects.create(name="Test Position")
+        self.employee = get_user_model().objects.create_user(
+            username="testuser", password="Testpass123", position=self.position
+        )
+        self.client.force_login(self.employee)
+
+    def make_staff(self):
+        self.employee.is_staff = True
+        self.employee.save()
+
+    def test_requests_are_not_profiled_by_default(self):
+        self.client.get(self.PROJECT_LIST_URL)
+        self.assertEqual(len(profiles), 0)
+
+    def test_profile_header_from_staff_user(self):
+        self.make_staff()
+        self.client.get(self.PROJECT_LIST_URL, headers={"X-Profile": "1"})
+
+        self.assertEqual(len(profiles), 1)
+        profile = profiles[0]
+        self.assertEqual(profile["view_name"], "tasks:project-list")
+        self.assertGreater(profile["query_count"], 0)
+        self.assertIn("cumulative", profile["stats"])
+
+    def test_profile_header_ignored_for_other_users(self):
+        self.client.get(self.PROJECT_LIST_URL, headers={"X-Profile": "1"})
+        self.assertEqual(len(profiles), 0)
+
+    @override_settings(PROFILER_SAMPLE_RATE=1)
+    def test_sampled_requests_are_profiled_newest_first(self):
+        self.client.get(self.PROJECT_LIST_URL)
+        self.client.get(self.PROFILE_LIST_URL)
+
+        self.assertEqual(len(profiles), 2)
+        self.assertEqual(profiles[0]["view_name"], "profile-list")
+        self.assertGreater(profiles[0]["id"], profiles[1]["id"])
+
+    def test_profile_list_requires_staff(self):
+        response = self.client.get(self.PROFILE_LIST_URL)
+        self.assertNotEqual(response.status_code, 200)
+
+    def test_profile_list(self):
+        self.make_staff()
+        self.client.get(self.PROJECT_LIST_URL, headers={"X-Profile": "1"})
+        response = self.client.get(self.PROFILE_LIST_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "profiling/profile_list.html")
+        self.assertContains(response, self.PROJECT_LIST_URL)
@@ -1,13 +1,17 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls.base import reverse
 from django.utils import timezone
 
+from employees import names
 from employees.models import Position, Team
-from tasks.models import Project, Task, TaskType
+from employees.utils import preset_slugs
+from tasks.models import Project, Task, TaskTag, TaskType
+from task_manager_project.query_budget import QueryBudgetTestMixin
 
 
-class BaseProjectTests(TestCase):
+class BaseProjectTests(QueryBudgetTestMixin, TestCase):
     def setUp(self):
         self.position = Position.objects.create(name="Test Position")
         self.employee = get_user_model().objects.create_user(
@@ -127,6 +131,67 @@ class PrivateProjectDetailTests(BasePrivateProjectTests):
         self.assertEqual(len(response.context["tasks"]), 1)
 
 
+class ProjectDetailQueryCountTests(BasePrivateProjectTests):
+    # project and the task row keys, plus tasks, assignee ids and tags for the
+    # rows that are not cached yet; the session, user and employee names are
+    # cached
+    EXPECTED_QUERIES = 5
+    CACHED_QUERIES = 2
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.project = Project.objects.create(name="Test Project")
+        self.task_type = TaskType.objects.create(name="Test Type")
+        self.tag = TaskTag.objects.create(name="Test Tag")
+        self.assignees = [
+            get_user_model().objects.create_user(
+                username=f"assignee{i}", position=self.position
+            )
+            for i in range(3)
+        ]
+
+    def add_tasks(self, count):
+        start = self.project.tasks.count()
+        with preset_slugs(Task):
+            tasks = Task.objects.bulk_create(
+                Task(
+                    name=f"Task {i}",
+                    slug=f"task-{i}",
+                    project=self.project,
+                    task_type=self.task_type,
+                    deadline=timezone.now(),
+                    priority="1",
+                    is_completed=i % 2 == 0,
+                    completed_by=self.assignees[i % 3] if i % 2 == 0 else None,
+                )
+                for i in range(start, count)
+            )
+        Task.assignees.through.objects.bulk_create(
+            Task.assignees.through(task=task, employee=employee)
+            for task in tasks
+            for employee in self.assignees
+        )
+        Task.tags.through.objects.bulk_create(
+            Task.tags.through(task=task, tasktag=self.tag) for task in tasks
+        )
+
+    def test_project_detail_query_count_is_constant(self):
+        url = reverse("tasks:project-detail", kwargs={"slug": self.project.slug})
+        # caches the session and user, and syncs the employee name index with
+        # the cleared cache
+        self.client.get(url)
+        names.index.sync(force=True)
+        for count in (10, 100, 1000):
+            with self.subTest(tasks=count):
+                self.add_tasks(count)
+                with self.assertNumQueries(self.EXPECTED_QUERIES):
+                    response = self.client.get(url)
+                self.assertEqual(len(response.context["task_rows"]), count)
+                with self.assertNumQueries(self.CACHED_QUERIES):
+                    self.client.get(url)
+
+
 class PrivateProjectCreateView(BasePrivateProjectTests):
     PROJECT_CREATE_URL = reverse("tasks:project-create")
 
@@ -0,0 +1,67 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from employees.models import Position
+from tasks.models import Project
+from task_manager_project.query_budget import (
+    QueryBudgetExceeded,
+    QueryBudgetTestMixin,
+    QueryRecorder,
+    fingerprint,
+)
+
+
+class QueryRecorderTests(TestCase):
+    def test_fingerprint_collapses_placeholder_lists(self):
+        self.assertEqual(
+            fingerprint('SELECT 1 FROM "t" WHERE "id" IN (%s, %s, %s)'),
+            'SELECT 1 FROM "t" WHERE "id" IN (...)',
+        )
+
+    def test_recorder_reports_repeated_statements(self):
+        projects = [Project.objects.create(name=f"Project {i}") for i in range(3)]
+        with QueryRecorder().record() as recorder:
+            for project in projects:
+                list(project.tasks.all())
+            list(Project.objects.filter(pk__in=[projects[0].pk]))
+            list(Project.objects.filter(pk__in=[p.pk for p in projects]))
+
+        self.assertEqual(recorder.count, 5)
+        self.assertEqual([count for _, count in recorder.repeated()], [3, 2])
+        self.assertIn("5 queries", recorder.summary())
+
+
+class QueryBudgetMiddlewareTests(QueryBudgetTestMixin, TestCase):
+    PROJECT_LIST_URL = reverse("tasks:project-list")
+
+    def setUp(self):
+        super().setUp()
+        position = Position.objects.create(name="Test Position")
+        employee = get_user_model().objects.create_user(
+            username="testuser", password="Testpass123", position=position
+        )
+        self.client.force_login(employee)
+
+    def test_response_has_query_recorder(self):
+        response = self.client.get(self.PROJECT_LIST_URL)
+        self.assertGreater(response.query_recorder.count, 0)
+
+    @override_settings(QUERY_BUDGETS={"tasks:project-list": 1})
+    def test_over_budget_request_raises(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.get(self.PROJECT_LIST_URL)
+
+    @override_settings(QUERY_BUDGETS={"tasks:project-list": 1})
+    def test_over_budget_request_is_logged_when_not_raising(self):
+        with override_settings(QUERY_BUDGET_RAISE=False):
+            with self.assertLogs("task_manager_project.query_budget", "WARNING"):
+                response = self.client.get(self.PROJECT_LIST_URL)
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(QUERY_BUDGETS={"tasks:project-list": 1})
+    def test_assert_query_budget(self):
+        with self.assertRaises(AssertionError):
+            with self.assertQueryBudget("tasks:project-list"):
+                list(Project.objects.all())
+                list(Project.objects.all())
@@ -0,0 +1,48 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import RequestFactory, SimpleTestCase
+from django.utils import timezone
+
+from tasks.models import Task
+from tasks.rendering import RenderContext, render_context
+
+
+class RenderContextTests(SimpleTestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.context = RenderContext(now=self.now)
+
+    def test_deadline_coloring(self):
+        cases = [
+            (self.now + timedelta(days=4), "success"),
+            (self.now + timedelta(days=3), "warning"),
+            (self.now + timedelta(hours=1), "warning"),
+            (self.now, "danger"),
+            (self.now - timedelta(days=1), "danger"),
+        ]
+        for deadline, coloring in cases:
+            with self.subTest(deadline=deadline):
+                self.assertEqual(self.context.deadline_coloring(deadline), coloring)
+
+    def test_annotates_instances_and_dicts(self):
+        task = Task(priority="1", deadline=self.now - timedelta(days=1))
+        row = {"priority": "4", "deadline": self.now + timedelta(days=5)}
+
+        self.context.annotate([task, row])
+
+        self.assertEqual(
+            (task.deadline_coloring, task.priority_label, task.priority_color),
+            ("danger", "Urgent", "red"),
+        )
+        self.assertEqual(
+            (row["deadline_coloring"], row["priority_label"], row["priority_color"]),
+            ("success", "Low", "grey"),
+        )
+
+    def test_now_is_read_once_per_request(self):
+        request = RequestFactory().get("/")
+        with mock.patch("django.utils.timezone.now", return_value=self.now) as now:
+            context = render_context(request)
+            self.assertIs(render_context(request), context)
+        self.assertEqual(now.call_count, 1)
@@ -0,0 +1,117 @@
+from unittest import mock, skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from tasks.models import Project, Task, TaskType
+from tasks.search import search
+from tasks.search.sqlite import restore_fts_triggers
+
+
+class BaseSearchTests(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name="Website", description="Company landing page"
+        )
+        self.other_project = Project.objects.create(name="Mobile app")
+        self.task_type = TaskType.objects.create(name="Test Task Type")
+        self.name_task = self.create_task("Deploy server", "", self.project)
+        self.description_task = self.create_task(
+            "Update docs", "Describe how to deploy", self.project
+        )
+        self.other_task = self.create_task("Deploy build", "", self.other_project)
+
+    def create_task(self, name, description, project):
+        return Task.objects.create(
+            name=name,
+            description=description,
+            project=project,
+            task_type=self.task_type,
+            deadline=timezone.now(),
+        )
+
+
+class TaskSearchTests(BaseSearchTests):
+    def test_search_is_scoped_to_project(self):
+        tasks = search("deploy", scope=self.project)
+        self.assertNotIn(self.other_task, tasks)
+
+    def test_name_matches_rank_first(self):
+        tasks = search("deploy", scope=self.project)
+        self.assertEqual(list(tasks), [self.name_task, self.description_task])
+
+    def test_prefix_match(self):
+        tasks = search("serv", scope=self.project)
+        self.assertEqual(list(tasks), [self.name_task])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.name_task.name = "Restart server"
+        self.name_task.save()
+        self.assertEqual(list(search("restart", scope=self.project)), [self.name_task])
+        self.assertEqual(
+            list(search("deploy", scope=self.project)), [self.description_task]
+        )
+        self.description_task.delete()
+        self.assertEqual(list(search("deploy", scope=self.project)), [])
+
+    def test_query_without_terms(self):
+        self.assertEqual(list(search('"*-', scope=self.project)), [])
+
+
+class ProjectSearchTests(BaseSearchTests):
+    def test_project_matches_rank_before_task_matches(self):
+        Project.objects.create(name="Deploy pipeline")
+        names = [project.name for project in search("deploy")]
+        self.assertEqual(names[0], "Deploy pipeline")
+        self.assertCountEqual(names[1:], ["Website", "Mobile app"])
+
+    def test_project_description_match(self):
+        self.assertEqual(list(search("landing")), [self.project])
+
+    def test_search_keeps_base_queryset(self):
+        projects = search(
+            "deploy", queryset=Project.objects.exclude(pk=self.project.pk)
+        )
+        self.assertEqual(list(projects), [self.other_project])
+
+
+@skipUnless(connection.vendor == "sqlite", "SQLite FTS5 ranking")
+class SQLiteRankingTests(BaseSearchTests):
+    @mock.patch("tasks.search.sqlite.RANKED_RESULTS_LIMIT", 1)
+    def test_matches_past_the_ranked_limit_are_kept(self):
+        extra_task = self.create_task("Release", "Deploy notes", self.project)
+        tasks = search("deploy", scope=self.project)
+        self.assertEqual(tasks.count(), 3)
+        self.assertEqual(tasks[0], self.name_task)
+        self.assertEqual(list(tasks[1:]), [self.description_task, extra_task])
+
+        names = [project.name for project in search("deploy")]
+        self.assertCountEqual(names, ["Website", "Mobile app"])
+
+
+@skipUnless(connection.vendor == "sqlite", "SQLite FTS5 triggers")
+class SQLiteTriggerRestoreTests(BaseSearchTests):
+    def test_missing_triggers_are_restored(self):
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER tasks_task_fts_insert")
+        restore_fts_triggers(connection.alias)
+
+        task = self.create_task("Configure firewall", "", self.project)
+        self.assertEqual(list(search("firewall", scope=self.project)), [task])
+
+    def test_update_triggers_fire_for_indexed_columns_only(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name, sql FROM sqlite_master "
+                "WHERE type = 'trigger' AND name LIKE '%_fts_update'"
+            )
+            triggers = dict(cursor.fetchall())
+        self.assertIn(
+            "AFTER UPDATE OF name, description, project_id ON tasks_task",
+            triggers["tasks_task_fts_update"],
+        )
+        self.assertIn(
+            "AFTER UPDATE OF name, description ON tasks_project",
+            triggers["tasks_project_fts_update"],
+        )
@@ -7,9 +7,10 @@ from django.urls import reverse
 
 from employees.models import Position
 from tasks.models import Project, TaskType, Task
+from task_manager_project.query_budget import QueryBudgetTestMixin
 
 
-class BaseTasksTests(TestCase):
+class BaseTasksTests(QueryBudgetTestMixin, TestCase):
     def setUp(self):
         self.position = Position.objects.create(name="Test Position")
         self.employee = get_user_model().objects.create_user(
@@ -123,6 +124,32 @@ class PrivateDetailViewTests(BasePrivateProjectTests):
             response, reverse("tasks:task-detail", kwargs={"slug": self.task.slug})
         )
 
+    def test_task_detail_post_updates_project_counters(self):
+        self.client.post(self.TASK_DETAIL_URL, data={"action": "complete"})
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.active_task_count, 0)
+        self.assertEqual(self.project.completed_task_count, 1)
+
+        self.client.post(self.TASK_DETAIL_URL, data={"action": "open"})
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.active_task_count, 1)
+        self.assertEqual(self.project.completed_task_count, 0)
+
+    def test_task_detail_post_complete_completed_task(self):
+        self.client.post(self.TASK_DETAIL_URL, data={"action": "complete"})
+        response = self.client.post(
+            self.TASK_DETAIL_URL, data={"action": "complete"}, follow=True
+        )
+        self.assertContains(response, "Task is already completed")
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.completed_task_count, 1)
+
+    def test_task_detail_post_unknown_task(self):
+        url = reverse("tasks:task-detail", kwargs={"slug": "unknown"})
+        for action in ("complete", "open"):
+            response = self.client.post(url, data={"action": action})
+            self.assertEqual(response.status_code, 404)
+
     def test_task_detail_post_reopen_task(self):
         self.task.is_completed = True
         self.task.completed_by = self.employee
@@ -0,0 +1,55 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.template import Context, engines
+from django.test import SimpleTestCase, override_settings
+
+DOT = "includes/svg/dot.html"
+
+
+class InliningLoaderTests(SimpleTestCase):
+    def setUp(self):
+        self.engine = engines["django"].engine
+        self.engine.template_loaders[0].reset()
+        self.loader = self.engine.template_loaders[0].loaders[0]
+
+    def tearDown(self):
+        self.engine.template_loaders[0].reset()
+
+    def test_listed_include_is_inlined(self):
+        source = '<p>{% include "includes/svg/dot.html" with color="red" %}</p>'
+        inlined = self.loader.inline(source)
+
+        self.assertNotIn("{% include", inlined)
+        self.assertEqual(
+            self.engine.from_string(inlined).render(Context()),
+            self.engine.from_string(source).render(Context()),
+        )
+
+    def test_only_and_unlisted_includes_are_kept(self):
+        for source in (
+            '{% include "includes/svg/dot.html" with color="red" only %}',
+            '{% include "includes/pagination.html" %}',
+            "{% include template_name %}",
+        ):
+            with self.subTest(source=source):
+                self.assertEqual(self.loader.inline(source), source)
+
+    @override_settings(TEMPLATE_INLINE_INCLUDES=set())
+    def test_nothing_is_inlined_without_configuration(self):
+        source = '{% include "includes/svg/dot.html" %}'
+        self.assertEqual(self.loader.inline(source), source)
+
+    def test_compiled_template_has_inlined_source(self):
+        template = self.engine.get_template("tasks/includes/project_task_row.html")
+
+        self.assertNotIn(DOT, template.source)
+        self.assertIn("<svg", template.source)
+
+
+class CompileTemplatesCommandTests(SimpleTestCase):
+    def test_compiles_all_templates(self):
+        out = StringIO()
+        call_command("compile_templates", stdout=out)
+
+        self.assertRegex(out.getvalue(), r"Compiled \d+ templates, inlined \d+ ")
@@ -1,11 +1,18 @@
+from django.conf import settings
 from django.urls import path
 
+from tasks.async_views import (
+    AsyncProjectDetailView,
+    AsyncProjectListView,
+    AsyncUserDashboardView,
+)
 from tasks.views import (
     ProjectCreateView,
     ProjectUpdateView,
     ProjectDeleteView,
     ProjectDetailView,
     ProjectListView,
+    TaskBulkActionView,
     TaskCreateView,
     TaskDetailView,
     TaskUpdateView,
@@ -15,6 +22,11 @@ from tasks.views import (
 
 app_name = "tasks"
 
+if settings.ASYNC_VIEWS:
+    UserDashboardView = AsyncUserDashboardView
+    ProjectListView = AsyncProjectListView
+    ProjectDetailView = AsyncProjectDetailView
+
 urlpatterns = [
     # Dashboard
     path("", UserDashboardView.as_view(), name="dashboard"),
@@ -33,6 +45,11 @@ urlpatterns = [
         name="project-delete",
     ),
     # Tasks
+    path(
+        "projects/<slug:slug>/tasks/",
+        TaskBulkActionView.as_view(),
+        name="task-bulk-action",
+    ),
     path(
         "tasks/create/<slug:project_slug>/",
         TaskCreateView.as_view(),
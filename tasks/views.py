@@ -1,70 +1,66 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
-from django.db.models import Case, When, Value, IntegerField, Q, Count
-from django.http import HttpResponseRedirect
+from django.http import Http404, HttpResponseRedirect
 from django.urls.base import reverse, reverse_lazy
 from django.utils.safestring import mark_safe
+from django.template.defaultfilters import pluralize
 from django.views.generic import (
     ListView,
     CreateView,
     DetailView,
+    FormView,
     UpdateView,
     DeleteView,
     TemplateView,
 )
-
-from employees.models import Team
-from tasks.forms import TaskSearchForm, ProjectForm, TaskForm
+from django.views.generic.detail import SingleObjectMixin
+
+from employees.pagination import CursorPaginationMixin
+from tasks.completion import complete_tasks, reopen_tasks
+from tasks.dashboard import get_dashboard_snapshot
+from tasks.fragments import load_task_rows, render_task_rows
+from tasks.rendering import render_context
+from tasks.forms import TaskBulkActionForm, TaskSearchForm, ProjectForm, TaskForm
 from tasks.mixins import ProjectSearchMixin
+from tasks.search import search
 from tasks.models import Project, Task
+from task_manager_project.batch_loading import BatchLoadingMixin
 
 
 class UserDashboardView(LoginRequiredMixin, TemplateView):
     template_name = "tasks/dashboard.html"
 
+    def get_snapshot(self):
+        return get_dashboard_snapshot(self.request.user)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        projects_by_tasks = Project.objects.filter(
-            tasks__assignees=self.request.user
-        ).distinct()
-        projects_by_teams = Project.objects.filter(
-            teams__members=self.request.user
-        ).distinct()
-        context["user_projects"] = projects_by_tasks | projects_by_teams.exclude(
-            id__in=projects_by_tasks.values("id")
-        )
-
-        teams = Team.objects.filter(members=self.request.user).distinct()
-        context["user_teams"] = teams
-
-        context["user_tasks"] = (
-            Task.objects.filter(assignees=self.request.user, is_completed=False)
-            .distinct()
-            .select_related("project")
-            .order_by("deadline")
+        snapshot = self.get_snapshot()
+        context["user_projects"] = snapshot["projects"]
+        context["user_teams"] = snapshot["teams"]
+        context["user_tasks"] = snapshot["tasks"]
+        context["user_task_rows"] = render_task_rows(
+            "tasks/includes/dashboard_task_row.html",
+            snapshot["tasks"],
+            context=render_context(self.request),
         )
 
         return context
 
 
 # Project Views
-class ProjectListView(LoginRequiredMixin, ProjectSearchMixin, ListView):
+class ProjectListView(
+    LoginRequiredMixin,
+    BatchLoadingMixin,
+    CursorPaginationMixin,
+    ProjectSearchMixin,
+    ListView,
+):
     model = Project
     paginate_by = 5
     template_name = "tasks/projects/project_list.html"
 
-    def get_queryset(self):
-        return (
-            super()
-            .get_queryset()
-            .prefetch_related("tasks", "teams")
-            .annotate(
-                active_tasks_num=Count("tasks", filter=Q(tasks__is_completed=False)),
-                completed_tasks_num=Count("tasks", filter=Q(tasks__is_completed=True)),
-            )
-        )
-
 
 class ProjectCreateView(LoginRequiredMixin, CreateView):
     model = Project
@@ -88,33 +84,25 @@ class ProjectDetailView(LoginRequiredMixin, DetailView):
 
     def get_context_data(self, **kwargs):
         context = super(ProjectDetailView, self).get_context_data(**kwargs)
-        project = self.get_object()
-        tasks = (
-            project.tasks.select_related("task_type")
-            .prefetch_related("assignees", "tags")
-            .all()
-        )
+        project = self.object
+        tasks = project.tasks.all()
 
         form = TaskSearchForm(self.request.GET)
         if self.request.GET.get("query"):
             if form.is_valid():
                 query = form.cleaned_data["query"]
 
-                tasks = tasks.filter(
-                    Q(name__icontains=query) | Q(description__icontains=query)
-                )
-
-                tasks = tasks.annotate(
-                    search_priority=Case(
-                        When(name__icontains=query, then=Value(1)),
-                        When(description__icontains=query, then=Value(2)),
-                        output_field=IntegerField(),
-                    )
-                ).order_by("search_priority")
+                tasks = search(query, scope=project, queryset=tasks)
 
-        context["project"] = project
         context["tasks"] = tasks
+        context["task_rows"] = render_task_rows(
+            "tasks/includes/project_task_row.html",
+            list(tasks.values("id", "version", "deadline")),
+            load=load_task_rows,
+            context=render_context(self.request),
+        )
         context["search_form"] = TaskSearchForm()
+        context["bulk_form"] = TaskBulkActionForm(project=self.object)
         return context
 
 
@@ -132,6 +120,36 @@ class ProjectDeleteView(LoginRequiredMixin, DeleteView):
 
 
 # Task Views
+class TaskBulkActionView(LoginRequiredMixin, SingleObjectMixin, FormView):
+    model = Project
+    form_class = TaskBulkActionForm
+    http_method_names = ["post"]
+
+    def post(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        return super().post(request, *args, **kwargs)
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs["project"] = self.object
+        return kwargs
+
+    def form_valid(self, form):
+        count = form.save(self.request.user)
+        messages.success(self.request, f"{count} task{pluralize(count)} updated")
+        return super().form_valid(form)
+
+    def form_invalid(self, form):
+        for field_name, errors in form.errors.items():
+            messages.warning(
+                self.request, f"{form[field_name].label}: {' '.join(errors)}"
+            )
+        return HttpResponseRedirect(self.get_success_url())
+
+    def get_success_url(self):
+        return reverse("tasks:project-detail", kwargs={"slug": self.object.slug})
+
+
 class TaskCreateView(LoginRequiredMixin, CreateView):
     model = Task
     form_class = TaskForm
@@ -161,18 +179,20 @@ class TaskDetailView(LoginRequiredMixin, DetailView):
 
     def post(self, *args, **kwargs):
         action = self.request.POST.get("action")
-        task = Task.objects.get(slug=self.kwargs["slug"])
-        if action == "complete" and not task.is_completed:
-            task.is_completed = True
-            task.completed_by = self.request.user
-            task.save()
-        if action == "open" and task.is_completed:
-            task.is_completed = False
-            task.completed_by = None
-            task.save()
+        slug = self.kwargs["slug"]
+        tasks = Task.objects.filter(slug=slug)
+        message = None
+        if action == "complete" and not complete_tasks(tasks, self.request.user):
+            message = "Task is already completed"
+        if action == "open" and not reopen_tasks(tasks):
+            message = "Task is already open"
+        if message:
+            if not tasks.exists():
+                raise Http404("No task found matching the query")
+            messages.info(self.request, message)
 
         return HttpResponseRedirect(
-            reverse_lazy("tasks:task-detail", kwargs={"slug": task.slug})
+            reverse_lazy("tasks:task-detail", kwargs={"slug": slug})
         )
 
 
@@ -0,0 +1,7 @@
+from employees.widgets import AutocompleteWidget
+from tasks.models import TaskTag
+
+
+class TaskTagWidget(AutocompleteWidget):
+    queryset = TaskTag.objects.only("name").order_by("name", "pk")
+    search_fields = ["name__istartswith"]